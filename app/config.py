@@ -4,6 +4,8 @@ Application configuration via environment variables.
 All settings can be overridden with a ``.env`` file in the project root.
 """
 
+from typing import Dict, List
+
 from pydantic_settings import BaseSettings
 
 
@@ -11,6 +13,14 @@ class Settings(BaseSettings):
     # ── Browser ──
     chrome_version: int = 0  # 0 = auto-detect installed Chrome version
     headless: bool = False
+    # Keep one pre-patched chromedriver per Chrome version in
+    # CACHE_DIR/chromedriver/ and reuse it for every launch.
+    chromedriver_cache_enabled: bool = True
+    # Block images / fonts / video / trackers via DevTools. Per-scraper
+    # profiles ("soundcharts", "ticketmaster", "engagement") can be
+    # replaced with a JSON object of URL pattern lists.
+    resource_blocking_enabled: bool = False
+    resource_block_profiles: Dict[str, List[str]] = {}
 
     # ── Proxy (Ticketmaster only) ──
     # Format: ip:port:username:password  (authenticated)
@@ -19,6 +29,49 @@ class Settings(BaseSettings):
     tm_proxy: str = ""
     proxy_list_file: str = "proxy_list.txt"
     default_max_proxy_tests: int = 40
+    # Optional comma-separated proxies, one per Ticketmaster worker
+    # (falls back to ``tm_proxy`` when empty).
+    tm_worker_proxies: str = ""
+    # Scored proxy pool (health-checked candidates from proxy_list_file)
+    tm_use_proxy_pool: bool = False
+    proxy_check_concurrency: int = 20
+    proxy_check_timeout_seconds: int = 10
+    proxy_refresh_minutes: int = 30
+    proxy_max_age_minutes: int = 60
+
+    # ── Ticketmaster parallelism ──
+    ticketmaster_workers: int = 1
+    ticketmaster_worker_memory_mb: int = 700  # budget per Chrome instance
+    # Incremental refresh: stop loading at already-known events and only
+    # re-parse new / changed ones; full reload every N hours finds removals.
+    tm_incremental_refresh: bool = False
+    tm_full_refresh_hours: int = 168
+
+    # ── Engagement (TrendHero / SocialCat) ──
+    # Opt-in: keep one browser across usernames; restart on crashes / repeated
+    # failures and recycle after N lookups.
+    engagement_reuse_session: bool = False
+    engagement_driver_max_uses: int = 10
+    # Query TrendHero and SocialCat in parallel browsers; first ER wins.
+    engagement_race_providers: bool = False
+    # Per-provider circuit breaker: open after N consecutive failures,
+    # probe again (half-open) after the reset timeout.
+    engagement_breaker_failure_threshold: int = 3
+    engagement_breaker_reset_seconds: int = 600
+    # Parallel engagement workers (each with its own browser). With virtual
+    # displays, each worker gets an Xvfb display and runs headed Chrome,
+    # so engagement also works in display-less containers.
+    engagement_workers: int = 1
+    engagement_virtual_displays: bool = False
+    xvfb_base_display: int = 99
+    # Serve ERs fetched within this many hours from the local cache (0 = off).
+    engagement_cache_ttl_hours: int = 336
+    # speech_recognition backend for reCAPTCHA audio: "google" (online),
+    # or an offline one such as "sphinx" / "whisper" / "vosk" if installed.
+    captcha_recognizer: str = "google"
+    # IG handles learned from Soundcharts younger than this skip the
+    # profile-page IG link lookup.
+    ig_handle_max_age_days: int = 30
 
     # ── Soundcharts credentials ──
     mail_address: str = ""
@@ -30,11 +83,39 @@ class Settings(BaseSettings):
 
     # ── OpenAI ──
     openai_api_key: str = ""
+    openai_model: str = "gpt-4o"
+    openai_max_concurrency: int = 4
+    openai_timeout_seconds: int = 120
+    # Cached answers per (model, prompt version, kind, artist).
+    openai_cache_ttl_hours: int = 720
+    openai_cache_max_entries: int = 5000
+    # Alternative API endpoint (e.g. a local stand-in server for tests).
+    openai_base_url: str = ""
+    # Jobs with at least this many artists use the Batch API for tour links
+    # and venue types (0 = never).
+    openai_batch_threshold: int = 0
+    openai_batch_poll_seconds: int = 30
+    # Batches still running after this are cancelled; leftovers go interactive.
+    openai_batch_max_wait_minutes: int = 60
+
+    # ── Venue catalog (venue type from Ticketmaster venues) ──
+    # Seed venue → capacity / class table; venues seen in scrapes are
+    # learned into CACHE_DIR. Unknown venues are looked up with OpenAI.
+    venue_catalog_file: str = "venue_catalog.json"
+    venue_openai_lookup: bool = True
 
     # ── Google Sheets (soundchart_live mode) ──
     sheet_id: str = ""
     worksheet_name: str = "Sheet1"
     google_sa_json: str = ""
+    # Background sync for jobs created with auto_sync_sheet: artists per
+    # upsert, pause between upserts (Sheets allows ~60 requests/min per
+    # service account), and retries with exponential backoff on quota or
+    # server errors.
+    sheet_sync_batch_size: int = 10
+    sheet_sync_min_interval_seconds: float = 10
+    sheet_sync_max_retries: int = 5
+    sheet_sync_backoff_seconds: float = 15
 
     # ── API ──
     api_host: str = "0.0.0.0"
@@ -47,6 +128,9 @@ class Settings(BaseSettings):
     stale_running_job_minutes: int = 20
     ticketmaster_page_load_timeout_seconds: int = 60
 
+    # ── Local persistence (caches, learned lookup tables) ──
+    cache_dir: str = ".cache"
+
     model_config = {"env_file": ".env", "extra": "ignore"}
 
 
@@ -0,0 +1,156 @@
+"""
+Streaming exports of job results (CSV, NDJSON, Parquet).
+
+Rows are produced straight from the job's ``ArtistData`` list and written
+out in chunks of ``EXPORT_CHUNK_ROWS``, so the encoded file is never held
+in memory in one piece. The result list itself is not streamed: it is
+already in memory (a job loaded from Redis is read whole). Parquet needs
+the optional ``pyarrow`` package.
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List
+
+from .models import ArtistData, ConcertData, ExportFormat, ExportTable
+
+EXPORT_CHUNK_ROWS = 500
+
+_NESTED_FIELDS = {"concerts", "removed_concerts"}
+ARTIST_COLUMNS: List[str] = [
+    name for name in ArtistData.model_fields if name not in _NESTED_FIELDS
+] + ["concerts_count"]
+CONCERT_COLUMNS: List[str] = ["artist_name"] + list(ConcertData.model_fields)
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.PARQUET: "application/vnd.apache.parquet",
+}
+FILE_EXTENSIONS = {
+    ExportFormat.CSV: "csv",
+    ExportFormat.NDJSON: "ndjson",
+    ExportFormat.PARQUET: "parquet",
+}
+
+
+class ExportUnavailable(RuntimeError):
+    """Raised when an export format's optional dependency is missing."""
+
+
+def columns_for(table: ExportTable) -> List[str]:
+    return ARTIST_COLUMNS if table == ExportTable.ARTISTS else CONCERT_COLUMNS
+
+
+def iter_records(results: Iterable[ArtistData], table: ExportTable) -> Iterator[Dict]:
+    """Yield flat row dicts: one per artist, or one per concert."""
+    for artist in results:
+        if table == ExportTable.ARTISTS:
+            row = {name: getattr(artist, name) for name in ARTIST_COLUMNS[:-1]}
+            row["concerts_count"] = len(artist.concerts)
+            yield row
+        else:
+            for concert in artist.concerts:
+                yield {"artist_name": artist.artist_name, **concert.model_dump()}
+
+
+def _chunks(records: Iterator[Dict], size: int = EXPORT_CHUNK_ROWS) -> Iterator[List[Dict]]:
+    chunk: List[Dict] = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_csv(results: Iterable[ArtistData], table: ExportTable) -> Iterator[bytes]:
+    columns = columns_for(table)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for chunk in _chunks(iter_records(results, table)):
+        writer.writerows(chunk)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def stream_ndjson(results: Iterable[ArtistData], table: ExportTable) -> Iterator[bytes]:
+    for chunk in _chunks(iter_records(results, table)):
+        yield "".join(
+            json.dumps(record, ensure_ascii=False) + "\n" for record in chunk
+        ).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file object whose written bytes are drained per chunk."""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._parts.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data, self._parts = b"".join(self._parts), []
+        return data
+
+
+def _parquet_schema(table: ExportTable):
+    import pyarrow as pa
+
+    types = {"concerts_count": pa.int64(), "venue_capacity": pa.int64()}
+    types.update({name: pa.bool_() for name in ("added", "removed")})
+    return pa.schema([(name, types.get(name, pa.string())) for name in columns_for(table)])
+
+
+def stream_parquet(results: Iterable[ArtistData], table: ExportTable) -> Iterator[bytes]:
+    """Write one Parquet row group per chunk and yield the bytes as they come."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ExportUnavailable("Parquet export requires the 'pyarrow' package") from exc
+
+    schema = _parquet_schema(table)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+    try:
+        for chunk in _chunks(iter_records(results, table)):
+            writer.write_batch(pa.RecordBatch.from_pylist(chunk, schema=schema))
+            data = sink.drain()
+            if data:
+                yield data
+    finally:
+        writer.close()
+    data = sink.drain()
+    if data:
+        yield data
+
+
+def stream_export(
+    results: Iterable[ArtistData], table: ExportTable, fmt: ExportFormat
+) -> Iterator[bytes]:
+    """Return a byte-chunk iterator for *results* in *fmt*.
+
+    Raises :class:`ExportUnavailable` up front when the format can't be
+    produced, so callers can answer with an error before streaming starts.
+    """
+    if fmt == ExportFormat.PARQUET:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise ExportUnavailable("Parquet export requires the 'pyarrow' package") from exc
+        return stream_parquet(results, table)
+    if fmt == ExportFormat.NDJSON:
+        return stream_ndjson(results, table)
+    return stream_csv(results, table)
@@ -0,0 +1,74 @@
+"""
+Learned artist → Instagram handle lookup.
+
+Soundcharts reveals each artist's real IG handle while scraping; those are
+recorded here (``.cache/ig_handles.json``) so later jobs can resolve handles
+without another page load, even when the Soundcharts phase is skipped or
+fails. A small seed table covers well-known artists with unusual handles.
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from typing import Optional
+
+from .storage import JsonStore, cache_path
+
+IG_HANDLES_FILE = "ig_handles.json"
+
+# Handles that don't follow from the display name.
+SEED_HANDLES = {
+    "beyonce": "beyonce",
+    "justin bieber": "justinbieber",
+    "ariana grande": "arianagrande",
+    "taylor swift": "taylorswift",
+    "ed sheeran": "teddysphotos",
+    "the weeknd": "theweeknd",
+    "drake": "champagnepapi",
+    "adele": "adele",
+    "bruno mars": "brunomars",
+}
+
+_store: Optional[JsonStore] = None
+_store_lock = threading.Lock()
+
+
+def _get_store() -> JsonStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = JsonStore(cache_path(IG_HANDLES_FILE))
+        return _store
+
+
+def artist_key(artist_name: str) -> str:
+    """Normalize a display name: lower-case, accents stripped, spaces collapsed."""
+    normalized = unicodedata.normalize("NFD", artist_name.strip().lower())
+    stripped = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    return re.sub(r"\s+", " ", stripped)
+
+
+def remember(artist_name: str, handle: str, source: str = "soundcharts") -> None:
+    """Record *handle* as the IG account for *artist_name*."""
+    handle = handle.strip().lstrip("@")
+    if not artist_name.strip() or not handle:
+        return
+    _get_store().set(
+        artist_key(artist_name),
+        {"handle": handle, "source": source, "ts": time.time()},
+    )
+
+
+def lookup(artist_name: str, max_age_days: Optional[float] = None) -> Optional[str]:
+    """Return a learned or seeded handle, or ``None`` if unknown.
+
+    With *max_age_days*, learned handles older than that are ignored (seed
+    handles never expire).
+    """
+    key = artist_key(artist_name)
+    entry = _get_store().get(key)
+    if entry and entry.get("handle"):
+        if max_age_days is None or time.time() - entry.get("ts", 0) <= max_age_days * 86400:
+            return entry["handle"]
+    return SEED_HANDLES.get(key)
@@ -6,10 +6,13 @@ Each scrape request runs in its own daemon thread. Job state is stored in:
     - Redis (optional) for cross-instance reads in production
 
 Pipeline per artist:
-    1. Soundcharts login -> search -> extract followers, genre, IG username
-    2. (optional) TrendHero engagement rate via undetected Chrome + CAPTCHA
-    3. (optional) Tour link via OpenAI web search
-    4. (optional) Venue type via OpenAI web search
+    1. (optional) Soundcharts login -> search -> extract followers, genre,
+       IG username (learned handles are reused if this phase is skipped/fails)
+    2. (optional) Tour link from the Soundcharts website, else OpenAI web search
+    3. (optional) TrendHero engagement rate via undetected Chrome + CAPTCHA
+    4. (optional) Ticketmaster concerts via undetected Chrome
+    5. (optional) Venue type from the venue catalog (Ticketmaster venues),
+       with OpenAI web search for unknown venues / artists without listings
 """
 
 import json
@@ -17,10 +20,10 @@ import logging
 import threading
 import uuid
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .config import settings
-from .models import ArtistData, ConcertData, JobProgress, JobStatus
+from .models import ArtistData, ConcertData, JobProgress, JobStatus, SheetSyncStatus
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +44,9 @@ class Job:
         include_tour_link: bool,
         include_venue_type: bool,
         include_ticketmaster: bool,
+        force_refresh_engagement: bool = False,
+        include_soundcharts: bool = True,
+        auto_sync_sheet: bool = False,
     ):
         self.job_id = job_id
         self.artists = artists
@@ -50,6 +56,9 @@ class Job:
         self.include_tour_link = include_tour_link
         self.include_venue_type = include_venue_type
         self.include_ticketmaster = include_ticketmaster
+        self.force_refresh_engagement = force_refresh_engagement
+        self.include_soundcharts = include_soundcharts
+        self.auto_sync_sheet = auto_sync_sheet
 
         self.status: JobStatus = JobStatus.QUEUED
         self.created_at: datetime = datetime.now(timezone.utc)
@@ -57,6 +66,11 @@ class Job:
         self.progress: JobProgress = JobProgress(total_artists=len(artists))
         self.result: List[ArtistData] = []
         self.error: Optional[str] = None
+        self.sheet_sync: Optional[SheetSyncStatus] = (
+            SheetSyncStatus() if auto_sync_sheet else None
+        )
+        # Last row submitted for the sheet sync, per artist (JSON).
+        self.sheet_rows: Dict[str, str] = {}
 
 
 class JobManager:
@@ -66,6 +80,7 @@ class JobManager:
         self._jobs: Dict[str, Job] = {}
         self._lock = threading.Lock()
         self._redis = self._init_redis()
+        self._sheet_sync_queue = None
 
     def _init_redis(self):
         if not settings.redis_url:
@@ -93,6 +108,7 @@ class JobManager:
             "progress": job.progress.model_dump(),
             "result": [item.model_dump() for item in job.result],
             "error": job.error,
+            "sheet_sync": job.sheet_sync.model_dump(mode="json") if job.sheet_sync else None,
             "meta": {
                 "artists": job.artists,
                 "ticketmaster_country_map": job.ticketmaster_country_map,
@@ -101,6 +117,9 @@ class JobManager:
                 "include_tour_link": job.include_tour_link,
                 "include_venue_type": job.include_venue_type,
                 "include_ticketmaster": job.include_ticketmaster,
+                "force_refresh_engagement": job.force_refresh_engagement,
+                "include_soundcharts": job.include_soundcharts,
+                "auto_sync_sheet": job.auto_sync_sheet,
             },
         }
 
@@ -115,6 +134,9 @@ class JobManager:
             include_tour_link=bool(meta.get("include_tour_link", True)),
             include_venue_type=bool(meta.get("include_venue_type", True)),
             include_ticketmaster=bool(meta.get("include_ticketmaster", True)),
+            force_refresh_engagement=bool(meta.get("force_refresh_engagement", False)),
+            include_soundcharts=bool(meta.get("include_soundcharts", True)),
+            auto_sync_sheet=bool(meta.get("auto_sync_sheet", False)),
         )
         job.status = JobStatus(payload.get("status", JobStatus.QUEUED.value))
         created_at = payload.get("created_at")
@@ -126,6 +148,8 @@ class JobManager:
         job.progress = JobProgress(**(payload.get("progress") or {}))
         job.result = [ArtistData(**item) for item in (payload.get("result") or [])]
         job.error = payload.get("error")
+        if payload.get("sheet_sync"):
+            job.sheet_sync = SheetSyncStatus(**payload["sheet_sync"])
         return job
 
     def _persist_job(self, job: Job) -> None:
@@ -212,12 +236,16 @@ class JobManager:
         include_tour_link: bool = True,
         include_venue_type: bool = True,
         include_ticketmaster: bool = True,
+        force_refresh_engagement: bool = False,
+        include_soundcharts: bool = True,
+        auto_sync_sheet: bool = False,
     ) -> str:
         job_id = uuid.uuid4().hex[:8]
         job = Job(
             job_id, artists, ticketmaster_country_map or {}, skip_existing,
             include_engagement, include_tour_link, include_venue_type,
-            include_ticketmaster,
+            include_ticketmaster, force_refresh_engagement, include_soundcharts,
+            auto_sync_sheet,
         )
         with self._lock:
             active_jobs = sum(
@@ -258,6 +286,8 @@ class JobManager:
     def delete(self, job_id: str) -> bool:
         with self._lock:
             deleted_local = self._jobs.pop(job_id, None) is not None
+        if self._sheet_sync_queue:
+            self._sheet_sync_queue.forget(job_id)
 
         deleted_redis = False
         if self._redis:
@@ -276,101 +306,292 @@ class JobManager:
         job.updated_at = datetime.now(timezone.utc)
         self._persist_job(job)
 
+    # ── Background sheet sync ────────────────────────────────────────────
+
+    def _touch_sheet_sync(self, job_id: str) -> None:
+        job = self._jobs.get(job_id)
+        if job:
+            self._touch(job)
+
+    def _sync_sheet(self, job: Job, entries: List[dict]) -> None:
+        """Queue the rows of *entries* changed since they were last queued."""
+        if not job.auto_sync_sheet or not entries:
+            return
+        changed = {}
+        for entry in entries:
+            row = json.dumps(entry, sort_keys=True, default=str)
+            if job.sheet_rows.get(entry["artist_name"]) != row:
+                changed[entry["artist_name"]] = (entry, row)
+        if not changed:
+            return
+        with self._lock:
+            if self._sheet_sync_queue is None:
+                from .sheet_sync import SheetSyncQueue
+
+                self._sheet_sync_queue = SheetSyncQueue(on_update=self._touch_sheet_sync)
+        try:
+            artists = [ArtistData(**entry) for entry, _ in changed.values()]
+        except Exception as exc:
+            logger.warning("Job %s: could not snapshot rows for sheet sync: %s", job.job_id, exc)
+            return
+        self._sheet_sync_queue.submit(job.job_id, job.sheet_sync, artists)
+        job.sheet_rows.update((name, row) for name, (_, row) in changed.items())
+
     # ── Worker ───────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _new_entry(
+        job: Job,
+        artist: str,
+        ig_username: str,
+        follower_data: Optional[dict] = None,
+        sc_url: str = "",
+    ) -> dict:
+        follower_data = follower_data or {}
+        return {
+            "artist_name": artist,
+            "tm_country": (job.ticketmaster_country_map.get(artist) or "").upper(),
+            "genre": follower_data.get("genre", ""),
+            "tiktok_followers": follower_data.get("tiktok_followers", ""),
+            "spotify_followers": follower_data.get("spotify_followers", ""),
+            "instagram_followers": follower_data.get("instagram_followers", ""),
+            "bandsintown_followers": follower_data.get("bandsintown_followers", ""),
+            "ig_username": ig_username,
+            "ig_engagement_rate": "",
+            "tour_link": "",
+            "venue_type": "",
+            "soundcharts_url": sc_url,
+        }
+
+    def _run_soundcharts(self, job: Job, collected: List[dict]) -> None:
+        """Phase 1: followers, genre and IG handle per artist from Soundcharts.
+
+        Handles found are recorded in the learned handle store; a recently
+        learned handle skips the IG link lookup on the profile page.
+        """
+        from . import ig_handles
+        from .scrapers.soundcharts import SoundchartsScraper
+        import time
+
+        with SoundchartsScraper(
+            email=settings.mail_address,
+            password=settings.mail_password,
+            headless=settings.headless,
+        ) as sc:
+            if not sc.login():
+                raise RuntimeError("Soundcharts login failed")
+
+            time.sleep(3)
+
+            for idx, artist in enumerate(job.artists):
+                job.progress.current_artist = artist
+                job.progress.current_step = f"soundcharts: {artist}"
+                self._touch(job)
+
+                logger.info("[%d/%d] %s", idx + 1, len(job.artists), artist)
+                known = ig_handles.lookup(
+                    artist, max_age_days=settings.ig_handle_max_age_days
+                )
+                follower_data, ig_username, sc_url, website = sc.process_artist(
+                    artist, known_ig_username=known
+                )
+                if ig_username and ig_username != known:
+                    ig_handles.remember(artist, ig_username)
+                elif not ig_username:
+                    ig_username = ig_handles.lookup(artist)
+
+                entry = self._new_entry(job, artist, ig_username or "", follower_data, sc_url)
+                entry["website"] = website or ""
+                collected.append(entry)
+                self._sync_sheet(job, [entry])
+                job.progress.completed_artists = idx + 1
+                self._touch(job)
+                time.sleep(2)
+
+    def _run_venue_types(
+        self,
+        job: Job,
+        collected: List[dict],
+        prefetched: Dict[str, Dict[str, Optional[str]]],
+    ) -> None:
+        """Phase 5: venue type per artist from their Ticketmaster venues.
+
+        Concerts get ``venue_capacity`` / ``venue_class`` from the venue
+        catalog and the artist's most common class becomes ``venue_type``.
+        Venues missing from the catalog are looked up with OpenAI (and
+        learned), keeping the class guessed from the venue name when there
+        is no answer; artists with no classifiable venue fall back to the
+        artist-level OpenAI question.
+        """
+        from .venue_catalog import (
+            annotate_concerts,
+            get_venue_catalog,
+            normalize_venue_class,
+            parse_venue_answer,
+            venue_label,
+            venue_type_for_concerts,
+        )
+
+        catalog = get_venue_catalog()
+        api_key = settings.openai_api_key
+        unknown: Dict[str, Tuple[str, str, str]] = {}
+        for entry in collected:
+            unknown.update(annotate_concerts(entry.get("concerts") or [], catalog))
+
+        if unknown and api_key and settings.venue_openai_lookup:
+            from .scrapers.openai_tools import get_venue_classes, prefetch_batch
+
+            labels = list(unknown)
+            venue_prefetched = None
+            if settings.openai_batch_threshold and len(labels) >= settings.openai_batch_threshold:
+                venue_prefetched = prefetch_batch(
+                    {"venue_class": labels}, api_key, heartbeat=lambda _: self._touch(job)
+                ).get("venue_class")
+            answers = get_venue_classes(labels, api_key, venue_prefetched)
+            for label, text in answers.items():
+                cls, capacity = parse_venue_answer(text)
+                venue, city, state = unknown[label]
+                catalog.learn(venue, cls, capacity, source="openai", city=city, state=state)
+            for entry in collected:
+                annotate_concerts(
+                    [c for c in entry.get("concerts") or [] if venue_label(c) in unknown],
+                    catalog,
+                    observe=False,
+                )
+        catalog.flush()
+
+        misses = []
+        for entry in collected:
+            venue_type = venue_type_for_concerts(entry.get("concerts") or [])
+            if venue_type:
+                entry["venue_type"] = venue_type
+            else:
+                misses.append(entry["artist_name"])
+        logger.info(
+            "Job %s: %d venue type(s) from Ticketmaster venues (%d unknown venue(s)), "
+            "%d via OpenAI",
+            job.job_id, len(collected) - len(misses), len(unknown), len(misses),
+        )
+
+        if misses and api_key:
+            from .scrapers.openai_tools import get_venue_types
+
+            venue_types = get_venue_types(misses, api_key, prefetched.get("venue_type"))
+            for entry in collected:
+                vt = venue_types.get(entry["artist_name"])
+                if vt and not entry["venue_type"]:
+                    entry["venue_type"] = normalize_venue_class(vt) or vt
+
     def _run(self, job_id: str):
         job = self._jobs[job_id]
         job.status = JobStatus.RUNNING
         self._touch(job)
 
         try:
-            from .scrapers.soundcharts import SoundchartsScraper
+            from . import ig_handles
 
-            if not settings.mail_address or not settings.mail_password:
-                raise RuntimeError(
-                    "MAIL_ADDRESS / MAIL_PASSWORD not set in .env"
-                )
+            collected: List[dict] = []  # raw dicts per artist
 
             # ── Phase 1: Soundcharts (headless Chrome) ──
-            job.progress.current_step = "soundcharts"
+            if job.include_soundcharts:
+                if not settings.mail_address or not settings.mail_password:
+                    raise RuntimeError(
+                        "MAIL_ADDRESS / MAIL_PASSWORD not set in .env"
+                    )
+                job.progress.current_step = "soundcharts"
+                self._touch(job)
+                try:
+                    self._run_soundcharts(job, collected)
+                except Exception as sc_exc:
+                    logger.warning(
+                        "Job %s: soundcharts phase failed (results so far preserved): %s",
+                        job_id, sc_exc,
+                    )
+
+            # Artists Soundcharts didn't cover still get a row, with any
+            # IG handle learned on earlier runs so engagement can proceed.
+            by_name = {e["artist_name"]: e for e in collected}
+            collected = [
+                by_name.get(artist)
+                or self._new_entry(job, artist, ig_handles.lookup(artist) or "")
+                for artist in job.artists
+            ]
+            job.progress.completed_artists = len(collected)
             self._touch(job)
-            collected: List[dict] = []  # raw dicts per artist
+            if not job.include_soundcharts:
+                self._sync_sheet(job, collected)
 
-            with SoundchartsScraper(
-                email=settings.mail_address,
-                password=settings.mail_password,
-                headless=settings.headless,
-            ) as sc:
-                if not sc.login():
-                    raise RuntimeError("Soundcharts login failed")
+            # ── Phase 2: Tour links (Soundcharts website, else OpenAI) ──
+            names = [entry["artist_name"] for entry in collected]
+            if job.include_tour_link:
+                from .scrapers.openai_tools import _extract_domain
 
-                import time
-                time.sleep(3)
-
-                for idx, artist in enumerate(job.artists):
-                    job.progress.current_artist = artist
-                    job.progress.current_step = f"soundcharts: {artist}"
-                    self._touch(job)
-
-                    logger.info("[%d/%d] %s", idx + 1, len(job.artists), artist)
-                    follower_data, ig_username, sc_url = sc.process_artist(artist)
-
-                    entry = {
-                        "artist_name": artist,
-                        "tm_country": (job.ticketmaster_country_map.get(artist) or "").upper(),
-                        "genre": follower_data.get("genre", ""),
-                        "tiktok_followers": follower_data.get("tiktok_followers", ""),
-                        "spotify_followers": follower_data.get("spotify_followers", ""),
-                        "instagram_followers": follower_data.get("instagram_followers", ""),
-                        "bandsintown_followers": follower_data.get("bandsintown_followers", ""),
-                        "ig_username": ig_username or "",
-                        "ig_engagement_rate": "",
-                        "tour_link": "",
-                        "venue_type": "",
-                        "soundcharts_url": sc_url,
-                    }
-                    collected.append(entry)
-                    job.progress.completed_artists = idx + 1
-                    self._touch(job)
-                    time.sleep(2)
-
-            # ── Phase 2: Tour links (OpenAI, no browser) ──
-            if job.include_tour_link and settings.openai_api_key:
-                from .scrapers.openai_tools import get_tour_link
-                import time
+                # The website listed on the Soundcharts profile is free;
+                # only artists without one need an OpenAI search.
+                for entry in collected:
+                    domain = _extract_domain(entry.get("website") or "")
+                    if "." in domain:
+                        entry["tour_link"] = domain
+            tour_link_misses = [e["artist_name"] for e in collected if not e["tour_link"]]
+
+            openai_requests: Dict[str, List[str]] = {}
+            if job.include_tour_link and tour_link_misses:
+                openai_requests["tour_link"] = tour_link_misses
+            if job.include_venue_type and not job.include_ticketmaster:
+                # Without Ticketmaster venues, venue type is an artist-level
+                # OpenAI question for everyone.
+                openai_requests["venue_type"] = names
+            prefetched: Dict[str, Dict[str, Optional[str]]] = {}
+            if (
+                openai_requests
+                and settings.openai_api_key
+                and settings.openai_batch_threshold
+                and len(names) >= settings.openai_batch_threshold
+            ):
+                from .scrapers.openai_tools import prefetch_batch
+
+                # One Batch API run for both OpenAI phases of a large job.
+                job.progress.current_step = "openai_batch"
+                self._touch(job)
+                # The heartbeat keeps updated_at fresh while the batch runs,
+                # so the job isn't mistaken for a stale orphan.
+                prefetched = prefetch_batch(
+                    openai_requests, settings.openai_api_key,
+                    heartbeat=lambda _: self._touch(job),
+                )
+
+            if job.include_tour_link and tour_link_misses and settings.openai_api_key:
+                from .scrapers.openai_tools import get_tour_links
 
                 job.progress.current_step = "tour_links"
                 self._touch(job)
+                logger.info(
+                    "Job %s: %d tour link(s) from Soundcharts, %d via OpenAI",
+                    job_id, len(names) - len(tour_link_misses), len(tour_link_misses),
+                )
 
+                links = get_tour_links(
+                    tour_link_misses, settings.openai_api_key, prefetched.get("tour_link")
+                )
                 for entry in collected:
-                    name = entry["artist_name"]
-                    job.progress.current_artist = name
-                    self._touch(job)
-                    link = get_tour_link(name, settings.openai_api_key)
-                    if link:
+                    link = links.get(entry["artist_name"])
+                    if link and not entry["tour_link"]:
                         entry["tour_link"] = link
-                    time.sleep(1)
 
-            # ── Phase 3: Venue types (OpenAI, no browser) ──
-            if job.include_venue_type and settings.openai_api_key:
-                from .scrapers.openai_tools import get_venue_type
-                import time
+            self._sync_sheet(job, collected)
 
-                job.progress.current_step = "venue_types"
-                self._touch(job)
-
-                for entry in collected:
-                    name = entry["artist_name"]
-                    job.progress.current_artist = name
-                    self._touch(job)
-                    vt = get_venue_type(name, settings.openai_api_key)
-                    if vt:
-                        entry["venue_type"] = vt
-                    time.sleep(1)
-
-            # ── Phase 4: Engagement rates (undetected Chrome + CAPTCHA) ──
+            # ── Phase 3: Engagement rates (undetected Chrome + CAPTCHA) ──
             if job.include_engagement:
-                if settings.headless and settings.disable_engagement_in_headless:
+                display_pool = None
+                if settings.engagement_virtual_displays:
+                    from .scrapers.display_pool import get_display_pool
+
+                    display_pool = get_display_pool()
+                if (
+                    settings.headless
+                    and settings.disable_engagement_in_headless
+                    and display_pool is None
+                ):
                     logger.warning(
                         "Job %s: skipping engagement phase because HEADLESS=true "
                         "and DISABLE_ENGAGEMENT_IN_HEADLESS=true",
@@ -394,6 +615,13 @@ class JobManager:
                                 list(ig_map.keys()),
                                 chrome_version=settings.chrome_version,
                                 headless=settings.headless,
+                                reuse_session=settings.engagement_reuse_session,
+                                max_driver_uses=settings.engagement_driver_max_uses,
+                                race_providers=settings.engagement_race_providers,
+                                cache_ttl_hours=settings.engagement_cache_ttl_hours,
+                                force_refresh=job.force_refresh_engagement,
+                                workers=settings.engagement_workers,
+                                display_pool=display_pool,
                             )
                             for username, er in er_results.items():
                                 if er:
@@ -404,7 +632,9 @@ class JobManager:
                                 job_id, er_exc,
                             )
 
-            # ── Phase 5: Ticketmaster concerts (undetected Chrome) ──
+            self._sync_sheet(job, collected)
+
+            # ── Phase 4: Ticketmaster concerts (undetected Chrome) ──
             if job.include_ticketmaster:
                 from .scrapers.ticketmaster import scrape_ticketmaster_concerts
                 import time
@@ -424,6 +654,13 @@ class JobManager:
                         artist_specs,
                         chrome_version=settings.chrome_version,
                         proxy_str=settings.tm_proxy or None,
+                        workers=settings.ticketmaster_workers,
+                        worker_proxies=[
+                            p.strip()
+                            for p in settings.tm_worker_proxies.split(",")
+                            if p.strip()
+                        ],
+                        incremental=settings.tm_incremental_refresh,
                     )
                     for entry in collected:
                         name = entry["artist_name"]
@@ -432,6 +669,10 @@ class JobManager:
                         entry["concerts"] = [
                             ConcertData(**c).model_dump() for c in concerts_raw
                         ]
+                        entry["removed_concerts"] = [
+                            ConcertData(**c).model_dump()
+                            for c in tm_data.get("removed_concerts", [])
+                        ]
                         entry["tm_profile_url"] = tm_data.get("tm_profile_url", "")
                         entry["first_presale_date"] = tm_data.get("first_presale_date", "")
                         entry["first_onsale_date"] = tm_data.get("first_onsale_date", "")
@@ -441,6 +682,22 @@ class JobManager:
                         job_id, tm_exc,
                     )
 
+            self._sync_sheet(job, collected)
+
+            # ── Phase 5: Venue types (venue catalog, OpenAI for unknowns) ──
+            if job.include_venue_type:
+                job.progress.current_step = "venue_types"
+                self._touch(job)
+                try:
+                    self._run_venue_types(job, collected, prefetched)
+                except Exception as vt_exc:
+                    logger.warning(
+                        "Job %s: venue type phase failed (results so far preserved): %s",
+                        job_id, vt_exc,
+                    )
+
+            self._sync_sheet(job, collected)
+
             # ── Finalize ──
             job.result = [ArtistData(**e) for e in collected]
             job.progress.current_artist = None
@@ -454,3 +711,6 @@ class JobManager:
             job.status = JobStatus.FAILED
             job.error = str(exc)
             self._touch(job)
+        finally:
+            if self._sheet_sync_queue:
+                self._sheet_sync_queue.finish(job_id)
@@ -17,21 +17,26 @@ from typing import List
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import settings
+from .exports import FILE_EXTENSIONS, MEDIA_TYPES, ExportUnavailable, stream_export
 from .jobs import JobManager
 from .models import (
     ArtistData,
+    ExportFormat,
+    ExportTable,
     HealthResponse,
     JobResponse,
+    SheetSyncMode,
     SheetSyncResponse,
     JobStatus,
+    ProviderBreakerState,
     ScrapeRequest,
     ScrapeStartResponse,
 )
-from .sheets import SheetSyncError, append_results, get_sheet_url
+from .sheets import SheetSyncError, append_results, get_sheet_url, upsert_results
 
 # ── Logging ──────────────────────────────────────────────────────────────────
 
@@ -54,7 +59,25 @@ async def lifespan(_app: FastAPI):
         settings.headless,
         settings.chrome_version,
     )
+    proxy_pool = None
+    if settings.tm_use_proxy_pool:
+        from .scrapers.proxy_pool import get_proxy_pool
+
+        proxy_pool = get_proxy_pool()
+        proxy_pool.start_refresher(
+            settings.proxy_refresh_minutes,
+            settings.proxy_list_file,
+            settings.default_max_proxy_tests,
+        )
     yield
+    if proxy_pool:
+        proxy_pool.stop_refresher()
+
+    from .scrapers.display_pool import shutdown_display_pool
+    from .scrapers.proxy_relay import shutdown_relays
+
+    shutdown_relays()
+    shutdown_display_pool()
 
 
 # ── App ──────────────────────────────────────────────────────────────────────
@@ -109,6 +132,18 @@ def health():
     )
 
 
+@app.get(
+    "/api/v1/engagement/providers",
+    response_model=List[ProviderBreakerState],
+    tags=["Health"],
+)
+def engagement_providers():
+    """Circuit-breaker state of each engagement-rate provider."""
+    from .scrapers.engagement import get_provider_breaker_states
+
+    return [ProviderBreakerState(**s) for s in get_provider_breaker_states()]
+
+
 @app.post("/api/v1/scrape", response_model=ScrapeStartResponse, tags=["Scrape"])
 def start_scrape(body: ScrapeRequest):
     """
@@ -124,6 +159,11 @@ def start_scrape(body: ScrapeRequest):
 
     Returns a ``job_id`` to poll via ``GET /api/v1/jobs/{job_id}``.
     """
+    if body.auto_sync_sheet and not (settings.sheet_id and settings.google_sa_json):
+        raise HTTPException(
+            status_code=400,
+            detail="auto_sync_sheet needs SHEET_ID and GOOGLE_SA_JSON to be configured",
+        )
     try:
         job_id = job_manager.create(
             artists=body.artists,
@@ -133,6 +173,9 @@ def start_scrape(body: ScrapeRequest):
             include_tour_link=body.include_tour_link,
             include_venue_type=body.include_venue_type,
             include_ticketmaster=body.include_ticketmaster,
+            force_refresh_engagement=body.force_refresh_engagement,
+            include_soundcharts=body.include_soundcharts,
+            auto_sync_sheet=body.auto_sync_sheet,
         )
     except RuntimeError as exc:
         raise HTTPException(status_code=409, detail=str(exc)) from exc
@@ -168,13 +211,48 @@ def delete_job(job_id: str):
     return {"detail": "deleted"}
 
 
+@app.get("/api/v1/jobs/{job_id}/export", tags=["Jobs"])
+def export_job(
+    job_id: str,
+    format: ExportFormat = ExportFormat.CSV,
+    table: ExportTable = ExportTable.ARTISTS,
+):
+    """Stream job results as CSV, NDJSON or Parquet.
+
+    ``table=artists`` gives one row per artist, ``table=concerts`` one row
+    per concert. Rows are encoded in chunks, so large jobs don't build one
+    big response body; the job's result list itself is loaded whole
+    (from memory or Redis) before streaming starts.
+    """
+    job = job_manager.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != JobStatus.COMPLETED:
+        raise HTTPException(status_code=409, detail="Job is not completed yet")
+    try:
+        body = stream_export(job.result, table, format)
+    except ExportUnavailable as exc:
+        raise HTTPException(status_code=501, detail=str(exc)) from exc
+    filename = f"{job_id}-{table.value}.{FILE_EXTENSIONS[format]}"
+    return StreamingResponse(
+        body,
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
 @app.post(
     "/api/v1/jobs/{job_id}/sync-sheet",
     response_model=SheetSyncResponse,
     tags=["Jobs"],
 )
-def sync_job_to_sheet(job_id: str):
-    """Append completed job results to configured Google Sheet."""
+def sync_job_to_sheet(job_id: str, mode: SheetSyncMode = SheetSyncMode.APPEND):
+    """Write completed job results to the configured Google Sheet.
+
+    ``mode=append`` adds rows and events worksheets every time;
+    ``mode=upsert`` updates artists already in the sheet in place, reuses
+    their events worksheets and appends only new artists.
+    """
     job = job_manager.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -185,13 +263,21 @@ def sync_job_to_sheet(job_id: str):
         )
 
     try:
-        rows_written = append_results(job.result, job_id=job_id)
+        if mode == SheetSyncMode.UPSERT:
+            rows_updated, rows_appended = upsert_results(job.result)
+        else:
+            rows_updated, rows_appended = 0, append_results(job.result, job_id=job_id)
+        rows_written = rows_updated + rows_appended
         return SheetSyncResponse(
             job_id=job_id,
+            mode=mode,
             rows_written=rows_written,
+            rows_updated=rows_updated,
+            rows_appended=rows_appended,
             sheet_url=get_sheet_url(),
             worksheet_name=settings.worksheet_name,
-            message=f"Synced {rows_written} row(s) to Google Sheet",
+            message=f"Synced {rows_written} row(s) to Google Sheet "
+            f"({rows_updated} updated, {rows_appended} appended)",
         )
     except SheetSyncError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
@@ -211,6 +297,7 @@ def _job_to_response(job) -> JobResponse:
         progress=job.progress,
         result=job.result if job.status == JobStatus.COMPLETED else None,
         error=job.error,
+        sheet_sync=job.sheet_sync,
     )
 
 
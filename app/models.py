@@ -19,6 +19,30 @@ class JobStatus(str, Enum):
     FAILED = "failed"
 
 
+class SheetSyncState(str, Enum):
+    PENDING = "pending"
+    SYNCING = "syncing"
+    RETRYING = "retrying"
+    SYNCED = "synced"
+    FAILED = "failed"
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+    PARQUET = "parquet"  # needs pyarrow
+
+
+class ExportTable(str, Enum):
+    ARTISTS = "artists"  # one row per artist (concerts counted, not nested)
+    CONCERTS = "concerts"  # one row per concert, with artist_name
+
+
+class SheetSyncMode(str, Enum):
+    APPEND = "append"  # always add rows and new events worksheets
+    UPSERT = "upsert"  # update existing artists in place, append new ones
+
+
 # ── Request ──
 
 
@@ -35,6 +59,11 @@ class ScrapeRequest(BaseModel):
     skip_existing: bool = Field(
         True, description="Skip artists that already have data"
     )
+    include_soundcharts: bool = Field(
+        True,
+        description="Fetch followers / genre / IG handle from Soundcharts "
+        "(when off, previously learned IG handles are used)",
+    )
     include_engagement: bool = Field(
         True, description="Fetch IG engagement rate from TrendHero"
     )
@@ -42,11 +71,21 @@ class ScrapeRequest(BaseModel):
         True, description="Fetch tour / website link via OpenAI"
     )
     include_venue_type: bool = Field(
-        True, description="Fetch venue type via OpenAI"
+        True,
+        description="Derive venue type from the artist's Ticketmaster venues "
+        "(OpenAI for unknown venues or artists without listings)",
     )
     include_ticketmaster: bool = Field(
         True, description="Fetch concert listings from Ticketmaster"
     )
+    force_refresh_engagement: bool = Field(
+        False, description="Ignore cached engagement rates and re-fetch them"
+    )
+    auto_sync_sheet: bool = Field(
+        False,
+        description="Upsert rows into the Google Sheet in the background "
+        "while the job runs (see sheet_sync in the job response)",
+    )
 
 
 # ── Data ──
@@ -64,6 +103,10 @@ class ConcertData(BaseModel):
     presale_date: str = ""
     onsale_date: str = ""
     event_url: str = ""
+    venue_capacity: Optional[int] = None  # from the venue catalog
+    venue_class: Optional[str] = None  # Club / Theater / Amphitheater / Arena / Stadium
+    added: bool = False  # new since the previous incremental refresh
+    removed: bool = False  # no longer listed on Ticketmaster
 
 
 class ArtistData(BaseModel):
@@ -82,6 +125,7 @@ class ArtistData(BaseModel):
     first_presale_date: str = ""
     first_onsale_date: str = ""
     concerts: List[ConcertData] = []
+    removed_concerts: List[ConcertData] = []
 
 
 class JobProgress(BaseModel):
@@ -91,6 +135,17 @@ class JobProgress(BaseModel):
     current_step: str = ""
 
 
+class SheetSyncStatus(BaseModel):
+    """Background sheet sync state of a job created with ``auto_sync_sheet``."""
+
+    state: SheetSyncState = SheetSyncState.PENDING
+    rows_synced: int = 0  # distinct artists written so far
+    pending_artists: int = 0
+    attempts: int = 0  # failed attempts of the current batch
+    last_synced_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
+
 # ── Response ──
 
 
@@ -108,16 +163,31 @@ class JobResponse(BaseModel):
     progress: JobProgress
     result: Optional[List[ArtistData]] = None
     error: Optional[str] = None
+    sheet_sync: Optional[SheetSyncStatus] = None
 
 
 class SheetSyncResponse(BaseModel):
     job_id: str
     sheet_url: str
+    mode: SheetSyncMode = SheetSyncMode.APPEND
     rows_written: int
+    rows_updated: int = 0
+    rows_appended: int = 0
     worksheet_name: str
     message: str
 
 
+class ProviderBreakerState(BaseModel):
+    name: str
+    state: str
+    consecutive_failures: int = 0
+    recent_calls: int = 0
+    recent_failure_rate: float = 0.0
+    opened_at: Optional[float] = None
+    last_failure_at: Optional[float] = None
+    last_success_at: Optional[float] = None
+
+
 class HealthResponse(BaseModel):
     status: str
     version: str
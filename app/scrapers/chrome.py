@@ -0,0 +1,252 @@
+"""
+Shared Chrome / undetected-chromedriver launch helpers.
+
+* ``detect_chrome_major`` runs the version probe once per process.
+* ``patched_driver_path`` keeps one patched chromedriver per Chrome major
+  version under ``.cache/chromedriver/<version>/``. A file lock covers the
+  download and patch, so concurrent launches (threads or processes) reuse
+  the same binary instead of re-patching it on every ``uc.Chrome(...)``.
+* ``launch_chrome`` starts uc with that binary. If the cache can't be used,
+  it falls back to uc's own patching, serialized by a process-wide lock.
+* ``apply_resource_blocking`` drops images, fonts, media and trackers via
+  DevTools ``Network.setBlockedURLs`` using a per-scraper profile.
+"""
+
+import logging
+import os
+import platform
+import re
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional
+
+import undetected_chromedriver as uc
+from undetected_chromedriver.patcher import Patcher
+
+from ..config import settings
+from ..storage import cache_path
+
+logger = logging.getLogger(__name__)
+
+CHROMEDRIVER_CACHE_DIR = "chromedriver"
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Fallback when no cached driver is available: uc patches its shared
+# chromedriver binary on launch, so concurrent launches must not overlap.
+_DRIVER_LAUNCH_LOCK = threading.Lock()
+_patch_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def detect_chrome_major() -> int:
+    """Return the major version of the locally-installed Chrome browser.
+
+    Tries (in order):
+    1. Windows registry (fastest, most reliable).
+    2. ``google-chrome --version`` on Linux / macOS.
+
+    Returns 0 if detection fails (let uc fall back to its own logic). The
+    result is cached for the lifetime of the process.
+    """
+    # --- Windows registry ---------------------------------------------------
+    if platform.system() == "Windows":
+        import winreg  # noqa: WPS433 (only on Windows)
+
+        for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+            for sub in (
+                r"SOFTWARE\Google\Chrome\BLBeacon",
+                r"SOFTWARE\WOW6432Node\Google\Chrome\BLBeacon",
+            ):
+                try:
+                    key = winreg.OpenKey(root, sub)
+                    ver, _ = winreg.QueryValueEx(key, "version")
+                    winreg.CloseKey(key)
+                    major = int(str(ver).split(".")[0])
+                    logger.info("Detected Chrome %s (major=%d) from registry", ver, major)
+                    return major
+                except (OSError, ValueError, IndexError):
+                    continue
+
+    # --- Linux / macOS CLI --------------------------------------------------
+    for cmd in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+        try:
+            out = subprocess.check_output([cmd, "--version"], stderr=subprocess.DEVNULL, text=True)
+            m = re.search(r"(\d+)", out)
+            if m:
+                major = int(m.group(1))
+                logger.info("Detected Chrome major=%d from `%s --version`", major, cmd)
+                return major
+        except (FileNotFoundError, subprocess.CalledProcessError):
+            continue
+
+    logger.warning("Could not detect Chrome version — letting uc auto-detect")
+    return 0
+
+
+# ── Patched driver cache ─────────────────────────────────────────────────────
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    """Hold an exclusive, cross-process lock on *path* (created if missing)."""
+    with open(path, "a+b") as fh:
+        if os.name == "nt":
+            fh.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10 s; keep waiting
+            try:
+                yield
+            finally:
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def patched_driver_path(version_main: int) -> Optional[str]:
+    """Return a patched chromedriver for *version_main*, building it once.
+
+    Returns ``None`` when the version is unknown or the download / patch
+    fails, in which case callers let uc patch its own copy.
+    """
+    if not version_main or not settings.chromedriver_cache_enabled:
+        return None
+    directory = cache_path(os.path.join(CHROMEDRIVER_CACHE_DIR, str(version_main)))
+    exe = os.path.join(directory, "chromedriver.exe" if os.name == "nt" else "chromedriver")
+    patcher = Patcher(executable_path=exe, version_main=version_main)
+    if patcher.is_binary_patched(exe):
+        return exe
+
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with _patch_lock, _file_lock(directory + ".lock"):
+            # Another thread or process may have finished while we waited.
+            if patcher.is_binary_patched(exe):
+                return exe
+            started = time.monotonic()
+            builder = Patcher(version_main=version_main)
+            builder.executable_path = exe
+            builder.zip_path = os.path.join(directory, "unpack")
+            builder.auto()
+            if not builder.is_binary_patched(exe):
+                raise RuntimeError("patched binary not found after build")
+            logger.info(
+                "Cached patched chromedriver %d in %.1fs → %s",
+                version_main, time.monotonic() - started, exe,
+            )
+            return exe
+    except Exception as exc:
+        logger.warning("Could not build cached chromedriver %d: %s", version_main, exc)
+        return None
+
+
+def launch_chrome(options: uc.ChromeOptions, version_main: int = 0, **kwargs) -> uc.Chrome:
+    """Start ``uc.Chrome`` using the cached patched driver when possible."""
+    version_main = version_main or detect_chrome_major()
+    if version_main:
+        kwargs["version_main"] = version_main
+    driver_path = patched_driver_path(version_main)
+    started = time.monotonic()
+    if driver_path:
+        driver = uc.Chrome(options=options, driver_executable_path=driver_path, **kwargs)
+    else:
+        with _DRIVER_LAUNCH_LOCK:
+            driver = uc.Chrome(options=options, **kwargs)
+    logger.info(
+        "Chrome %s launched in %.1fs (%s driver)",
+        version_main or "auto",
+        time.monotonic() - started,
+        "cached" if driver_path else "uc-patched",
+    )
+    return driver
+
+
+# ── Resource blocking ────────────────────────────────────────────────────────
+
+# Patterns match the whole URL; the trailing "*" also covers query strings.
+_IMAGES = ["*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico"]
+_FONTS = ["*.woff*", "*.ttf*", "*.otf", "*.eot"]
+_VIDEO = ["*.mp4*", "*.webm*", "*.m3u8*"]
+_TRACKERS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*segment.com*",
+    "*clarity.ms*",
+    "*intercom.io*",
+    "*fullstory.com*",
+    "*tiktok.com/i18n/pixel*",
+]
+
+# Blocked URL patterns per scraper. The engagement profile keeps images so
+# the reCAPTCHA widget renders normally; its audio challenge is not a
+# blocked extension.
+DEFAULT_RESOURCE_BLOCK_PROFILES: Dict[str, List[str]] = {
+    "soundcharts": _IMAGES + _FONTS + _VIDEO + _TRACKERS,
+    "ticketmaster": _IMAGES + _FONTS + _VIDEO + _TRACKERS,
+    "engagement": _FONTS + _VIDEO + _TRACKERS,
+}
+
+
+def resource_block_patterns(profile: str) -> List[str]:
+    """Return the URL patterns for *profile* (``RESOURCE_BLOCK_PROFILES`` wins)."""
+    overrides = settings.resource_block_profiles
+    if profile in overrides:
+        return list(overrides[profile])
+    return list(DEFAULT_RESOURCE_BLOCK_PROFILES.get(profile, []))
+
+
+def apply_resource_blocking(driver, profile: str) -> bool:
+    """Block the *profile*'s URL patterns in *driver*; returns True if applied."""
+    if not settings.resource_blocking_enabled:
+        return False
+    patterns = resource_block_patterns(profile)
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as exc:
+        logger.warning("Could not enable resource blocking (%s): %s", profile, exc)
+        return False
+    logger.info("Resource blocking on for %s (%d patterns)", profile, len(patterns))
+    return True
+
+
+def page_load_stats(driver) -> Dict[str, float]:
+    """Return bytes transferred and load timings for the current page.
+
+    Uses the Resource Timing API, so cross-origin resources without
+    ``Timing-Allow-Origin`` count as 0 bytes.
+    """
+    return driver.execute_script(
+        """
+        const nav = performance.getEntriesByType('navigation')[0] || {};
+        const res = performance.getEntriesByType('resource');
+        const bytes = res.reduce((n, r) => n + (r.transferSize || 0), nav.transferSize || 0);
+        return {
+            transfer_bytes: bytes,
+            resources: res.length,
+            dom_content_loaded_ms: nav.domContentLoadedEventEnd || 0,
+            load_ms: nav.loadEventEnd || 0,
+        };
+        """
+    ) or {}
@@ -0,0 +1,105 @@
+"""
+Minimal thread-safe circuit breaker for flaky upstream providers.
+
+A breaker starts CLOSED. After ``failure_threshold`` consecutive failures it
+OPENS and callers skip the provider. Once ``reset_timeout_seconds`` have
+passed it goes HALF_OPEN and lets a single probe through: success closes it
+again, failure re-opens it.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Track recent outcomes for one provider and gate calls to it."""
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout_seconds: float = 600,
+        window: int = 20,
+    ):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.reset_timeout_seconds = max(0.0, float(reset_timeout_seconds))
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._recent: deque = deque(maxlen=max(1, int(window)))
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+        self._last_failure_at: Optional[float] = None
+        self._last_success_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state
+
+    def allow(self) -> bool:
+        """Return True if a call may go to the provider right now."""
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN:
+                if time.time() - (self._opened_at or 0) < self.reset_timeout_seconds:
+                    return False
+                self._state = HALF_OPEN
+                self._probe_in_flight = False
+            # HALF_OPEN: admit exactly one probe at a time.
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._recent.append(True)
+            self._consecutive_failures = 0
+            self._last_success_at = time.time()
+            self._state = CLOSED
+            self._opened_at = None
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._recent.append(False)
+            self._consecutive_failures += 1
+            self._last_failure_at = time.time()
+            self._probe_in_flight = False
+            if (
+                self._state == HALF_OPEN
+                or self._consecutive_failures >= self.failure_threshold
+            ):
+                self._state = OPEN
+                self._opened_at = time.time()
+
+    def release(self) -> None:
+        """Give back an admitted call that ended without a verdict (e.g. cancelled)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> Dict:
+        """Return the breaker state for monitoring."""
+        with self._lock:
+            failures = sum(1 for ok in self._recent if not ok)
+            return {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "recent_calls": len(self._recent),
+                "recent_failure_rate": (
+                    round(failures / len(self._recent), 3) if self._recent else 0.0
+                ),
+                "opened_at": self._opened_at,
+                "last_failure_at": self._last_failure_at,
+                "last_success_at": self._last_success_at,
+            }
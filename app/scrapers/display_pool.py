@@ -0,0 +1,177 @@
+"""
+Pool of virtual X displays (Xvfb) for headed browsers on display-less hosts.
+
+The engagement phase needs a real (headed) Chrome to get through reCAPTCHA,
+which is impossible in containers without an X server. This pool starts up
+to ``size`` Xvfb servers on demand, leases one display per engagement
+worker, restarts servers that died (or replaces them with a new display
+number when they can't be restarted), and stops them all on shutdown.
+"""
+
+import atexit
+import logging
+import os
+import platform
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+XVFB_SCREEN = "1920x1080x24"
+XVFB_START_TIMEOUT_SECONDS = 10
+XVFB_MAX_DISPLAY_PROBES = 50
+_X11_SOCKET_DIR = "/tmp/.X11-unix"
+
+
+def _display_in_use(num: int) -> bool:
+    return os.path.exists(f"/tmp/.X{num}-lock") or os.path.exists(
+        os.path.join(_X11_SOCKET_DIR, f"X{num}")
+    )
+
+
+class DisplayPool:
+    """Lease Xvfb displays (``":N"``) to browser workers."""
+
+    def __init__(self, size: int, base_display: int = 99, xvfb_path: str = "Xvfb"):
+        self.size = max(1, int(size))
+        self.base_display = int(base_display)
+        self.xvfb_path = xvfb_path
+        self._lock = threading.Lock()
+        self._free: "queue.Queue[int]" = queue.Queue()
+        self._procs: Dict[int, subprocess.Popen] = {}
+        self._next_probe = self.base_display
+
+    # ── Xvfb processes ───────────────────────────────────────────────────
+
+    def _spawn(self, num: int) -> Optional[subprocess.Popen]:
+        proc = subprocess.Popen(
+            [self.xvfb_path, f":{num}", "-screen", "0", XVFB_SCREEN, "-nolisten", "tcp"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        socket_path = os.path.join(_X11_SOCKET_DIR, f"X{num}")
+        deadline = time.monotonic() + XVFB_START_TIMEOUT_SECONDS
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                return None
+            if os.path.exists(socket_path):
+                return proc
+            time.sleep(0.05)
+        proc.kill()
+        proc.wait()
+        return None
+
+    def _start_new(self) -> int:
+        """Start Xvfb on the next free display number (called under the lock)."""
+        for _ in range(XVFB_MAX_DISPLAY_PROBES):
+            num = self._next_probe
+            self._next_probe += 1
+            if _display_in_use(num):
+                continue
+            proc = self._spawn(num)
+            if proc:
+                self._procs[num] = proc
+                logger.info("Started Xvfb on :%d (%d/%d)", num, len(self._procs), self.size)
+                return num
+        raise RuntimeError("Could not start Xvfb on any free display")
+
+    def _ensure_alive(self, num: int) -> int:
+        """Return *num*, restarting its Xvfb if it died, else a fresh display."""
+        with self._lock:
+            proc = self._procs.get(num)
+            if proc and proc.poll() is None:
+                return num
+            logger.warning("Xvfb :%d exited; restarting", num)
+            proc = self._spawn(num)
+            if proc:
+                self._procs[num] = proc
+                return num
+            # Drop the dead display for good; its slot goes to a new number.
+            self._procs.pop(num, None)
+            logger.warning("Could not restart Xvfb on :%d; starting a new display", num)
+            return self._start_new()
+
+    # ── Leasing ──────────────────────────────────────────────────────────
+
+    def acquire(self, timeout: Optional[float] = None) -> str:
+        """Return a free display (``":N"``), starting Xvfb if below ``size``."""
+        try:
+            num = self._free.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                num = self._start_new() if len(self._procs) < self.size else None
+            if num is None:
+                try:
+                    num = self._free.get(timeout=timeout)
+                except queue.Empty:
+                    raise TimeoutError("No virtual display became free") from None
+        # A display that can't be revived is not put back on the free list.
+        return f":{self._ensure_alive(num)}"
+
+    def release(self, display: str) -> None:
+        self._free.put(int(display.lstrip(":")))
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[str]:
+        display = self.acquire(timeout)
+        try:
+            yield display
+        finally:
+            self.release(display)
+
+    def shutdown(self) -> None:
+        """Terminate every Xvfb server started by this pool."""
+        with self._lock:
+            procs, self._procs = self._procs, {}
+        for num, proc in procs.items():
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+            logger.info("Stopped Xvfb on :%d", num)
+
+
+_pool: Optional[DisplayPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_display_pool() -> Optional[DisplayPool]:
+    """Return the process-wide display pool, or ``None`` if unavailable.
+
+    Requires Linux and ``Xvfb`` on ``PATH``. The pool holds one display per
+    engagement worker.
+    """
+    global _pool
+    if platform.system() != "Linux":
+        return None
+    with _pool_lock:
+        if _pool is None:
+            xvfb = shutil.which("Xvfb")
+            if not xvfb:
+                logger.warning("Virtual displays requested but Xvfb is not installed")
+                return None
+            _pool = DisplayPool(
+                size=max(1, settings.engagement_workers),
+                base_display=settings.xvfb_base_display,
+                xvfb_path=xvfb,
+            )
+        return _pool
+
+
+def shutdown_display_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool:
+        pool.shutdown()
+
+
+atexit.register(shutdown_display_pool)
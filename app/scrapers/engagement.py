@@ -11,11 +11,12 @@ import logging
 import os
 import platform
 import re
+import queue
 import subprocess
-import tempfile
+import threading
 import time
-import unicodedata
-from typing import Optional
+from contextlib import nullcontext
+from typing import Iterable, Optional, Tuple
 
 import imageio_ffmpeg
 import requests
@@ -26,87 +27,60 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from .. import ig_handles
+from ..storage import JsonStore, cache_path
+from .chrome import apply_resource_blocking, detect_chrome_major, launch_chrome
+from .circuit_breaker import CircuitBreaker
+from .display_pool import DisplayPool
+
 logger = logging.getLogger(__name__)
 
 TRENDHERO_URL = "https://trendhero.io/engagement-rate-calculator-instagram/"
 SOCIALCAT_URL = "https://thesocialcat.com/tools/instagram-engagement-rate-calculator"
+PROVIDER_TRENDHERO = "trendhero"
+PROVIDER_SOCIALCAT = "socialcat"
 FFMPEG = imageio_ffmpeg.get_ffmpeg_exe()
+ENGAGEMENT_CACHE_FILE = "engagement_cache.json"
 
-
-def _detect_chrome_major() -> int:
-    """Return the major version of the locally-installed Chrome browser.
-
-    Tries (in order):
-    1. Windows registry (fastest, most reliable).
-    2. ``google-chrome --version`` on Linux / macOS.
-
-    Returns 0 if detection fails (let uc fall back to its own logic).
-    """
-    # --- Windows registry ---------------------------------------------------
-    if platform.system() == "Windows":
-        import winreg  # noqa: WPS433 (only on Windows)
-
-        for root in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
-            for sub in (
-                r"SOFTWARE\Google\Chrome\BLBeacon",
-                r"SOFTWARE\WOW6432Node\Google\Chrome\BLBeacon",
-            ):
-                try:
-                    key = winreg.OpenKey(root, sub)
-                    ver, _ = winreg.QueryValueEx(key, "version")
-                    winreg.CloseKey(key)
-                    major = int(str(ver).split(".")[0])
-                    logger.info("Detected Chrome %s (major=%d) from registry", ver, major)
-                    return major
-                except (OSError, ValueError, IndexError):
-                    continue
-
-    # --- Linux / macOS CLI --------------------------------------------------
-    for cmd in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
-        try:
-            out = subprocess.check_output([cmd, "--version"], stderr=subprocess.DEVNULL, text=True)
-            m = re.search(r"(\d+)", out)
-            if m:
-                major = int(m.group(1))
-                logger.info("Detected Chrome major=%d from `%s --version`", major, cmd)
-                return major
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            continue
-
-    logger.warning("Could not detect Chrome version — letting uc auto-detect")
-    return 0
 MAX_CAPTCHA_RETRIES = 3
 ER_POLL_INTERVAL_SECONDS = 5
 ER_MAX_POLLS = 16
 ER_MAX_USER_ATTEMPTS = 3
 ER_RETRY_BACKOFF_SECONDS = 3
+ER_MAX_CONSECUTIVE_FAILURES = 2  # reused sessions restart after this many misses
 SOCIALCAT_MAX_POLLS = 16
 SOCIALCAT_POLL_INTERVAL_SECONDS = 2
+# Longest single in-page wait; results resolve immediately, this only bounds
+# how long a cancel request can go unnoticed.
+ER_OBSERVER_SLICE_SECONDS = 5
+
+PAGE_STATE_VALUE = "value"
+PAGE_STATE_ERROR = "error"
+PAGE_STATE_TIMEOUT = "timeout"
+TRENDHERO_ER_PATTERN = r"(\d+\.?\d*)\s*%"
+TRENDHERO_ERROR_PATTERN = r"something went wrong"
+SOCIALCAT_ER_PATTERNS = (
+    r"Engagement\s*Rate[^\n\r]{0,120}?(\d{1,2}(?:\.\d{1,2})?\s*%)",
+    r"(\d{1,2}(?:\.\d{1,2})?\s*%)\s*\n?\s*Engagement\s*Rate",
+)
 
 # ── IG username mapping (display name → handle) ─────────────────────────────
 
-IG_USERNAMES = {
-    "beyoncé": "beyonce",
-    "beyonce": "beyonce",
-    "justin bieber": "justinbieber",
-    "ariana grande": "arianagrande",
-    "taylor swift": "taylorswift",
-    "ed sheeran": "teddysphotos",
-    "the weeknd": "theweeknd",
-    "drake": "champagnepapi",
-    "adele": "adele",
-    "bruno mars": "brunomars",
-}
+# Kept for callers that imported the old hard-coded table, including its
+# accented keys (the seed table is keyed by ``artist_key``).
+IG_USERNAMES = {"beyoncé": "beyonce", **ig_handles.SEED_HANDLES}
 
 
 def get_ig_username(artist_name: str) -> str:
-    """Convert artist display name to Instagram username."""
-    key = artist_name.strip().lower()
-    if key in IG_USERNAMES:
-        return IG_USERNAMES[key]
-    normalized = unicodedata.normalize("NFD", key)
-    stripped = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
-    return re.sub(r"[^a-z0-9]", "", stripped)
+    """Convert artist display name to Instagram username.
+
+    Uses handles learned from Soundcharts (and the seed table) first, then
+    falls back to the name with accents and punctuation stripped.
+    """
+    handle = ig_handles.lookup(artist_name)
+    if handle:
+        return handle
+    return re.sub(r"[^a-z0-9]", "", ig_handles.artist_key(artist_name))
 
 
 # ── CAPTCHA helpers ──────────────────────────────────────────────────────────
@@ -204,35 +178,88 @@ def _switch_to_iframe(driver, src_keyword: str, timeout: int = 15):
     )
 
 
-def _transcribe_audio(audio_url: str) -> str:
-    tmp = tempfile.mkdtemp()
-    mp3 = os.path.join(tmp, "audio.mp3")
-    wav = os.path.join(tmp, "audio.wav")
-    try:
-        with open(mp3, "wb") as f:
-            f.write(requests.get(audio_url, timeout=15).content)
-        subprocess.run(
-            [FFMPEG, "-y", "-i", mp3, "-ar", "16000", "-ac", "1", "-f", "wav", wav],
-            capture_output=True,
-            timeout=30,
+_AUDIO_SAMPLE_RATE = 16000
+_AUDIO_SAMPLE_WIDTH = 2  # bytes per sample (s16le)
+_audio_session: Optional[requests.Session] = None
+_audio_session_lock = threading.Lock()
+
+
+def _get_audio_session() -> requests.Session:
+    """Return the pooled HTTP session used to download CAPTCHA audio."""
+    global _audio_session
+    with _audio_session_lock:
+        if _audio_session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _audio_session = session
+        return _audio_session
+
+
+def _decode_audio(data: bytes) -> bytes:
+    """Transcode compressed audio to 16 kHz mono s16le PCM via ffmpeg pipes."""
+    proc = subprocess.run(
+        [
+            FFMPEG, "-hide_banner", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-ar", str(_AUDIO_SAMPLE_RATE), "-ac", "1", "-f", "s16le", "pipe:1",
+        ],
+        input=data,
+        capture_output=True,
+        timeout=30,
+    )
+    if proc.returncode != 0 or not proc.stdout:
+        raise RuntimeError(
+            f"ffmpeg decode failed: {proc.stderr.decode(errors='replace')[:200]}"
         )
-        recognizer = sr.Recognizer()
-        with sr.AudioFile(wav) as src:
-            return recognizer.recognize_google(recognizer.record(src))
-    finally:
-        for p in (mp3, wav):
-            try:
-                os.remove(p)
-            except OSError:
-                pass
-        try:
-            os.rmdir(tmp)
-        except OSError:
-            pass
+    return proc.stdout
+
+
+def _recognize(audio: sr.AudioData, backend: str) -> str:
+    """Transcribe *audio* with the configured speech_recognition backend."""
+    recognizer = sr.Recognizer()
+    recognize = getattr(recognizer, f"recognize_{backend}", None)
+    if recognize is None:
+        raise ValueError(f"Unknown CAPTCHA recognizer backend: {backend!r}")
+    result = recognize(audio)
+    # Some local backends (e.g. whisper) may return dicts or padded text.
+    if isinstance(result, dict):
+        result = result.get("text", "")
+    return str(result).strip()
+
+
+def _transcribe_audio(audio_url: str) -> str:
+    from ..config import settings
+
+    backend = settings.captcha_recognizer
+    started = time.monotonic()
+    resp = _get_audio_session().get(audio_url, timeout=15)
+    resp.raise_for_status()
+    downloaded = time.monotonic()
+    pcm = _decode_audio(resp.content)
+    decoded = time.monotonic()
+    text = _recognize(sr.AudioData(pcm, _AUDIO_SAMPLE_RATE, _AUDIO_SAMPLE_WIDTH), backend)
+    logger.info(
+        "Audio clip transcribed via %s in %.2fs (download %.2fs, decode %.2fs, recognize %.2fs)",
+        backend,
+        time.monotonic() - started,
+        downloaded - started,
+        decoded - downloaded,
+        time.monotonic() - decoded,
+    )
+    return text
+
 
+def _cancelled(cancel: Optional[threading.Event]) -> bool:
+    return cancel is not None and cancel.is_set()
 
-def solve_captcha(driver) -> bool:
-    """Solve reCAPTCHA: checkbox → audio → manual fallback."""
+
+def solve_captcha(driver, cancel: Optional[threading.Event] = None) -> bool:
+    """Solve reCAPTCHA: checkbox → audio → manual fallback.
+
+    Gives up early (returns False) once *cancel* is set.
+    """
     driver.switch_to.default_content()
     if not driver.find_elements(By.CSS_SELECTOR, "iframe[src*='recaptcha']"):
         logger.info("No CAPTCHA detected")
@@ -268,6 +295,8 @@ def solve_captcha(driver) -> bool:
     # Audio challenge loop — uses CDP to interact with the bframe to avoid
     # the Chrome 115+ renderer crash on cross-origin switch_to.frame().
     for attempt in range(1, MAX_CAPTCHA_RETRIES + 1):
+        if _cancelled(cancel):
+            return False
         logger.info("Audio attempt %d/%d", attempt, MAX_CAPTCHA_RETRIES)
         try:
             driver.switch_to.default_content()
@@ -366,6 +395,8 @@ def solve_captcha(driver) -> bool:
     logger.info("Auto-solve failed — waiting %d s for possible deferred solve…", wait_secs)
     driver.switch_to.default_content()
     for _ in range(wait_secs // 2):
+        if _cancelled(cancel):
+            return False
         if _is_captcha_solved(driver):
             logger.info("CAPTCHA solved (deferred)")
             return True
@@ -515,7 +546,9 @@ def _fill_username(driver, username: str) -> bool:
         return False
 
 
-def _attempt_fetch_er(driver, username: str) -> Optional[str]:
+def _attempt_fetch_er(
+    driver, username: str, cancel: Optional[threading.Event] = None
+) -> Optional[str]:
     """Single end-to-end attempt for one username."""
     driver.get(TRENDHERO_URL)
     time.sleep(3)
@@ -524,8 +557,9 @@ def _attempt_fetch_er(driver, username: str) -> Optional[str]:
         logger.warning("Could not fill username for @%s", username)
         return None
 
-    if not solve_captcha(driver):
-        logger.warning("CAPTCHA failed for @%s", username)
+    if not solve_captcha(driver, cancel=cancel):
+        if not _cancelled(cancel):
+            logger.warning("CAPTCHA failed for @%s", username)
         return None
 
     driver.switch_to.default_content()
@@ -545,59 +579,84 @@ def _attempt_fetch_er(driver, username: str) -> Optional[str]:
     except Exception:
         pass
 
-    return _extract_er(driver)
+    return _extract_er(driver, cancel=cancel)
 
 
-def _extract_socialcat_er(driver) -> Optional[str]:
-    """Extract ER from SocialCat calculator result cards."""
-    for _ in range(SOCIALCAT_MAX_POLLS):
-        time.sleep(SOCIALCAT_POLL_INTERVAL_SECONDS)
-        try:
-            text = driver.find_element(By.TAG_NAME, "body").text
-        except Exception:
-            text = ""
+def _read_socialcat_er(driver) -> Optional[str]:
+    """Run the SocialCat extraction strategies once against the current page."""
+    try:
+        text = driver.find_element(By.TAG_NAME, "body").text
+    except Exception:
+        text = ""
 
-        # Prefer values tied to "Engagement Rate" to avoid matching page badges.
-        for pattern in (
-            r"Engagement\s*Rate[^\n\r]{0,120}?(\d{1,2}(?:\.\d{1,2})?\s*%)",
-            r"(\d{1,2}(?:\.\d{1,2})?\s*%)\s*\n?\s*Engagement\s*Rate",
-        ):
-            m = re.search(pattern, text, flags=re.IGNORECASE | re.DOTALL)
-            if m:
-                return m.group(1).replace(" ", "")
+    # Prefer values tied to "Engagement Rate" to avoid matching page badges.
+    for pattern in SOCIALCAT_ER_PATTERNS:
+        m = re.search(pattern, text, flags=re.IGNORECASE | re.DOTALL)
+        if m:
+            return m.group(1).replace(" ", "")
 
-        # DOM fallback: inspect candidate metric cards.
-        try:
-            val = driver.execute_script(
-                r"""
-                const nodes = Array.from(document.querySelectorAll('div,section,span,p,h2,h3,h4'));
-                for (const n of nodes) {
-                    const t = (n.innerText || '').trim();
-                    if (!t) continue;
-                    if (!/engagement\s*rate/i.test(t)) continue;
-                    const m = t.match(/(\d{1,2}(?:\.\d{1,2})?\s*%)/);
-                    if (m) return m[1].replace(/\s+/g, '');
-
-                    const parent = n.closest('div,section');
-                    if (parent) {
-                        const ptxt = (parent.innerText || '').trim();
-                        const pm = ptxt.match(/(\d{1,2}(?:\.\d{1,2})?\s*%)\s*[\s\S]{0,80}Engagement\s*Rate/i)
-                            || ptxt.match(/Engagement\s*Rate[\s\S]{0,80}(\d{1,2}(?:\.\d{1,2})?\s*%)/i);
-                        if (pm) return pm[1].replace(/\s+/g, '');
-                    }
+    # DOM fallback: inspect candidate metric cards.
+    try:
+        val = driver.execute_script(
+            r"""
+            const nodes = Array.from(document.querySelectorAll('div,section,span,p,h2,h3,h4'));
+            for (const n of nodes) {
+                const t = (n.innerText || '').trim();
+                if (!t) continue;
+                if (!/engagement\s*rate/i.test(t)) continue;
+                const m = t.match(/(\d{1,2}(?:\.\d{1,2})?\s*%)/);
+                if (m) return m[1].replace(/\s+/g, '');
+
+                const parent = n.closest('div,section');
+                if (parent) {
+                    const ptxt = (parent.innerText || '').trim();
+                    const pm = ptxt.match(/(\d{1,2}(?:\.\d{1,2})?\s*%)\s*[\s\S]{0,80}Engagement\s*Rate/i)
+                        || ptxt.match(/Engagement\s*Rate[\s\S]{0,80}(\d{1,2}(?:\.\d{1,2})?\s*%)/i);
+                    if (pm) return pm[1].replace(/\s+/g, '');
                 }
-                return null;
-                """
-            )
-            if val:
-                return val
-        except Exception:
-            pass
+            }
+            return null;
+            """
+        )
+        if val:
+            return val
+    except Exception:
+        pass
+    return None
+
 
+def _extract_socialcat_er(driver, cancel: Optional[threading.Event] = None) -> Optional[str]:
+    """Extract ER from SocialCat calculator result cards.
+
+    Waits on an in-page observer, so the value is read as soon as it
+    renders, within the ``SOCIALCAT_MAX_POLLS`` × interval budget.
+    """
+    deadline = time.monotonic() + SOCIALCAT_MAX_POLLS * SOCIALCAT_POLL_INTERVAL_SECONDS
+    while time.monotonic() < deadline:
+        if _cancelled(cancel):
+            return None
+        state = _wait_for_page_state(
+            driver,
+            None,
+            SOCIALCAT_ER_PATTERNS,
+            timeout=min(ER_OBSERVER_SLICE_SECONDS, deadline - time.monotonic()),
+        )
+        if state == PAGE_STATE_TIMEOUT:
+            continue
+        if state is None:
+            # Observer unavailable — fall back to interval polling.
+            time.sleep(SOCIALCAT_POLL_INTERVAL_SECONDS)
+        er = _read_socialcat_er(driver)
+        if er:
+            return er
+        if state == PAGE_STATE_VALUE:
+            time.sleep(0.5)  # text matched but no card parsed yet
     return None
 
 
-def _attempt_fetch_er_socialcat(driver, username: str) -> Optional[str]:
+def _attempt_fetch_er_socialcat(
+    driver, username: str, cancel: Optional[threading.Event] = None
+) -> Optional[str]:
     """Fallback ER extraction from SocialCat calculator."""
     logger.info("Trying SocialCat fallback for @%s", username)
 
@@ -670,10 +729,10 @@ def _attempt_fetch_er_socialcat(driver, username: str) -> Optional[str]:
         except Exception:
             pass
 
-    er = _extract_socialcat_er(driver)
+    er = _extract_socialcat_er(driver, cancel=cancel)
     if er:
         logger.info("SocialCat ER for @%s: %s", username, er)
-    else:
+    elif not _cancelled(cancel):
         logger.warning("SocialCat fallback returned no ER for @%s", username)
     return er
 
@@ -681,17 +740,143 @@ def _attempt_fetch_er_socialcat(driver, username: str) -> Optional[str]:
 # ── Extract ER ───────────────────────────────────────────────────────────────
 
 
-def _extract_er(driver) -> Optional[str]:
+def _wait_for_page_state(
+    driver,
+    selector: Optional[str],
+    value_patterns,
+    error_pattern: Optional[str] = None,
+    timeout: float = ER_OBSERVER_SLICE_SECONDS,
+) -> Optional[str]:
+    """Block until the page shows a result, an error, or *timeout* passes.
+
+    A ``MutationObserver`` inside the page watches the text of *selector*
+    (the whole body when ``None``) and resolves as soon as it matches one
+    of *value_patterns* (→ ``"value"``) or *error_pattern* (→ ``"error"``).
+    Returns ``"timeout"`` on deadline, or ``None`` if the script failed.
+    Patterns must be valid in both Python and JavaScript regex syntax.
+    """
+    if timeout <= 0:
+        return PAGE_STATE_TIMEOUT
+    try:
+        return driver.execute_async_script(
+            """
+            const [selector, valueSources, errorSource, timeoutMs] = arguments;
+            const done = arguments[arguments.length - 1];
+            const values = valueSources.map(src => new RegExp(src, 'i'));
+            const error = errorSource ? new RegExp(errorSource, 'i') : null;
+            const check = () => {
+                const el = selector ? document.querySelector(selector) : document.body;
+                const text = el ? (el.innerText || '') : '';
+                if (error && error.test(text)) return 'error';
+                if (values.some(re => re.test(text))) return 'value';
+                return null;
+            };
+            const initial = check();
+            if (initial) { done(initial); return; }
+            let finished = false;
+            const finish = (state) => {
+                if (finished) return;
+                finished = true;
+                observer.disconnect();
+                clearTimeout(timer);
+                done(state);
+            };
+            const observer = new MutationObserver(() => {
+                const state = check();
+                if (state) finish(state);
+            });
+            const timer = setTimeout(() => finish('timeout'), timeoutMs);
+            observer.observe(document.documentElement, {
+                childList: true, subtree: true, characterData: true,
+            });
+            """,
+            selector,
+            list(value_patterns),
+            error_pattern,
+            int(timeout * 1000),
+        )
+    except Exception as exc:
+        logger.debug("Page observer failed: %s", exc)
+        return None
+
+
+def _read_trendhero_er(driver, text: str) -> Optional[str]:
+    """Run the TrendHero extraction strategies once against the calculator."""
+    # Strategy 1: JS regex — "X.XX% ... Engagement Rate"
+    try:
+        val = driver.execute_script(
+            """
+            const el = document.querySelector('#er-calculator');
+            if (!el) return null;
+            const m = el.innerText.match(
+                /(\\d+\\.?\\d*)\\s*%\\s*\\n?\\s*Engagement Rate/i
+            );
+            return m ? m[1] + '%' : null;
+            """
+        )
+        if val:
+            return val
+    except Exception:
+        pass
+
+    # Strategy 2: broader — any "X.XX%" in the calculator area
+    if text:
+        matches = re.findall(TRENDHERO_ER_PATTERN, text)
+        if matches:
+            return matches[0] + "%"
+
+    # Strategy 3: look for a dedicated result element
+    for sel in (
+        "[class*='engagement'] [class*='rate']",
+        "[class*='result'] [class*='rate']",
+        "[class*='er-result']",
+        ".MuiTypography-root",
+    ):
+        try:
+            els = driver.find_elements(By.CSS_SELECTOR, f"#er-calculator {sel}")
+            for el in els:
+                m = re.search(TRENDHERO_ER_PATTERN, el.text)
+                if m:
+                    return m.group(1) + "%"
+        except Exception:
+            pass
+    return None
+
+
+def _extract_er(driver, cancel: Optional[threading.Event] = None) -> Optional[str]:
+    """Wait for the TrendHero result and return it.
+
+    Waits on an in-page observer rather than sleeping between polls, so a
+    result is read as soon as it renders, within the ``ER_MAX_POLLS`` ×
+    interval budget. Error panels are retried via "Try again".
+    """
     try_again_clicks = 0
+    logged_text = False
+    deadline = time.monotonic() + ER_MAX_POLLS * ER_POLL_INTERVAL_SECONDS
+
+    while time.monotonic() < deadline:
+        if _cancelled(cancel):
+            return None
+        state = _wait_for_page_state(
+            driver,
+            "#er-calculator",
+            [TRENDHERO_ER_PATTERN],
+            error_pattern=TRENDHERO_ERROR_PATTERN,
+            timeout=min(ER_OBSERVER_SLICE_SECONDS, deadline - time.monotonic()),
+        )
+        if state == PAGE_STATE_TIMEOUT:
+            continue
+        if state is None:
+            # Observer unavailable — fall back to interval polling.
+            time.sleep(ER_POLL_INTERVAL_SECONDS)
 
-    for i in range(ER_MAX_POLLS):
-        time.sleep(ER_POLL_INTERVAL_SECONDS)
         try:
             text = driver.find_element(
                 By.CSS_SELECTOR, "#er-calculator"
             ).text
-            if i == 0:
+            if not logged_text:
                 logger.info("ER calculator text: %s", text[:500] if text else "(empty)")
+                logged_text = True
         except Exception:
             text = ""
 
@@ -700,55 +885,191 @@ def _extract_er(driver) -> Optional[str]:
             logger.info("TrendHero error shown — clicking Try again")
             if _click_try_again(driver):
                 try_again_clicks += 1
-                # After clicking, allow UI to reset then continue polling.
+                # After clicking, allow UI to reset then continue waiting.
                 time.sleep(3)
                 # Re-submit check after repeated server-side failures.
                 if try_again_clicks >= 2:
                     _click_check(driver)
-                continue
-
-            # If button wasn't clickable yet, continue polling and retry click.
+            else:
+                # Button not clickable yet; retry shortly.
+                time.sleep(1)
             continue
 
-        # Strategy 1: JS regex — "X.XX% ... Engagement Rate"
+        er = _read_trendhero_er(driver, text)
+        if er:
+            return er
+        if state == PAGE_STATE_VALUE:
+            time.sleep(0.5)  # text matched but no strategy parsed it yet
+    return None
+
+
+# ── Provider selection ───────────────────────────────────────────────────────
+
+_PROVIDER_FETCHERS = {
+    PROVIDER_TRENDHERO: _attempt_fetch_er,
+    PROVIDER_SOCIALCAT: _attempt_fetch_er_socialcat,
+}
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_provider_breakers() -> dict[str, CircuitBreaker]:
+    """Return the process-wide circuit breaker for each ER provider."""
+    from ..config import settings
+
+    with _breakers_lock:
+        if not _breakers:
+            for provider in _PROVIDER_FETCHERS:
+                _breakers[provider] = CircuitBreaker(
+                    provider,
+                    failure_threshold=settings.engagement_breaker_failure_threshold,
+                    reset_timeout_seconds=settings.engagement_breaker_reset_seconds,
+                )
+        return dict(_breakers)
+
+
+def get_provider_breaker_states() -> list[dict]:
+    """Snapshot every provider breaker for monitoring."""
+    return [b.snapshot() for b in get_provider_breakers().values()]
+
+
+def _record_outcome(provider: str, er: Optional[str]) -> None:
+    breaker = get_provider_breakers()[provider]
+    if er:
+        breaker.record_success()
+    else:
+        breaker.record_failure()
+
+
+def _race_fetch_er(
+    trendhero_driver, socialcat_driver, username: str
+) -> Tuple[Optional[str], Optional[str]]:
+    """Query TrendHero and SocialCat in parallel on separate drivers.
+
+    Returns ``(er, provider)`` for the first valid result and cancels the
+    other provider, or ``(None, None)`` when both fail. Waits for the loser
+    to stop so neither driver is still busy when this returns.
+    """
+    cancel = threading.Event()
+    outcomes: "queue.Queue[Tuple[str, Optional[str]]]" = queue.Queue()
+
+    def _run(provider: str, driver) -> None:
+        er = None
         try:
-            val = driver.execute_script(
-                """
-                const el = document.querySelector('#er-calculator');
-                if (!el) return null;
-                const m = el.innerText.match(
-                    /(\\d+\\.?\\d*)\\s*%\\s*\\n?\\s*Engagement Rate/i
-                );
-                return m ? m[1] + '%' : null;
-                """
+            er = _PROVIDER_FETCHERS[provider](driver, username, cancel=cancel)
+        except Exception as exc:
+            if not cancel.is_set():
+                logger.warning("%s failed for @%s: %s", provider, username, exc)
+        outcomes.put((provider, er))
+
+    threads = [
+        threading.Thread(target=_run, args=(provider, driver), daemon=True)
+        for provider, driver in (
+            (PROVIDER_TRENDHERO, trendhero_driver),
+            (PROVIDER_SOCIALCAT, socialcat_driver),
+        )
+    ]
+    for thread in threads:
+        thread.start()
+
+    winner: Tuple[Optional[str], Optional[str]] = (None, None)
+    started = time.monotonic()
+    decided = set()
+    for _ in threads:
+        provider, er = outcomes.get()
+        # Only outcomes decided before cancellation count for the breakers.
+        _record_outcome(provider, er)
+        decided.add(provider)
+        if er:
+            winner = (er, provider)
+            logger.info(
+                "%s won the race for @%s in %.1fs",
+                provider, username, time.monotonic() - started,
             )
-            if val:
-                return val
-        except Exception:
-            pass
+            break
+    cancel.set()
+    for thread in threads:
+        thread.join()
+    breakers = get_provider_breakers()
+    for provider in _PROVIDER_FETCHERS:
+        if provider not in decided:
+            breakers[provider].release()
+    return winner
+
+
+def _fetch_er(
+    driver, username: str, socialcat_driver=None
+) -> Tuple[Optional[str], Optional[str]]:
+    """Fetch one username's ER; returns ``(er, provider)``.
+
+    Providers whose circuit breaker is open are skipped. With a
+    *socialcat_driver* and both providers available they are raced,
+    otherwise SocialCat is only tried after TrendHero fails.
+    """
+    breakers = get_provider_breakers()
+    allowed = [p for p in (PROVIDER_TRENDHERO, PROVIDER_SOCIALCAT) if breakers[p].allow()]
+    skipped = [p for p in _PROVIDER_FETCHERS if p not in allowed]
+    if skipped:
+        logger.info("Circuit open, skipping %s for @%s", ", ".join(skipped), username)
+
+    if socialcat_driver is not None and len(allowed) == 2:
+        return _race_fetch_er(driver, socialcat_driver, username)
 
-        # Strategy 2: broader — any "X.XX%" in the calculator area
-        if text:
-            matches = re.findall(r"(\d+\.?\d*)\s*%", text)
-            if matches:
-                return matches[0] + "%"
-
-        # Strategy 3: look for a dedicated result element
-        for sel in (
-            "[class*='engagement'] [class*='rate']",
-            "[class*='result'] [class*='rate']",
-            "[class*='er-result']",
-            ".MuiTypography-root",
-        ):
+    pending = list(allowed)
+    try:
+        while pending:
+            provider = pending.pop(0)
             try:
-                els = driver.find_elements(By.CSS_SELECTOR, f"#er-calculator {sel}")
-                for el in els:
-                    m = re.search(r"(\d+\.?\d*)\s*%", el.text)
-                    if m:
-                        return m.group(1) + "%"
+                er = _PROVIDER_FETCHERS[provider](driver, username)
             except Exception:
-                pass
-    return None
+                _record_outcome(provider, None)
+                raise
+            _record_outcome(provider, er)
+            if er:
+                return er, provider
+        return None, None
+    finally:
+        for provider in pending:
+            breakers[provider].release()
+
+
+# ── ER cache ─────────────────────────────────────────────────────────────────
+
+_er_cache: Optional[JsonStore] = None
+_er_cache_lock = threading.Lock()
+
+
+def _get_er_cache() -> JsonStore:
+    """Return the persisted ``{handle: {er, provider, ts}}`` cache."""
+    global _er_cache
+    with _er_cache_lock:
+        if _er_cache is None:
+            _er_cache = JsonStore(cache_path(ENGAGEMENT_CACHE_FILE))
+        return _er_cache
+
+
+def _normalize_handle(username: str) -> str:
+    return username.strip().lstrip("@").lower()
+
+
+def _cached_er(username: str, ttl_hours: float) -> Optional[dict]:
+    """Return the cached entry for *username* if it is younger than the TTL."""
+    if ttl_hours <= 0:
+        return None
+    entry = _get_er_cache().get(_normalize_handle(username))
+    if not entry or not entry.get("er"):
+        return None
+    if time.time() - entry.get("ts", 0) > ttl_hours * 3600:
+        return None
+    return entry
+
+
+def _store_er(username: str, er: str, provider: Optional[str]) -> None:
+    _get_er_cache().set(
+        _normalize_handle(username),
+        {"er": er, "provider": provider, "ts": time.time()},
+    )
 
 
 # ── Public API ───────────────────────────────────────────────────────────────
@@ -758,29 +1079,32 @@ def get_engagement_rate(
     ig_username: str,
     chrome_version: int = 0,
     headless: bool = True,
+    race_providers: bool = False,
 ) -> Optional[str]:
     """
     Launch an undetected Chrome instance, navigate to TrendHero,
     solve CAPTCHA, and return the engagement rate string (e.g. ``"4.23%"``).
 
     Runs **headless** by default so the browser stays in the background.
-    If *chrome_version* is ``0``, the installed Chrome version
-    is detected automatically from the system.
+    With *race_providers*, SocialCat runs in a second browser at the same
+    time and the first valid result wins. If *chrome_version* is ``0``,
+    the installed Chrome version is detected automatically from the system.
     """
     logger.info("Fetching ER for @%s (headless=%s)", ig_username, headless)
 
-    ver = chrome_version or _detect_chrome_major()
+    ver = chrome_version or detect_chrome_major()
     driver = None
+    socialcat_driver = None
 
     try:
         for attempt in range(1, ER_MAX_USER_ATTEMPTS + 1):
             try:
                 if driver is None:
                     driver = _make_uc_driver(ver, headless=headless)
+                if race_providers and socialcat_driver is None:
+                    socialcat_driver = _make_uc_driver(ver, headless=headless)
 
-                er = _attempt_fetch_er(driver, ig_username)
-                if not er:
-                    er = _attempt_fetch_er_socialcat(driver, ig_username)
+                er, _ = _fetch_er(driver, ig_username, socialcat_driver=socialcat_driver)
                 if er:
                     logger.info("ER for @%s: %s", ig_username, er)
                     return er
@@ -801,22 +1125,26 @@ def get_engagement_rate(
                 )
 
             _safe_quit(driver)
-            driver = None
+            _safe_quit(socialcat_driver)
+            driver = socialcat_driver = None
             time.sleep(ER_RETRY_BACKOFF_SECONDS)
 
         return None
     finally:
         _safe_quit(driver)
+        _safe_quit(socialcat_driver)
 
 
-def _make_uc_driver(ver: int, headless: bool = False) -> uc.Chrome:
+def _make_uc_driver(ver: int, headless: bool = False, display: Optional[str] = None) -> uc.Chrome:
     """Create a new undetected-chromedriver instance.
 
-    In server/container environments (no display), forces headless mode.
-    If headed startup fails, retries once in headless mode.
+    With *display* (e.g. ``":99"`` from the virtual display pool) Chrome
+    runs headed on that X display. Otherwise, in server/container
+    environments (no display), forces headless mode. If headed startup
+    fails, retries once in headless mode.
     """
-    force_headless = headless
-    if platform.system() == "Linux" and not os.getenv("DISPLAY"):
+    force_headless = headless and not display
+    if platform.system() == "Linux" and not os.getenv("DISPLAY") and not display:
         force_headless = True
 
     opts = uc.ChromeOptions()
@@ -831,16 +1159,14 @@ def _make_uc_driver(ver: int, headless: bool = False) -> uc.Chrome:
     opts.add_argument("--disable-features=IsolateOrigins,site-per-process")
     opts.add_argument("--disable-site-isolation-trials")
 
+    if display:
+        opts.add_argument(f"--display={display}")
     if force_headless:
         opts.add_argument("--headless=new")
         opts.add_argument("--disable-software-rasterizer")
 
-    kw: dict = {"options": opts}
-    if ver:
-        kw["version_main"] = ver
-
     try:
-        driver = uc.Chrome(**kw)
+        driver = launch_chrome(opts, ver)
     except Exception as exc:
         if not force_headless:
             logger.warning(
@@ -849,7 +1175,7 @@ def _make_uc_driver(ver: int, headless: bool = False) -> uc.Chrome:
             )
             opts.add_argument("--headless=new")
             opts.add_argument("--disable-software-rasterizer")
-            driver = uc.Chrome(**kw)
+            driver = launch_chrome(opts, ver)
             force_headless = True
         else:
             raise
@@ -860,6 +1186,7 @@ def _make_uc_driver(ver: int, headless: bool = False) -> uc.Chrome:
         except Exception:
             pass
 
+    apply_resource_blocking(driver, "engagement")
     return driver
 
 
@@ -872,81 +1199,267 @@ def _safe_quit(driver):
             pass
 
 
+class _DriverSession:
+    """Own the engagement browser for a batch and account for its launches.
+
+    The driver is launched lazily, recycled after *max_uses* lookups
+    (``0`` = unlimited) and restarted on demand.
+    """
+
+    def __init__(self, ver: int, headless: bool, max_uses: int = 0, display: Optional[str] = None):
+        self.ver = ver
+        self.headless = headless
+        self.display = display
+        self.max_uses = max(0, int(max_uses))
+        self.driver = None
+        self.uses = 0
+        self.launches = 0
+        self.launch_seconds = 0.0
+
+    def get(self) -> uc.Chrome:
+        if self.driver is not None and self.max_uses and self.uses >= self.max_uses:
+            logger.info("Recycling engagement browser after %d uses", self.uses)
+            self.close()
+        if self.driver is None:
+            started = time.monotonic()
+            self.driver = _make_uc_driver(self.ver, headless=self.headless, display=self.display)
+            self.launch_seconds += time.monotonic() - started
+            self.launches += 1
+            self.uses = 0
+        return self.driver
+
+    def mark_used(self) -> None:
+        self.uses += 1
+
+    def is_healthy(self) -> bool:
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url  # raises once the browser/window is gone
+            return True
+        except Exception:
+            return False
+
+    def close(self) -> None:
+        _safe_quit(self.driver)
+        self.driver = None
+
+
 def get_engagement_rate_batch(
     ig_usernames: list[str],
     chrome_version: int = 0,
     max_restarts: int = 3,
     headless: bool = True,
+    reuse_session: bool = False,
+    max_driver_uses: int = 10,
+    race_providers: bool = False,
+    cache_ttl_hours: float = 0,
+    force_refresh: bool = False,
+    workers: int = 1,
+    display_pool: Optional[DisplayPool] = None,
 ) -> dict[str, Optional[str]]:
     """
     Fetch engagement rates for multiple IG usernames.
 
     Runs **headless** by default so the browser stays in the background.
-    Uses a single browser session where possible, but **automatically
-    restarts Chrome** if the window crashes (up to *max_restarts* times
-    per username). If *chrome_version* is ``0``, the installed Chrome
-    version is detected automatically from the system.
+    By default every attempt gets a fresh Chrome to avoid stale anti-bot
+    state. With *reuse_session*, one healthy browser is kept across
+    usernames and only restarted after a crash, after
+    ``ER_MAX_CONSECUTIVE_FAILURES`` failed attempts in a row, or after
+    *max_driver_uses* lookups. Failed attempts are retried up to
+    *max_restarts* times per username. With *race_providers*, SocialCat
+    runs in a second browser alongside TrendHero and the first valid ER
+    wins. If *chrome_version* is ``0``, the installed Chrome version is
+    detected automatically from the system.
+
+    With *cache_ttl_hours* > 0, rates fetched within the TTL are served
+    from the persisted cache and a browser is only opened for handles
+    that are missing or stale; *force_refresh* ignores cached values.
+    Duplicate handles (case / ``@`` insensitive) are fetched once.
+
+    With *workers* > 1, handles are shared out to that many workers, each
+    with its own browser(s). With *display_pool*, each worker leases a
+    virtual X display and runs headed Chrome on it, which lets the
+    CAPTCHA flow run on hosts without a real display.
     """
     results: dict[str, Optional[str]] = {}
-    ver = chrome_version or _detect_chrome_major()
-    driver = _make_uc_driver(ver, headless=headless)
+    pending: list[str] = []
+    seen: dict[str, str] = {}
+    for username in ig_usernames:
+        results[username] = None
+        handle = _normalize_handle(username)
+        if handle in seen:
+            continue
+        seen[handle] = username
+        cached = None if force_refresh else _cached_er(username, cache_ttl_hours)
+        if cached:
+            results[username] = cached["er"]
+            logger.info(
+                "ER for @%s: %s (cached from %s)",
+                username, cached["er"], cached.get("provider") or "unknown provider",
+            )
+        else:
+            pending.append(username)
+    if len(pending) < len(seen):
+        logger.info(
+            "Engagement cache: %d hit(s), %d handle(s) to fetch",
+            len(seen) - len(pending), len(pending),
+        )
 
+    if pending:
+        fetch_args = (
+            results, chrome_version, max_restarts, headless,
+            reuse_session, max_driver_uses, race_providers,
+        )
+        store = cache_ttl_hours > 0 or force_refresh
+        workers = max(1, min(int(workers), len(pending)))
+        if workers == 1 and display_pool is None:
+            _fetch_er_batch(pending, *fetch_args, store=store)
+        else:
+            todo: "queue.Queue[str]" = queue.Queue()
+            for username in pending:
+                todo.put(username)
+            threads = [
+                threading.Thread(
+                    target=_er_worker,
+                    args=(todo, display_pool, fetch_args, store),
+                    name=f"engagement-worker-{i}",
+                    daemon=True,
+                )
+                for i in range(workers)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+    # Fill duplicates of the same handle from the fetched value.
     for username in ig_usernames:
+        if results[username] is None:
+            results[username] = results.get(seen[_normalize_handle(username)])
+    return results
+
+
+def _drain(todo: "queue.Queue[str]") -> Iterable[str]:
+    while True:
+        try:
+            yield todo.get_nowait()
+        except queue.Empty:
+            return
+
+
+def _er_worker(
+    todo: "queue.Queue[str]",
+    display_pool: Optional[DisplayPool],
+    fetch_args: tuple,
+    store: bool,
+) -> None:
+    """One engagement worker: pull handles off *todo* until it is empty."""
+    try:
+        lease = display_pool.lease() if display_pool else nullcontext(None)
+        with lease as display:
+            if display:
+                logger.info("Engagement worker using virtual display %s", display)
+            _fetch_er_batch(_drain(todo), *fetch_args, store=store, display=display)
+    except Exception as exc:
+        logger.warning("Engagement worker failed: %s", exc)
+
+
+def _fetch_er_batch(
+    ig_usernames: Iterable[str],
+    results: dict[str, Optional[str]],
+    chrome_version: int,
+    max_restarts: int,
+    headless: bool,
+    reuse_session: bool,
+    max_driver_uses: int,
+    race_providers: bool,
+    store: bool = False,
+    display: Optional[str] = None,
+) -> None:
+    """Browser half of :func:`get_engagement_rate_batch`; fills *results*."""
+    ver = chrome_version or detect_chrome_major()
+    max_uses = max_driver_uses if reuse_session else 0
+    session = _DriverSession(ver, headless, max_uses=max_uses, display=display)
+    sessions = [session]
+    socialcat_session = None
+    if race_providers:
+        socialcat_session = _DriverSession(ver, headless, max_uses=max_uses, display=display)
+        sessions.append(socialcat_session)
+    total_attempts = 0
+    consecutive_failures = 0
+    processed = 0
+
+    for username in ig_usernames:
+        processed += 1
         logger.info("Fetching ER for @%s", username)
-        success = False
 
         attempts_for_user = max(max_restarts, ER_MAX_USER_ATTEMPTS)
         for attempt in range(1, attempts_for_user + 1):
+            total_attempts += 1
+            crashed = False
             try:
-                if driver is None:
-                    driver = _make_uc_driver(ver, headless=headless)
-
-                er = _attempt_fetch_er(driver, username)
-                if not er:
-                    er = _attempt_fetch_er_socialcat(driver, username)
-                results[username] = er
+                driver = session.get()
+                socialcat_driver = socialcat_session.get() if socialcat_session else None
+                er, provider = _fetch_er(driver, username, socialcat_driver=socialcat_driver)
+                for s in sessions:
+                    s.mark_used()
                 if er:
+                    results[username] = er
+                    if store:
+                        _store_er(username, er, provider)
                     logger.info("ER for @%s: %s", username, er)
-                    success = True
+                    consecutive_failures = 0
                     break
-                else:
-                    logger.warning(
-                        "No ER for @%s on attempt %d/%d",
-                        username,
-                        attempt,
-                        attempts_for_user,
-                    )
-
+                logger.warning(
+                    "No ER for @%s on attempt %d/%d",
+                    username,
+                    attempt,
+                    attempts_for_user,
+                )
             except Exception as e:
+                crashed = True
                 logger.warning(
                     "Attempt %d/%d for @%s failed: %s",
                     attempt, attempts_for_user, username, e,
                 )
 
-            # Restart browser between failed attempts to avoid stale anti-bot state.
-            _safe_quit(driver)
+            consecutive_failures += 1
+            # Restart between failed attempts to avoid stale anti-bot state;
+            # a reused session only restarts on crashes or repeated failures.
+            if (
+                not reuse_session
+                or crashed
+                or consecutive_failures >= ER_MAX_CONSECUTIVE_FAILURES
+                or not all(s.is_healthy() for s in sessions)
+            ):
+                for s in sessions:
+                    s.close()
+                consecutive_failures = 0
             if attempt < attempts_for_user:
-                logger.info("Restarting Chrome for retry…")
+                logger.info("Retrying @%s…", username)
                 time.sleep(ER_RETRY_BACKOFF_SECONDS)
-                try:
-                    driver = _make_uc_driver(ver, headless=headless)
-                except Exception as restart_err:
-                    logger.error("Chrome restart failed: %s", restart_err)
-                    results[username] = None
-                    success = True
-                    break
 
-        if not success:
-            results[username] = None
-
-        # Prepare clean session for the next artist if last loop broke on success.
-        _safe_quit(driver)
-        try:
-            driver = _make_uc_driver(ver, headless=headless)
-        except Exception:
-            driver = None
+        if not reuse_session:
+            # Clean session for the next artist.
+            for s in sessions:
+                s.close()
 
         time.sleep(2)
 
-    _safe_quit(driver)
-    return results
+    for s in sessions:
+        s.close()
+
+    # Without reuse every attempt would have paid for its own launch(es).
+    launches = sum(s.launches for s in sessions)
+    launch_seconds = sum(s.launch_seconds for s in sessions)
+    avg_launch = launch_seconds / launches if launches else 0.0
+    logger.info(
+        "Engagement batch: %d username(s), %d attempt(s), %d browser launch(es) "
+        "(%.1fs launching, ~%.1fs saved by session reuse)",
+        processed,
+        total_attempts,
+        launches,
+        launch_seconds,
+        max(0, total_attempts * len(sessions) - launches) * avg_launch,
+    )
@@ -0,0 +1,184 @@
+"""
+OpenAI Batch API backend for the tour-link and venue-type phases.
+
+Large jobs submit every prompt as one batch (one JSONL upload, one batch,
+polled until done) instead of one interactive ``responses.create`` per
+artist and kind. The network side sits behind ``BatchTransport`` so a
+local stand-in server (``OPENAI_BASE_URL``) or an in-process fake can be
+used in tests. Callers pass a ``heartbeat`` that runs after every poll, so
+a job waiting on a batch keeps reporting progress.
+"""
+
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+
+from openai import OpenAI
+
+from ..config import settings
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/responses"
+BATCH_FINAL_STATES = {"completed", "failed", "expired", "cancelled"}
+
+
+class BatchTransport(ABC):
+    """Submit / poll / download operations used by :func:`run_batch`."""
+
+    @abstractmethod
+    def submit(self, jsonl: bytes) -> str:
+        """Upload *jsonl* and create a batch; return the batch id."""
+
+    @abstractmethod
+    def status(self, batch_id: str) -> Tuple[str, Optional[str]]:
+        """Return ``(status, output_file_id)`` for *batch_id*."""
+
+    @abstractmethod
+    def download(self, file_id: str) -> str:
+        """Return the text content of *file_id*."""
+
+    @abstractmethod
+    def cancel(self, batch_id: str) -> None:
+        """Cancel *batch_id*."""
+
+
+class OpenAIBatchTransport(BatchTransport):
+    """Transport backed by the OpenAI SDK (honours ``OPENAI_BASE_URL``)."""
+
+    def __init__(self, api_key: str, base_url: Optional[str] = None):
+        self._client = OpenAI(api_key=api_key, base_url=base_url or None)
+
+    def submit(self, jsonl: bytes) -> str:
+        upload = self._client.files.create(file=("batch.jsonl", jsonl), purpose="batch")
+        batch = self._client.batches.create(
+            input_file_id=upload.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        return batch.id
+
+    def status(self, batch_id: str) -> Tuple[str, Optional[str]]:
+        batch = self._client.batches.retrieve(batch_id)
+        return batch.status, batch.output_file_id
+
+    def download(self, file_id: str) -> str:
+        return self._client.files.content(file_id).text
+
+    def cancel(self, batch_id: str) -> None:
+        self._client.batches.cancel(batch_id)
+
+
+def _response_text(body: Dict) -> Optional[str]:
+    """Concatenate the ``output_text`` parts of a raw Responses API body."""
+    parts = []
+    for item in body.get("output") or []:
+        if item.get("type") != "message":
+            continue
+        for content in item.get("content") or []:
+            if content.get("type") == "output_text":
+                parts.append(content.get("text", ""))
+    text = "".join(parts).strip()
+    return text or None
+
+
+def run_batch(
+    prompts: Dict[str, str],
+    transport: BatchTransport,
+    model: str,
+    poll_seconds: float = 30,
+    max_wait_seconds: float = 3600,
+    sleep: Callable[[float], None] = time.sleep,
+    heartbeat: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Optional[str]]:
+    """Run ``{custom_id: prompt}`` as one batch and return ``{custom_id: text}``.
+
+    Requests that failed, or that had not finished before *max_wait_seconds*
+    (the batch is cancelled then), map to ``None``. *heartbeat* is called
+    with the batch status after every poll.
+    """
+    results: Dict[str, Optional[str]] = {cid: None for cid in prompts}
+    if not prompts:
+        return results
+    lines = [
+        json.dumps({
+            "custom_id": cid,
+            "method": "POST",
+            "url": BATCH_ENDPOINT,
+            "body": {"model": model, "tools": [{"type": "web_search"}], "input": prompt},
+        })
+        for cid, prompt in prompts.items()
+    ]
+    batch_id = transport.submit(("\n".join(lines) + "\n").encode("utf-8"))
+    logger.info("OpenAI batch %s submitted (%d requests)", batch_id, len(prompts))
+
+    started = time.monotonic()
+    status, output_file_id = transport.status(batch_id)
+    if heartbeat:
+        heartbeat(status)
+    while status not in BATCH_FINAL_STATES:
+        if time.monotonic() - started > max_wait_seconds:
+            logger.warning("OpenAI batch %s still %s after %.0fs; cancelling", batch_id, status, max_wait_seconds)
+            try:
+                transport.cancel(batch_id)
+            except Exception as exc:
+                logger.warning("Could not cancel OpenAI batch %s: %s", batch_id, exc)
+            return results
+        sleep(poll_seconds)
+        status, output_file_id = transport.status(batch_id)
+        if heartbeat:
+            heartbeat(status)
+
+    logger.info(
+        "OpenAI batch %s %s after %.0fs", batch_id, status, time.monotonic() - started
+    )
+    if not output_file_id:
+        return results
+    for line in transport.download(output_file_id).splitlines():
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        cid = row.get("custom_id")
+        response = row.get("response") or {}
+        if cid in results and response.get("status_code") == 200:
+            results[cid] = _response_text(response.get("body") or {})
+    return results
+
+
+def batch_lookup(
+    requests: Dict[str, List[Tuple[str, str]]],
+    api_key: str,
+    transport: Optional[BatchTransport] = None,
+    heartbeat: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Dict[str, Optional[str]]]:
+    """Look up ``{kind: [(artist, prompt), ...]}`` in one batch.
+
+    Returns ``{kind: {artist: text}}``.
+    """
+    prompts: Dict[str, str] = {}
+    index: Dict[str, Tuple[str, str]] = {}
+    for kind, items in requests.items():
+        for i, (artist, prompt) in enumerate(items):
+            cid = f"{kind}:{i}"
+            prompts[cid] = prompt
+            index[cid] = (kind, artist)
+
+    transport = transport or OpenAIBatchTransport(api_key, settings.openai_base_url)
+    texts = run_batch(
+        prompts,
+        transport,
+        model=settings.openai_model,
+        poll_seconds=settings.openai_batch_poll_seconds,
+        max_wait_seconds=settings.openai_batch_max_wait_minutes * 60,
+        heartbeat=heartbeat,
+    )
+    out: Dict[str, Dict[str, Optional[str]]] = {kind: {} for kind in requests}
+    for cid, text in texts.items():
+        kind, artist = index[cid]
+        out[kind][artist] = text
+    return out
@@ -1,19 +1,37 @@
 """
-OpenAI-powered helpers — tour link & venue type discovery.
+OpenAI-powered helpers — tour link, venue type & venue capacity discovery.
 
 Uses GPT-4o with web search tool to find information about artists.
 Extracted from the original ``soundchart.py`` / ``soundchart_live.py``.
+
+One ``AsyncOpenAI`` client per API key lives on a background event loop,
+so connections and TLS sessions are reused and concurrent requests are
+bounded by a semaphore. Answers are cached on disk keyed by model, prompt
+version, kind and artist; repeat lookups never leave the process.
 """
 
+import asyncio
 import logging
 import re
-from typing import Optional
+import threading
+import time
+from typing import Dict, List, Optional
 from urllib.parse import urlparse
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+from ..config import settings
+from ..storage import JsonStore, cache_path
 
 logger = logging.getLogger(__name__)
 
+OPENAI_CACHE_FILE = "openai_cache.json"
+KIND_TOUR_LINK = "tour_link"
+KIND_VENUE_TYPE = "venue_type"
+KIND_VENUE_CLASS = "venue_class"
+# Bump a version when its prompt changes so cached answers are not reused.
+PROMPT_VERSIONS = {KIND_TOUR_LINK: 1, KIND_VENUE_TYPE: 1, KIND_VENUE_CLASS: 1}
+
 
 def _extract_domain(url: str) -> str:
     """Return a clean domain from a URL, stripping scheme, www, and path.
@@ -36,31 +54,196 @@ def _extract_domain(url: str) -> str:
         return url
 
 
-def _query_openai(api_key: str, prompt: str) -> Optional[str]:
-    """Send a web-search prompt to GPT-4o and return the raw text."""
+# ── Client ───────────────────────────────────────────────────────────────────
+
+
+class _ClientLoop:
+    """Event loop in a daemon thread owning the shared async clients."""
+
+    def __init__(self, max_concurrency: int):
+        self.loop = asyncio.new_event_loop()
+        self._clients: Dict[str, AsyncOpenAI] = {}
+        self._max_concurrency = max(1, int(max_concurrency))
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        threading.Thread(target=self.loop.run_forever, name="openai-loop", daemon=True).start()
+
+    def client(self, api_key: str) -> AsyncOpenAI:
+        # Only called on the loop thread, so no locking is needed.
+        client = self._clients.get(api_key)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=settings.openai_base_url or None,
+                timeout=settings.openai_timeout_seconds,
+            )
+            self._clients[api_key] = client
+        return client
+
+    def semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    def run(self, coro):
+        """Run *coro* on the loop from a worker thread and wait for it."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result()
+
+
+_client_loop: Optional[_ClientLoop] = None
+_client_loop_lock = threading.Lock()
+
+
+def _get_client_loop() -> _ClientLoop:
+    global _client_loop
+    with _client_loop_lock:
+        if _client_loop is None:
+            _client_loop = _ClientLoop(settings.openai_max_concurrency)
+        return _client_loop
+
+
+async def _aquery_openai(api_key: str, prompt: str) -> Optional[str]:
+    runner = _get_client_loop()
     try:
-        client = OpenAI(api_key=api_key)
-        response = client.responses.create(
-            model="gpt-4o",
-            tools=[{"type": "web_search"}],
-            input=prompt,
-        )
+        async with runner.semaphore():
+            response = await runner.client(api_key).responses.create(
+                model=settings.openai_model,
+                tools=[{"type": "web_search"}],
+                input=prompt,
+            )
         return response.output_text.strip()
     except Exception as e:
         logger.warning("OpenAI call failed: %s", e)
         return None
 
 
-def get_tour_link(artist_name: str, api_key: str) -> Optional[str]:
-    """Return the official tour page / website URL for *artist_name*."""
-    logger.info("Fetching tour link for %s", artist_name)
-    prompt = (
+def _query_openai(api_key: str, prompt: str) -> Optional[str]:
+    """Send a web-search prompt to GPT-4o and return the raw text."""
+    return _get_client_loop().run(_aquery_openai(api_key, prompt))
+
+
+# ── Response cache ───────────────────────────────────────────────────────────
+
+_cache: Optional[JsonStore] = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache() -> JsonStore:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = JsonStore(cache_path(OPENAI_CACHE_FILE))
+        return _cache
+
+
+def _cache_key(kind: str, artist_name: str) -> str:
+    artist = " ".join(artist_name.lower().split())
+    return f"{settings.openai_model}|v{PROMPT_VERSIONS[kind]}|{kind}|{artist}"
+
+
+def _cache_get(kind: str, artist_name: str) -> Optional[str]:
+    ttl_hours = settings.openai_cache_ttl_hours
+    if ttl_hours <= 0:
+        return None
+    entry = _get_cache().get(_cache_key(kind, artist_name))
+    if entry and time.time() - entry.get("ts", 0) <= ttl_hours * 3600:
+        return entry.get("text")
+    return None
+
+
+def _cache_put(kind: str, artist_name: str, text: str) -> None:
+    """Record an answer in memory; :func:`_cache_flush` persists it.
+
+    Cheap enough to call on the client loop, unlike the flush.
+    """
+    if settings.openai_cache_ttl_hours <= 0:
+        return
+    _get_cache().set(_cache_key(kind, artist_name), {"text": text, "ts": time.time()}, flush=False)
+
+
+def _cache_flush() -> None:
+    """Evict the oldest answers over ``openai_cache_max_entries`` and write the cache."""
+    if settings.openai_cache_ttl_hours <= 0:
+        return
+    cache = _get_cache()
+    overflow = len(cache) - max(1, settings.openai_cache_max_entries)
+    if overflow > 0:
+        oldest = sorted(cache.items(), key=lambda kv: kv[1].get("ts", 0))[:overflow]
+        for key, _ in oldest:
+            cache.pop(key, flush=False)
+    cache.flush()
+
+
+async def _acached_query(api_key: str, kind: str, artist_name: str, prompt: str) -> Optional[str]:
+    text = await _aquery_openai(api_key, prompt)
+    if text:
+        _cache_put(kind, artist_name, text)
+    return text
+
+
+def _lookup_many(
+    kind: str,
+    artist_names: List[str],
+    api_key: str,
+    build_prompt,
+    prefetched: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict[str, Optional[str]]:
+    """Return raw answers for *artist_names*, querying only cache misses.
+
+    Answers in *prefetched* (e.g. from a batch run) count as hits.
+    """
+    raw: Dict[str, Optional[str]] = {}
+    misses: List[str] = []
+    for name in artist_names:
+        cached = (prefetched or {}).get(name) or _cache_get(kind, name)
+        if cached is not None:
+            raw[name] = cached
+        elif name not in misses:
+            misses.append(name)
+    if misses:
+        logger.info("OpenAI %s: %d cached, %d to query", kind, len(raw), len(misses))
+
+        async def _gather():
+            return await asyncio.gather(
+                *(_acached_query(api_key, kind, n, build_prompt(n)) for n in misses)
+            )
+
+        for name, text in zip(misses, _get_client_loop().run(_gather())):
+            raw[name] = text
+        # Once per call, on the caller's thread rather than the client loop.
+        _cache_flush()
+    return raw
+
+
+# ── Tour link / venue type ───────────────────────────────────────────────────
+
+
+def _tour_link_prompt(artist_name: str) -> str:
+    return (
         f'Search the web for the official tour page or official website '
         f'of the artist "{artist_name}". '
         f'Return ONLY the URL. No text, no explanation, no markdown. '
         f'Just the raw URL.'
     )
-    url = _query_openai(api_key, prompt)
+
+
+def _venue_type_prompt(artist_name: str) -> str:
+    return (
+        f'Search the web for venue types where "{artist_name}" most '
+        f'frequently performs. Return ONLY the venue type. '
+        f'No text, no explanation, no markdown. Just the raw venue type.'
+    )
+
+
+def _venue_class_prompt(venue: str) -> str:
+    return (
+        f'Search the web for the concert capacity of the venue "{venue}". '
+        f'Return ONLY the venue type (one of Club, Theater, Amphitheater, '
+        f'Arena, Stadium) and the capacity as a number, separated by "|", '
+        f'e.g. "Arena|19000". No text, no explanation, no markdown.'
+    )
+
+
+def _parse_tour_link(artist_name: str, url: Optional[str]) -> Optional[str]:
     if not url:
         return None
 
@@ -80,15 +263,96 @@ def get_tour_link(artist_name: str, api_key: str) -> Optional[str]:
     return domain if "." in domain else url  # return anyway — user can review
 
 
+def get_tour_link(artist_name: str, api_key: str) -> Optional[str]:
+    """Return the official tour page / website URL for *artist_name*."""
+    logger.info("Fetching tour link for %s", artist_name)
+    return get_tour_links([artist_name], api_key)[artist_name]
+
+
+def get_tour_links(
+    artist_names: List[str],
+    api_key: str,
+    prefetched: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict[str, Optional[str]]:
+    """Return tour links for several artists, querying concurrently."""
+    raw = _lookup_many(KIND_TOUR_LINK, artist_names, api_key, _tour_link_prompt, prefetched)
+    return {name: _parse_tour_link(name, raw.get(name)) for name in artist_names}
+
+
 def get_venue_type(artist_name: str, api_key: str) -> Optional[str]:
     """Return the venue type the artist most frequently performs at."""
     logger.info("Fetching venue type for %s", artist_name)
-    prompt = (
-        f'Search the web for venue types where "{artist_name}" most '
-        f'frequently performs. Return ONLY the venue type. '
-        f'No text, no explanation, no markdown. Just the raw venue type.'
-    )
-    result = _query_openai(api_key, prompt)
-    if result:
-        logger.info("Venue type for %s: %s", artist_name, result)
-    return result
+    return get_venue_types([artist_name], api_key)[artist_name]
+
+
+def get_venue_types(
+    artist_names: List[str],
+    api_key: str,
+    prefetched: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict[str, Optional[str]]:
+    """Return venue types for several artists, querying concurrently."""
+    raw = _lookup_many(KIND_VENUE_TYPE, artist_names, api_key, _venue_type_prompt, prefetched)
+    for name in artist_names:
+        if raw.get(name):
+            logger.info("Venue type for %s: %s", name, raw[name])
+    return {name: raw.get(name) for name in artist_names}
+
+
+def get_venue_classes(
+    venues: List[str],
+    api_key: str,
+    prefetched: Optional[Dict[str, Optional[str]]] = None,
+) -> Dict[str, Optional[str]]:
+    """Return raw ``"<type>|<capacity>"`` answers for venues missing from the catalog.
+
+    *venues* are ``"Venue, City, State"`` labels.
+    """
+    raw = _lookup_many(KIND_VENUE_CLASS, venues, api_key, _venue_class_prompt, prefetched)
+    return {venue: raw.get(venue) for venue in venues}
+
+
+_PROMPT_BUILDERS = {
+    KIND_TOUR_LINK: _tour_link_prompt,
+    KIND_VENUE_TYPE: _venue_type_prompt,
+    KIND_VENUE_CLASS: _venue_class_prompt,
+}
+
+
+def prefetch_batch(
+    artists_by_kind: Dict[str, List[str]],
+    api_key: str,
+    transport=None,
+    heartbeat=None,
+) -> Dict[str, Dict[str, Optional[str]]]:
+    """Answer every uncached ``(kind, artist)`` pair in one Batch API run.
+
+    *artists_by_kind* maps ``"tour_link"`` / ``"venue_type"`` to artist
+    names (``"venue_class"`` to venue labels). Returns ``{kind: {artist: raw_text}}`` to pass as ``prefetched``
+    to :func:`get_tour_links` / :func:`get_venue_types` /
+    :func:`get_venue_classes`; anything the batch
+    could not answer is then queried interactively. *heartbeat* is called
+    with the batch status after every poll.
+    """
+    from .openai_batch import batch_lookup
+
+    requests = {
+        kind: [
+            (name, _PROMPT_BUILDERS[kind](name))
+            for name in dict.fromkeys(names)
+            if _cache_get(kind, name) is None
+        ]
+        for kind, names in artists_by_kind.items()
+    }
+    if not any(requests.values()):
+        return {kind: {} for kind in artists_by_kind}
+    try:
+        answers = batch_lookup(requests, api_key, transport=transport, heartbeat=heartbeat)
+    except Exception as exc:
+        logger.warning("OpenAI batch failed; falling back to interactive calls: %s", exc)
+        return {kind: {} for kind in artists_by_kind}
+    for kind, by_artist in answers.items():
+        for name, text in by_artist.items():
+            if text:
+                _cache_put(kind, name, text)
+    _cache_flush()
+    return answers
@@ -0,0 +1,305 @@
+"""
+Scored pool of HTTP proxies for the Ticketmaster scraper.
+
+Candidates come from ``proxy_list.txt`` and a handful of free online lists.
+They are health-checked concurrently against Ticketmaster and every result
+is folded into a persisted score (success rate, latency, last check), so a
+known-good proxy is available instantly instead of after minutes of serial
+probing. An optional background refresher keeps the pool current.
+"""
+
+import logging
+import os
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+from ..config import settings
+from ..storage import JsonStore, cache_path
+
+logger = logging.getLogger(__name__)
+
+PROXY_CHECK_URL = "https://www.ticketmaster.com/"
+PROXY_POOL_FILE = "proxy_pool.json"
+LATENCY_SMOOTHING = 0.3  # weight of the newest sample in the latency EWMA
+# A failed proxy is not retested for this long; one that failed this many
+# checks in a row, or was not checked for this many days, is dropped.
+PROXY_FAILURE_COOLDOWN_MINUTES = 120
+PROXY_MAX_FAILURE_STREAK = 3
+PROXY_STALE_DAYS = 7
+
+FREE_PROXY_APIS = [
+    "https://api.proxyscrape.com/v4/free-proxy-list/get?request=display_proxies&proxy_format=protocolipport&format=text&protocol=http&timeout=5000",
+    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt",
+    "https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/http.txt",
+    "https://raw.githubusercontent.com/clarketm/proxy-list/master/proxy-list-raw.txt",
+    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/http.txt",
+    "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/http_proxies.txt",
+]
+
+_PROXY_ADDR_RE = re.compile(r"^\d+\.\d+\.\d+\.\d+:\d+$")
+_CHECK_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/144.0.0.0 Safari/537.36"
+    ),
+}
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CANDIDATE SOURCES
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+def _is_usable_addr(line: str) -> bool:
+    return bool(_PROXY_ADDR_RE.match(line)) and not (
+        line.startswith("0.0.0.0") or line.startswith("127.0.0")
+    )
+
+
+def _load_local_proxies(proxy_list_file: str) -> List[str]:
+    """Load proxies from a local text file."""
+    proxies = []
+    if os.path.isfile(proxy_list_file):
+        with open(proxy_list_file, "r") as f:
+            for line in f:
+                line = line.strip()
+                if line and _is_usable_addr(line):
+                    proxies.append(line)
+        logger.info("Loaded %d proxies from %s", len(proxies), proxy_list_file)
+    return proxies
+
+
+def _fetch_proxy_list(api_url: str) -> List[str]:
+    try:
+        resp = requests.get(api_url, timeout=10)
+    except Exception:
+        return []
+    if resp.status_code != 200:
+        return []
+    found = []
+    for line in resp.text.strip().splitlines():
+        line = re.sub(r"^https?://", "", line.strip())
+        if _is_usable_addr(line):
+            found.append(line)
+    return found
+
+
+def _fetch_fresh_proxies() -> List[str]:
+    """Fetch proxy lists from all free APIs concurrently."""
+    all_proxies: set = set()
+    with ThreadPoolExecutor(max_workers=len(FREE_PROXY_APIS)) as pool:
+        for found in pool.map(_fetch_proxy_list, FREE_PROXY_APIS):
+            all_proxies.update(found)
+    logger.info("Fetched %d unique online proxies", len(all_proxies))
+    return list(all_proxies)
+
+
+def _check_proxy(proxy_addr: str, timeout: float) -> Optional[float]:
+    """Return request latency in seconds if *proxy_addr* serves Ticketmaster."""
+    proxy_url = f"http://{proxy_addr}"
+    px = {"http": proxy_url, "https": proxy_url}
+    started = time.monotonic()
+    try:
+        r = requests.get(PROXY_CHECK_URL, proxies=px, headers=_CHECK_HEADERS, timeout=timeout)
+        if r.status_code == 200 and len(r.text) > 5000:
+            return time.monotonic() - started
+    except Exception:
+        pass
+    return None
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  POOL
+# ══════════════════════════════════════════════════════════════════════════════
+
+
+class ProxyPool:
+    """Persisted proxy health scores with concurrent checking.
+
+    Each entry is stored as ``{"successes", "failures", "failure_streak",
+    "latency_ms", "last_checked", "last_ok"}`` keyed by ``ip:port``.
+    """
+
+    def __init__(self, store: JsonStore, concurrency: int = 20, timeout: float = 10):
+        self._store = store
+        self.concurrency = max(1, int(concurrency))
+        self.timeout = timeout
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._refresher: Optional[threading.Thread] = None
+
+    # ── Scoring ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def score(entry: Dict) -> float:
+        """Higher is better: smoothed success rate discounted by latency."""
+        successes = entry.get("successes", 0)
+        failures = entry.get("failures", 0)
+        rate = (successes + 1) / (successes + failures + 2)
+        latency_s = (entry.get("latency_ms") or 0) / 1000
+        return rate / (1 + latency_s)
+
+    @staticmethod
+    def _failure_streak(entry: Dict) -> int:
+        # Entries persisted before streaks were tracked count their last
+        # failure as a streak of one.
+        return entry.get("failure_streak", 0 if entry.get("last_ok") else 1)
+
+    def record(self, proxy_addr: str, latency: Optional[float], flush: bool = True) -> None:
+        """Fold one check result (``None`` = failed) into the proxy's entry."""
+        entry = dict(self._store.get(proxy_addr) or {})
+        entry["last_checked"] = time.time()
+        entry["last_ok"] = latency is not None
+        if latency is None:
+            entry["failures"] = entry.get("failures", 0) + 1
+            entry["failure_streak"] = self._failure_streak(entry) + 1
+        else:
+            entry["successes"] = entry.get("successes", 0) + 1
+            entry["failure_streak"] = 0
+            sample_ms = latency * 1000
+            previous = entry.get("latency_ms")
+            entry["latency_ms"] = (
+                sample_ms if previous is None
+                else LATENCY_SMOOTHING * sample_ms + (1 - LATENCY_SMOOTHING) * previous
+            )
+        self._store.set(proxy_addr, entry, flush=flush)
+
+    def healthy(self, max_age_minutes: Optional[int] = None) -> List[str]:
+        """Return recently-verified proxies, best first."""
+        max_age = max_age_minutes if max_age_minutes is not None else settings.proxy_max_age_minutes
+        cutoff = time.time() - max(1, int(max_age)) * 60
+        good = [
+            (self.score(entry), addr)
+            for addr, entry in self._store.items()
+            if entry.get("last_ok") and entry.get("last_checked", 0) >= cutoff
+        ]
+        good.sort(reverse=True)
+        return [addr for _, addr in good]
+
+    def best(self) -> Optional[str]:
+        """Return the highest-scoring healthy proxy, or ``None``."""
+        healthy = self.healthy()
+        return healthy[0] if healthy else None
+
+    def snapshot(self) -> Dict[str, Dict]:
+        return dict(self._store.items())
+
+    # ── Checking ─────────────────────────────────────────────────────────
+
+    def check(self, candidates: List[str]) -> List[str]:
+        """Check *candidates* concurrently; return the ones that passed."""
+        if not candidates:
+            return []
+        workers = min(self.concurrency, len(candidates))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            latencies = list(
+                pool.map(lambda addr: _check_proxy(addr, self.timeout), candidates)
+            )
+        passed = []
+        for addr, latency in zip(candidates, latencies):
+            self.record(addr, latency, flush=False)
+            if latency is not None:
+                passed.append(addr)
+        self._store.flush()
+        logger.info("Proxy check: %d/%d candidates healthy", len(passed), len(candidates))
+        return passed
+
+    def _select_candidates(self, addrs: List[str], max_tests: int) -> List[str]:
+        """Pick proxies to check: recently-passed ones best first, then others.
+
+        Remaining slots go to untested proxies and to known ones whose last
+        check is old enough to retry; proxies that failed within
+        ``PROXY_FAILURE_COOLDOWN_MINUTES`` are skipped.
+        """
+        now = time.time()
+        fresh_cutoff = now - max(1, int(settings.proxy_max_age_minutes)) * 60
+        retry_cutoff = now - PROXY_FAILURE_COOLDOWN_MINUTES * 60
+        known = dict(self._store.items())
+        passed, retry, unseen = [], [], []
+        for addr in dict.fromkeys(addrs):
+            entry = known.get(addr)
+            if entry is None:
+                unseen.append(addr)
+            elif entry.get("last_ok"):
+                if entry.get("last_checked", 0) >= fresh_cutoff:
+                    passed.append(addr)
+                else:
+                    retry.append(addr)
+            elif entry.get("last_checked", 0) < retry_cutoff:
+                retry.append(addr)
+        passed.sort(key=lambda a: self.score(known[a]), reverse=True)
+        retry.sort(key=lambda a: self.score(known[a]), reverse=True)
+        random.shuffle(unseen)
+        return (passed + retry + unseen)[: max(1, int(max_tests))]
+
+    def prune(self) -> int:
+        """Drop proxies that keep failing or were not checked for too long."""
+        stale_cutoff = time.time() - PROXY_STALE_DAYS * 86400
+        dropped = [
+            addr for addr, entry in self._store.items()
+            if self._failure_streak(entry) >= PROXY_MAX_FAILURE_STREAK
+            or entry.get("last_checked", 0) < stale_cutoff
+        ]
+        for addr in dropped:
+            self._store.pop(addr, flush=False)
+        if dropped:
+            self._store.flush()
+            logger.info("Proxy pool: pruned %d failing/stale proxies", len(dropped))
+        return len(dropped)
+
+    def refresh(self, proxy_list_file: str, max_tests: int) -> Optional[str]:
+        """Re-check local candidates, then online ones if none are healthy."""
+        with self._refresh_lock:
+            local = _load_local_proxies(proxy_list_file)
+            self.check(self._select_candidates(local, max_tests))
+            if not self.healthy():
+                online = _fetch_fresh_proxies()
+                self.check(self._select_candidates(online, max_tests))
+            self.prune()
+            return self.best()
+
+    # ── Background refresher ─────────────────────────────────────────────
+
+    def start_refresher(self, interval_minutes: int, proxy_list_file: str, max_tests: int) -> None:
+        if self._refresher and self._refresher.is_alive():
+            return
+        self._stop.clear()
+
+        def _loop():
+            while not self._stop.is_set():
+                try:
+                    self.refresh(proxy_list_file, max_tests)
+                except Exception as exc:
+                    logger.warning("Proxy pool refresh failed: %s", exc)
+                self._stop.wait(max(1, int(interval_minutes)) * 60)
+
+        self._refresher = threading.Thread(target=_loop, name="proxy-pool-refresher", daemon=True)
+        self._refresher.start()
+        logger.info("Proxy pool refresher started (every %d min)", interval_minutes)
+
+    def stop_refresher(self) -> None:
+        self._stop.set()
+
+
+_pool: Optional[ProxyPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_proxy_pool() -> ProxyPool:
+    """Return the process-wide proxy pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProxyPool(
+                JsonStore(cache_path(PROXY_POOL_FILE)),
+                concurrency=settings.proxy_check_concurrency,
+                timeout=settings.proxy_check_timeout_seconds,
+            )
+        return _pool
@@ -0,0 +1,245 @@
+"""
+Shared local relay for authenticated upstream proxies.
+
+undetected-chromedriver strips extension-based proxy auth in Chrome 145+,
+so drivers point ``--proxy-server`` at a local relay that injects the
+``Proxy-Authorization`` header. One relay per upstream proxy is shared by
+every driver, and all relays run on a single asyncio event loop in one
+daemon thread. Each connection has bounded buffers and is closed once
+neither direction has moved data for ``RELAY_IDLE_TIMEOUT_SECONDS`` (a long
+download with a silent client stays open), and relays are closed cleanly
+on shutdown.
+"""
+
+import asyncio
+import atexit
+import base64
+import logging
+import threading
+from typing import Dict, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+RELAY_BUFFER_BYTES = 64 * 1024
+RELAY_IDLE_TIMEOUT_SECONDS = 120
+RELAY_CONNECT_TIMEOUT_SECONDS = 30
+RELAY_START_TIMEOUT_SECONDS = 10
+
+_HOP_BY_HOP_HEADERS = (b"proxy-connection:", b"connection:", b"proxy-authorization:")
+
+
+class _RelayLoop:
+    """Event loop running forever in a daemon thread."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="proxy-relay-loop", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def call(self, coro, timeout: Optional[float] = None):
+        """Run *coro* on the loop from another thread and return its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+
+class ProxyRelay:
+    """Local HTTP proxy that forwards to one authenticated upstream proxy."""
+
+    def __init__(self, upstream_host: str, upstream_port: int, username: str, password: str):
+        self.upstream_host = upstream_host
+        self.upstream_port = upstream_port
+        self.port: int = 0
+        self._auth_header = base64.b64encode(f"{username}:{password}".encode()).decode()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._writers: Set[asyncio.StreamWriter] = set()
+
+    # ── Lifecycle (run on the relay loop) ────────────────────────────────
+
+    async def start(self) -> int:
+        self._server = await asyncio.start_server(
+            self._handle_client, "127.0.0.1", 0, limit=RELAY_BUFFER_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(
+            "Proxy relay started on 127.0.0.1:%d → %s:%d",
+            self.port, self.upstream_host, self.upstream_port,
+        )
+        return self.port
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+        for writer in list(self._writers):
+            writer.close()
+        if self._server:
+            await self._server.wait_closed()
+            self._server = None
+        logger.info("Proxy relay on :%d closed", self.port)
+
+    # ── Connection handling ──────────────────────────────────────────────
+
+    def _track(self, writer: asyncio.StreamWriter) -> asyncio.StreamWriter:
+        writer.transport.set_write_buffer_limits(high=RELAY_BUFFER_BYTES)
+        self._writers.add(writer)
+        return writer
+
+    def _release(self, *writers: Optional[asyncio.StreamWriter]) -> None:
+        for writer in writers:
+            if writer is None:
+                continue
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _handle_client(self, client_reader, client_writer):
+        self._track(client_writer)
+        upstream_writer = None
+        try:
+            raw = await asyncio.wait_for(
+                client_reader.readuntil(b"\r\n\r\n"), RELAY_IDLE_TIMEOUT_SECONDS
+            )
+            parts = raw.split(b"\r\n", 1)[0].decode("utf-8", errors="replace").split()
+            method = parts[0] if parts else ""
+
+            upstream_reader, upstream_writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.upstream_host, self.upstream_port, limit=RELAY_BUFFER_BYTES
+                ),
+                RELAY_CONNECT_TIMEOUT_SECONDS,
+            )
+            self._track(upstream_writer)
+
+            if method == "CONNECT":
+                # HTTPS tunneling — send CONNECT to upstream with auth
+                target = parts[1] if len(parts) > 1 else ""
+                upstream_writer.write(
+                    (
+                        f"CONNECT {target} HTTP/1.1\r\n"
+                        f"Host: {target}\r\n"
+                        f"Proxy-Authorization: Basic {self._auth_header}\r\n"
+                        f"\r\n"
+                    ).encode()
+                )
+                await upstream_writer.drain()
+                resp = await asyncio.wait_for(
+                    upstream_reader.readuntil(b"\r\n\r\n"), RELAY_CONNECT_TIMEOUT_SECONDS
+                )
+                if b" 200" not in resp.split(b"\r\n", 1)[0]:
+                    client_writer.write(resp)
+                    await client_writer.drain()
+                    return
+                client_writer.write(b"HTTP/1.1 200 Connection established\r\n\r\n")
+                await client_writer.drain()
+            else:
+                # Plain HTTP — inject auth and force one request per connection,
+                # since later keep-alive requests would reach upstream unauthenticated.
+                upstream_writer.write(self._rewrite_request_head(raw))
+                await upstream_writer.drain()
+
+            await self._relay_both_ways(
+                client_reader, client_writer, upstream_reader, upstream_writer
+            )
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            pass
+        except (ConnectionError, OSError) as exc:
+            logger.debug("Proxy relay connection error: %s", exc)
+        finally:
+            self._release(client_writer, upstream_writer)
+
+    def _rewrite_request_head(self, raw: bytes) -> bytes:
+        lines = raw[: -len(b"\r\n\r\n")].split(b"\r\n")
+        kept = [lines[0]] + [
+            line for line in lines[1:]
+            if not line.lower().startswith(_HOP_BY_HOP_HEADERS)
+        ]
+        kept.append(f"Proxy-Authorization: Basic {self._auth_header}".encode())
+        kept.append(b"Connection: close")
+        return b"\r\n".join(kept) + b"\r\n\r\n"
+
+    @staticmethod
+    async def _pipe(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter, activity: Dict[str, float]
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            data = await reader.read(RELAY_BUFFER_BYTES)
+            if not data:
+                break
+            activity["last"] = loop.time()
+            writer.write(data)
+            await writer.drain()  # backpressure keeps the write buffer bounded
+            activity["last"] = loop.time()
+
+    async def _relay_both_ways(self, client_reader, client_writer, upstream_reader, upstream_writer):
+        """Pipe both directions until one ends or the connection as a whole goes idle."""
+        loop = asyncio.get_running_loop()
+        activity = {"last": loop.time()}
+        tasks = [
+            asyncio.ensure_future(self._pipe(client_reader, upstream_writer, activity)),
+            asyncio.ensure_future(self._pipe(upstream_reader, client_writer, activity)),
+        ]
+        try:
+            while True:
+                idle = loop.time() - activity["last"]
+                if idle >= RELAY_IDLE_TIMEOUT_SECONDS:
+                    break
+                done, _ = await asyncio.wait(
+                    tasks,
+                    timeout=RELAY_IDLE_TIMEOUT_SECONDS - idle,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if done:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SHARED REGISTRY
+# ══════════════════════════════════════════════════════════════════════════════
+
+_loop: Optional[_RelayLoop] = None
+_relays: Dict[Tuple[str, int, str, str], ProxyRelay] = {}
+_registry_lock = threading.Lock()
+
+
+def get_relay(upstream_host: str, upstream_port: int, username: str, password: str) -> ProxyRelay:
+    """Return the running relay for this upstream, starting it on first use."""
+    global _loop
+    key = (upstream_host, int(upstream_port), username, password)
+    with _registry_lock:
+        relay = _relays.get(key)
+        if relay:
+            return relay
+        if _loop is None:
+            _loop = _RelayLoop()
+        relay = ProxyRelay(upstream_host, int(upstream_port), username, password)
+        _loop.call(relay.start(), timeout=RELAY_START_TIMEOUT_SECONDS)
+        _relays[key] = relay
+        return relay
+
+
+def shutdown_relays() -> None:
+    """Close every relay and stop the relay event loop."""
+    global _loop
+    with _registry_lock:
+        relays = list(_relays.values())
+        _relays.clear()
+        loop, _loop = _loop, None
+    if loop is None:
+        return
+    for relay in relays:
+        try:
+            loop.call(relay.close(), timeout=RELAY_START_TIMEOUT_SECONDS)
+        except Exception as exc:
+            logger.warning("Error closing proxy relay :%d: %s", relay.port, exc)
+    loop.loop.call_soon_threadsafe(loop.loop.stop)
+
+
+atexit.register(shutdown_relays)
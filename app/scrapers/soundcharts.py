@@ -17,11 +17,24 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from .chrome import apply_resource_blocking
+
 logger = logging.getLogger(__name__)
 
 LOGIN_URL = "https://app.soundcharts.com/login"
 SEARCH_URL = "https://app.soundcharts.com/app/search?page=all&search="
 
+# Profile links that are never the artist's own website.
+NON_WEBSITE_DOMAINS = (
+    "soundcharts.com", "instagram.com", "facebook.com", "twitter.com", "x.com",
+    "tiktok.com", "youtube.com", "youtu.be", "spotify.com", "apple.com",
+    "deezer.com", "soundcloud.com", "bandcamp.com", "tidal.com", "amazon.com",
+    "pandora.com", "shazam.com", "bandsintown.com", "songkick.com",
+    "ticketmaster.com", "livenation.com", "wikipedia.org", "wikidata.org",
+    "discogs.com", "musicbrainz.org", "genius.com", "last.fm", "snapchat.com",
+    "threads.net", "twitch.tv", "vk.com", "weibo.com", "linktr.ee", "google.com",
+)
+
 
 class SoundchartsScraper:
     """Manage a browser session for scraping Soundcharts artist data."""
@@ -43,6 +56,7 @@ class SoundchartsScraper:
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
         self.driver = webdriver.Chrome(options=options)
+        apply_resource_blocking(self.driver, "soundcharts")
         logger.info(
             "Chrome started (headless=%s)", self.headless
         )
@@ -249,22 +263,68 @@ class SoundchartsScraper:
         logger.warning("No Instagram link found on profile")
         return None
 
+    # ── Extract website link ─────────────────────────────────────────────
+
+    def extract_website_link(self) -> Optional[str]:
+        """Return the artist's official website from the profile links.
+
+        Social / streaming / ticketing links are skipped, and only a link
+        labelled "website", "official" or "homepage" counts; otherwise
+        ``None`` is returned so the tour link is looked up with OpenAI.
+        """
+        try:
+            links = self.driver.execute_script(
+                """
+                return Array.from(document.querySelectorAll('a[href^="http"]'))
+                    .filter(a => !a.closest('nav, header, footer'))
+                    .map(a => ({
+                        href: a.href,
+                        label: [
+                            a.innerText, a.title, a.getAttribute('aria-label'),
+                            a.closest('[class]') ? a.closest('[class]').className : '',
+                        ].join(' '),
+                    }));
+                """
+            ) or []
+        except Exception as exc:
+            logger.debug("Could not read profile links: %s", exc)
+            return None
+
+        for link in links:
+            href = link.get("href") or ""
+            host = (urllib.parse.urlparse(href).hostname or "").lower()
+            if host.startswith("www."):
+                host = host[4:]
+            if not host or any(
+                host == d or host.endswith("." + d) for d in NON_WEBSITE_DOMAINS
+            ):
+                continue
+            if re.search(r"website|official|homepage", str(link.get("label") or ""), re.I):
+                logger.info("Website link: %s", href)
+                return href
+        logger.info("No labelled website link on profile")
+        return None
+
     # ── Public: process a single artist ──────────────────────────────────
 
     def process_artist(
-        self, artist_name: str
-    ) -> Tuple[Dict[str, str], Optional[str], str]:
+        self, artist_name: str, known_ig_username: Optional[str] = None
+    ) -> Tuple[Dict[str, str], Optional[str], str, Optional[str]]:
         """
-        Search → profile → extract followers + IG username.
+        Search → profile → extract followers + IG username + website.
+
+        If *known_ig_username* is given, the IG link lookup is skipped and
+        that handle is returned instead.
 
         Returns
         -------
-        (follower_data, ig_username, soundcharts_url)
+        (follower_data, ig_username, soundcharts_url, website)
         """
         if not self.search_artist(artist_name):
-            return {}, None, ""
+            return {}, None, "", None
 
         sc_url = self.driver.current_url
         follower_data = self.extract_follower_data()
-        ig_username = self.extract_ig_username()
-        return follower_data, ig_username, sc_url
+        ig_username = known_ig_username or self.extract_ig_username()
+        website = self.extract_website_link()
+        return follower_data, ig_username, sc_url, website
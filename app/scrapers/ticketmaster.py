@@ -5,19 +5,25 @@ Searches an artist on ticketmaster.com, navigates to their page,
 and scrapes all listed concert / event details.
 """
 
+import hashlib
 import logging
-import random
+import queue
 import re
+import threading
 import time
 from typing import Dict, List, Optional, Union
 
-import requests
 import undetected_chromedriver as uc
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+from ..storage import JsonStore, cache_path
+from .chrome import apply_resource_blocking, launch_chrome
+from .proxy_pool import get_proxy_pool
+from .proxy_relay import get_relay
+
 logger = logging.getLogger(__name__)
 
 TICKETMASTER_URL = "https://www.ticketmaster.com/"
@@ -30,93 +36,19 @@ TM_COUNTRY_DOMAINS = {
     "UK": "ticketmaster.co.uk",
 }
 
-FREE_PROXY_APIS = [
-    "https://api.proxyscrape.com/v4/free-proxy-list/get?request=display_proxies&proxy_format=protocolipport&format=text&protocol=http&timeout=5000",
-    "https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt",
-    "https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/http.txt",
-    "https://raw.githubusercontent.com/clarketm/proxy-list/master/proxy-list-raw.txt",
-    "https://raw.githubusercontent.com/mmpx12/proxy-list/master/http.txt",
-    "https://raw.githubusercontent.com/sunny9577/proxy-scraper/master/generated/http_proxies.txt",
-]
-
-
 # ══════════════════════════════════════════════════════════════════════════════
 #  PROXY HELPERS
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def _load_local_proxies(proxy_list_file: str) -> List[str]:
-    """Load proxies from a local text file."""
-    import os
-
-    proxies = []
-    if os.path.isfile(proxy_list_file):
-        with open(proxy_list_file, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line and re.match(r"^\d+\.\d+\.\d+\.\d+:\d+$", line):
-                    if not line.startswith("0.0.0.0") and not line.startswith("127.0.0"):
-                        proxies.append(line)
-        logger.info("Loaded %d proxies from %s", len(proxies), proxy_list_file)
-    return proxies
-
-
-def _fetch_fresh_proxies() -> List[str]:
-    """Fetch proxy lists from multiple free APIs."""
-    all_proxies: set = set()
-    for api_url in FREE_PROXY_APIS:
-        try:
-            resp = requests.get(api_url, timeout=10)
-            if resp.status_code == 200:
-                for line in resp.text.strip().splitlines():
-                    line = re.sub(r"^https?://", "", line.strip())
-                    if re.match(r"^\d+\.\d+\.\d+\.\d+:\d+$", line):
-                        if not line.startswith("0.0.0.0") and not line.startswith("127.0.0"):
-                            all_proxies.add(line)
-        except Exception:
-            pass
-    logger.info("Fetched %d unique online proxies", len(all_proxies))
-    return list(all_proxies)
-
-
-def _test_proxies(proxies: List[str], max_tests: int) -> Optional[str]:
-    """Test proxies against Ticketmaster; return first working one."""
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/144.0.0.0 Safari/537.36"
-        ),
-    }
-    random.shuffle(proxies)
-    for i, proxy_addr in enumerate(proxies[: max_tests]):
-        proxy_url = f"http://{proxy_addr}"
-        px = {"http": proxy_url, "https": proxy_url}
-        try:
-            r = requests.get(TICKETMASTER_URL, proxies=px, headers=headers, timeout=10)
-            if r.status_code == 200 and len(r.text) > 5000:
-                logger.info("Working proxy found: %s", proxy_addr)
-                return proxy_addr
-        except Exception:
-            pass
-    return None
-
-
 def find_working_proxy(proxy_list_file: str = "proxy_list.txt", max_tests: int = 40) -> Optional[str]:
-    """Try local file first, then online sources. Returns working proxy or None."""
-    local = _load_local_proxies(proxy_list_file)
-    if local:
-        result = _test_proxies(local, max_tests)
-        if result:
-            return result
-
-    online = _fetch_fresh_proxies()
-    if online:
-        result = _test_proxies(online, max_tests)
-        if result:
-            return result
+    """Return a known-good proxy from the scored pool, checking candidates if needed.
 
-    return None
+    Local candidates are tried first, then online sources. Returns ``None``
+    when no candidate passes.
+    """
+    pool = get_proxy_pool()
+    return pool.best() or pool.refresh(proxy_list_file, max_tests)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -137,14 +69,9 @@ def _parse_proxy(proxy_str: str):
 def _create_driver(chrome_version: int = 0, proxy_str: Optional[str] = None) -> uc.Chrome:
     """Create an undetected Chrome driver, optionally with an authenticated proxy.
 
-    Uses a local relay thread for authenticated proxies since UC strips
+    Uses the shared local relay for authenticated proxies since UC strips
     extension-based proxy auth in Chrome 145+.
     """
-    import base64
-    import socket
-    import select
-    import threading
-
     options = uc.ChromeOptions()
     options.add_argument("--headless=new")
     options.add_argument("--window-size=1920,1080")
@@ -154,15 +81,12 @@ def _create_driver(chrome_version: int = 0, proxy_str: Optional[str] = None) ->
     options.add_argument("--disable-crash-reporter")
     options.add_argument("--disable-blink-features=AutomationControlled")
 
-    relay_thread = None
-    relay_port = None
-
     if proxy_str:
         parsed = _parse_proxy(proxy_str)
         if parsed:
             host, port, user, pwd = parsed
             if user and pwd:
-                # Start a local proxy relay to handle auth with upstream
+                # Route through the shared local relay that adds upstream auth
                 relay_port = _start_proxy_relay(host, int(port), user, pwd)
                 options.add_argument(f"--proxy-server=http://127.0.0.1:{relay_port}")
                 logger.info(
@@ -173,11 +97,8 @@ def _create_driver(chrome_version: int = 0, proxy_str: Optional[str] = None) ->
                 options.add_argument(f"--proxy-server=http://{host}:{port}")
                 logger.info("Using open proxy %s:%s", host, port)
 
-    kwargs = {"options": options}
-    if chrome_version:
-        kwargs["version_main"] = chrome_version
-
-    driver = uc.Chrome(**kwargs)
+    driver = launch_chrome(options, chrome_version)
+    apply_resource_blocking(driver, "ticketmaster")
     try:
         from ..config import settings
 
@@ -192,125 +113,11 @@ def _create_driver(chrome_version: int = 0, proxy_str: Optional[str] = None) ->
 
 def _start_proxy_relay(upstream_host: str, upstream_port: int,
                        username: str, password: str) -> int:
-    """Start a local HTTP proxy that relays to an authenticated upstream proxy.
+    """Return the local port of the shared relay for an authenticated upstream proxy.
 
-    Returns the local port number. The relay runs in daemon threads.
+    The relay is started on first use and reused by every later driver.
     """
-    import base64
-    import socket
-    import select
-    import threading
-    import struct
-
-    auth_header = base64.b64encode(f"{username}:{password}".encode()).decode()
-
-    server_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    server_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-    server_sock.bind(("127.0.0.1", 0))
-    local_port = server_sock.getsockname()[1]
-    server_sock.listen(32)
-
-    def _pipe(src, dst):
-        try:
-            while True:
-                data = src.recv(65536)
-                if not data:
-                    break
-                dst.sendall(data)
-        except Exception:
-            pass
-        finally:
-            try:
-                src.close()
-            except Exception:
-                pass
-            try:
-                dst.close()
-            except Exception:
-                pass
-
-    def _handle_client(client_sock):
-        try:
-            raw = b""
-            while b"\r\n\r\n" not in raw:
-                chunk = client_sock.recv(4096)
-                if not chunk:
-                    client_sock.close()
-                    return
-                raw += chunk
-
-            first_line = raw.split(b"\r\n")[0].decode("utf-8", errors="replace")
-            parts = first_line.split()
-            method = parts[0] if parts else ""
-
-            # Connect to upstream proxy
-            upstream = socket.create_connection((upstream_host, upstream_port), timeout=30)
-
-            if method == "CONNECT":
-                # HTTPS tunneling — send CONNECT to upstream with auth
-                target = parts[1] if len(parts) > 1 else ""
-                connect_req = (
-                    f"CONNECT {target} HTTP/1.1\r\n"
-                    f"Host: {target}\r\n"
-                    f"Proxy-Authorization: Basic {auth_header}\r\n"
-                    f"\r\n"
-                ).encode()
-                upstream.sendall(connect_req)
-
-                # Read upstream response
-                resp = b""
-                while b"\r\n\r\n" not in resp:
-                    chunk = upstream.recv(4096)
-                    if not chunk:
-                        break
-                    resp += chunk
-
-                if b"200" in resp.split(b"\r\n")[0]:
-                    client_sock.sendall(b"HTTP/1.1 200 Connection established\r\n\r\n")
-                    # Bidirectional relay
-                    t1 = threading.Thread(target=_pipe, args=(client_sock, upstream), daemon=True)
-                    t2 = threading.Thread(target=_pipe, args=(upstream, client_sock), daemon=True)
-                    t1.start()
-                    t2.start()
-                    t1.join()
-                    t2.join()
-                else:
-                    client_sock.sendall(resp)
-                    client_sock.close()
-                    upstream.close()
-            else:
-                # HTTP request — inject auth header and forward
-                header_end = raw.index(b"\r\n\r\n")
-                headers_part = raw[:header_end]
-                body_part = raw[header_end:]
-                # Inject Proxy-Authorization header
-                auth_line = f"Proxy-Authorization: Basic {auth_header}".encode()
-                modified = headers_part + b"\r\n" + auth_line + body_part
-                upstream.sendall(modified)
-
-                # Relay the response back
-                _pipe(upstream, client_sock)
-
-        except Exception:
-            try:
-                client_sock.close()
-            except Exception:
-                pass
-
-    def _accept_loop():
-        while True:
-            try:
-                client_sock, _ = server_sock.accept()
-                threading.Thread(
-                    target=_handle_client, args=(client_sock,), daemon=True
-                ).start()
-            except Exception:
-                break
-
-    thread = threading.Thread(target=_accept_loop, daemon=True)
-    thread.start()
-    logger.info("Proxy relay started on 127.0.0.1:%d → %s:%d", local_port, upstream_host, upstream_port)
-    return local_port
+    return get_relay(upstream_host, upstream_port, username, password).port
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -456,9 +263,17 @@ def _search_artist(driver, artist_name: str, tm_country: str = "USA") -> bool:
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def _click_load_more(driver, max_clicks: int = 100):
-    """Click 'More Events' until all domestic events are loaded."""
+def _click_load_more(driver, max_clicks: int = 100, stop_when=None) -> bool:
+    """Click 'More Events' until all domestic events are loaded.
+
+    *stop_when* is an optional callable checked before each click; loading
+    stops early when it returns True. Returns True only once the button is
+    gone; False when stopped early, on an error or after *max_clicks*.
+    """
     for i in range(max_clicks):
+        if stop_when is not None and stop_when():
+            logger.info("Reached already-known events — stopping load")
+            return False
         try:
             # Look for "More Events" button specifically
             btn = driver.execute_script("""
@@ -473,7 +288,7 @@ def _click_load_more(driver, max_clicks: int = 100):
             """)
             if not btn:
                 logger.info("No more 'More Events' button found — all events loaded")
-                break
+                return True
             driver.execute_script(
                 "arguments[0].scrollIntoView({block:'center'});", btn
             )
@@ -484,19 +299,47 @@ def _click_load_more(driver, max_clicks: int = 100):
                 driver.execute_script("arguments[0].click();", btn)
             logger.info("Clicked 'More Events' (%d)", i + 1)
             time.sleep(3)
-        except Exception:
-            break
+        except Exception as exc:
+            logger.warning("Loading more events failed: %s", exc)
+            return False
+    logger.warning("Still a 'More Events' button after %d clicks", max_clicks)
+    return False
+
+
+# ── Event-block patterns (compiled once, dispatched by first character) ──
+
+_MONTHS = "JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC"
+_PRESALE_RE = re.compile(r"(?i)presale[:\s]*(.*)")
+_ONSALE_RE = re.compile(r"(?i)general\s+on[-\s]*sale[:\s]*(.*)")
+_MONTH_RE = re.compile(rf"^({_MONTHS})\b", re.IGNORECASE)
+_DAY_NUM_RE = re.compile(r"^\d{1,2}$")
+_DAY_TIME_RE = re.compile(
+    r"^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\w*\s*[•·\-]\s*(\d{1,2}:\d{2}\s*[APap][Mm])",
+    re.IGNORECASE,
+)
+_CITY_VENUE_RE = re.compile(r"^(.+?),\s*([A-Z]{2})\s*[•·\-]\s*(.+)$")
+# City, ST, Venue (comma-separated — newer TM layout)
+_CITY_COMMA_RE = re.compile(r"^(.+?),\s*([A-Z]{2})\s*,\s*(.+)$")
+_CITY_VENUE_INTL_RE = re.compile(r"^(.+?),\s*(.+?)\s*[•·\-]\s*(.+)$")
+_SALE_DATE_RE = re.compile(r"\d{2}/\d{2}/\d{4}")
+_HAPPENING_NOW_RE = re.compile(r"(?i)happening\s+now")
+_BLOCK_SPLIT_RE = re.compile(rf"\n(?=(?:{_MONTHS})\b)", re.IGNORECASE)
+
+# Case-folded first characters that can start each line kind. ``casefold``
+# mirrors the ``re.IGNORECASE`` folding, so these are cheap, exact gates.
+_MONTH_HEADS = frozenset("jfmasond")
+_DAY_HEADS = frozenset("mtwfs")
 
 
 def _parse_event_text(text: str, artist_name: str) -> Optional[List[str]]:
     """Parse a single event text block into a list of fields."""
-    lower = text.lower()
-    if 'on partner site' in lower:
+    if 'on partner site' in text.lower():
         return None
     lines = [l.strip() for l in text.splitlines() if l.strip()]
     if len(lines) < 2:
         return None
 
+    artist_lower = artist_name.lower()
     date_str = ""
     day_of_week = ""
     event_time = ""
@@ -509,90 +352,89 @@ def _parse_event_text(text: str, artist_name: str) -> Optional[List[str]]:
     onsale_date = ""
 
     for line in lines:
+        head = line[0].casefold()
+
         # PRESALE: 03/12/2026, 10:00 AM CDT  or  PRESALE HAPPENING NOW
-        pm = re.match(r"(?i)presale[:\s]*(.*)", line)
-        if pm:
-            presale_info = line.strip()
-            dp = pm.group(1).strip()
-            if re.search(r"\d{2}/\d{2}/\d{4}", dp):
-                presale_date = dp
-            elif re.search(r"(?i)happening\s+now", dp):
-                presale_date = "HAPPENING NOW"
-            continue
+        if head == "p":
+            pm = _PRESALE_RE.match(line)
+            if pm:
+                presale_info = line
+                dp = pm.group(1).strip()
+                if _SALE_DATE_RE.search(dp):
+                    presale_date = dp
+                elif _HAPPENING_NOW_RE.search(dp):
+                    presale_date = "HAPPENING NOW"
+                continue
 
         # GENERAL ONSALE: 03/13/2026, 10:00 AM GMT+1
-        om = re.match(r"(?i)general\s+on[-\s]*sale[:\s]*(.*)", line)
-        if om:
-            onsale_line = line.strip()
-            presale_info = (presale_info + " | " + onsale_line) if presale_info else onsale_line
-            dp = om.group(1).strip()
-            if re.search(r"\d{2}/\d{2}/\d{4}", dp):
-                onsale_date = dp
-            elif re.search(r"(?i)happening\s+now", dp):
-                onsale_date = "HAPPENING NOW"
-            continue
+        elif head == "g":
+            om = _ONSALE_RE.match(line)
+            if om:
+                presale_info = (presale_info + " | " + line) if presale_info else line
+                dp = om.group(1).strip()
+                if _SALE_DATE_RE.search(dp):
+                    onsale_date = dp
+                elif _HAPPENING_NOW_RE.search(dp):
+                    onsale_date = "HAPPENING NOW"
+                continue
 
-        month_match = re.match(
-            r"^(JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\b",
-            line,
-            re.IGNORECASE,
-        )
-        if month_match and not date_str:
-            rest = line[len(month_match.group(0)) :].strip()
-            if re.match(r"^\d{1,2}$", rest):
-                date_str = f"{month_match.group(0).upper()} {rest}"
-            else:
-                date_str = month_match.group(0).upper()
-            continue
+        if head in _MONTH_HEADS and not date_str:
+            month_match = _MONTH_RE.match(line)
+            if month_match:
+                month = month_match.group(0)
+                rest = line[len(month) :].strip()
+                if _DAY_NUM_RE.match(rest):
+                    date_str = f"{month.upper()} {rest}"
+                else:
+                    date_str = month.upper()
+                continue
 
-        if re.match(r"^\d{1,2}$", line) and date_str and len(date_str) <= 3:
+        if date_str and len(date_str) <= 3 and _DAY_NUM_RE.match(line):
             date_str = f"{date_str} {line}"
             continue
 
-        day_time_match = re.match(
-            r"^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\w*\s*[•·\-]\s*(\d{1,2}:\d{2}\s*[APap][Mm])",
-            line,
-            re.IGNORECASE,
-        )
-        if day_time_match:
-            day_of_week = day_time_match.group(1)
-            event_time = day_time_match.group(2).strip()
-            continue
+        if head in _DAY_HEADS:
+            day_time_match = _DAY_TIME_RE.match(line)
+            if day_time_match:
+                day_of_week = day_time_match.group(1)
+                event_time = day_time_match.group(2).strip()
+                continue
 
-        city_venue_match = re.match(r"^(.+?),\s*([A-Z]{2})\s*[•·\-]\s*(.+)$", line)
-        if city_venue_match:
-            city = city_venue_match.group(1).strip()
-            state = city_venue_match.group(2).strip()
-            venue = city_venue_match.group(3).strip()
-            continue
+        if "," in line:
+            city_venue_match = _CITY_VENUE_RE.match(line)
+            if city_venue_match:
+                city = city_venue_match.group(1).strip()
+                state = city_venue_match.group(2).strip()
+                venue = city_venue_match.group(3).strip()
+                continue
 
-        # City, ST, Venue (comma-separated — newer TM layout)
-        city_comma_match = re.match(r"^(.+?),\s*([A-Z]{2})\s*,\s*(.+)$", line)
-        if city_comma_match and not city:
-            city = city_comma_match.group(1).strip()
-            state = city_comma_match.group(2).strip()
-            # Venue may include trailing "Artist - Tour Name"; keep only first part
-            raw_venue = city_comma_match.group(3).strip()
-            # Split on comma — venue is typically the first segment
-            venue_parts = raw_venue.split(",")
-            venue = venue_parts[0].strip()
-            continue
+            if not city:
+                city_comma_match = _CITY_COMMA_RE.match(line)
+                if city_comma_match:
+                    city = city_comma_match.group(1).strip()
+                    state = city_comma_match.group(2).strip()
+                    # Venue may include trailing "Artist - Tour Name"; the
+                    # venue is typically the first comma-separated segment.
+                    venue = city_comma_match.group(3).split(",")[0].strip()
+                    continue
 
-        city_venue_intl = re.match(r"^(.+?),\s*(.+?)\s*[•·\-]\s*(.+)$", line)
-        if city_venue_intl and not city:
-            city = city_venue_intl.group(1).strip()
-            state = city_venue_intl.group(2).strip()
-            venue = city_venue_intl.group(3).strip()
-            continue
+                city_venue_intl = _CITY_VENUE_INTL_RE.match(line)
+                if city_venue_intl:
+                    city = city_venue_intl.group(1).strip()
+                    state = city_venue_intl.group(2).strip()
+                    venue = city_venue_intl.group(3).strip()
+                    continue
 
-        if not tour_name and (
-            artist_name.lower() in line.lower()
-            or "tour" in line.lower()
-            or "concert" in line.lower()
-            or "live" in line.lower()
-        ):
-            tour_name = line.strip()
-            continue
+        if not tour_name:
+            lowered = line.lower()
+            if (
+                artist_lower in lowered
+                or "tour" in lowered
+                or "concert" in lowered
+                or "live" in lowered
+            ):
+                tour_name = line
+                continue
 
     if city or venue or date_str:
         return [
@@ -615,12 +457,7 @@ def _parse_event_text(text: str, artist_name: str) -> Optional[List[str]]:
 def _parse_full_page(page_text: str, artist_name: str) -> List[List[str]]:
     """Fallback: split full page text into event blocks and parse each."""
     concerts = []
-    blocks = re.split(
-        r"\n(?=(?:JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC)\b)",
-        page_text,
-        flags=re.IGNORECASE,
-    )
-    for block in blocks:
+    for block in _BLOCK_SPLIT_RE.split(page_text):
         block = block.strip()
         if not block or len(block) < 10:
             continue
@@ -630,16 +467,96 @@ def _parse_full_page(page_text: str, artist_name: str) -> List[List[str]]:
     return concerts
 
 
+_CONCERT_KEYS = [
+    "artist_name", "date", "day", "time", "city", "state",
+    "venue", "tour_name", "presale_info", "presale_date",
+    "onsale_date", "event_url",
+]
+
+
+def _url_key(url: str) -> str:
+    return (url or "").split("#")[0].split("?")[0].rstrip("/")
+
+
+def _event_key(concert: Dict[str, str]) -> str:
+    """Stable identity for an event: its URL, else the dedupe fields."""
+    url = _url_key(concert.get("event_url", ""))
+    if url:
+        return url
+    return "|".join(concert.get(k, "") for k in ("artist_name", "date", "city", "venue"))
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8", errors="replace")).hexdigest()
+
+
+def _visible_event_urls(driver) -> List[str]:
+    try:
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll('a[href*=\"/event/\"]'))"
+            ".map(a => a.href);"
+        ) or []
+    except Exception:
+        return []
+
+
 def _scrape_concerts(driver, artist_name: str) -> List[Dict[str, str]]:
     """Scrape all concert rows from the current artist page.
 
     Clicks 'More Events' to load all events, stops at 'International Concerts',
     and only returns events that have presale information.
     """
+    concerts, _, _ = _collect_concerts(driver, artist_name)
+    return _with_sale_info(concerts)
+
+
+def _with_sale_info(all_concerts: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Only keep events with presale or general-onsale info."""
+    with_sale = [
+        c for c in all_concerts
+        if c.get("presale_info") or c.get("onsale_date")
+    ]
+    logger.info(
+        "Filtered %d/%d events with sale info",
+        len(with_sale), len(all_concerts),
+    )
+    return with_sale
+
+
+def _collect_concerts(
+    driver,
+    artist_name: str,
+    known: Optional[Dict[str, Dict]] = None,
+    stop_at_known: bool = True,
+):
+    """Load and parse every domestic event on the current artist page.
+
+    *known* maps event keys to stored ``{"text_hash", "concert"}`` entries.
+    When given, events whose text is unchanged are reused without parsing
+    and, with *stop_at_known*, loading stops once a freshly loaded batch
+    holds only known events.
+
+    Returns ``(concerts, complete, text_hashes)`` where *complete* is True
+    only when every event was loaded and read from the event links (the
+    fallbacks may miss events or lack URLs), and *text_hashes* maps each
+    event key to the hash of its source text.
+    """
     time.sleep(3)
-    _click_load_more(driver)
+    stop_when = None
+    if known and stop_at_known:
+        seen_urls: set = set()
+
+        def stop_when() -> bool:
+            fresh = [u for u in map(_url_key, _visible_event_urls(driver)) if u not in seen_urls]
+            seen_urls.update(fresh)
+            return bool(fresh) and all(u in known for u in fresh)
+
+    fully_loaded = _click_load_more(driver, stop_when=stop_when)
 
     raw_rows: List[List[str]] = []
+    row_hashes: List[str] = []
+    reused = 0
+    from_links = False
 
     # Strategy 1: JS-based extraction that stops at International Concerts
     try:
@@ -684,12 +601,21 @@ def _scrape_concerts(driver, artist_name: str) -> List[Dict[str, str]]:
                 # Skip items that are part of international section
                 if 'international' in item['text'].lower()[:50]:
                     continue
+                text_hash = _text_hash(item["text"])
+                stored = (known or {}).get(_url_key(item.get("url", "")))
+                if stored and stored.get("text_hash") == text_hash:
+                    raw_rows.append([stored["concert"].get(k, "") for k in _CONCERT_KEYS])
+                    row_hashes.append(text_hash)
+                    reused += 1
+                    continue
                 row = _parse_event_text(item["text"], artist_name)
                 if row:
                     row[-1] = item.get("url", "")
                     raw_rows.append(row)
-    except Exception:
-        pass
+                    row_hashes.append(text_hash)
+            from_links = bool(raw_rows)
+    except Exception as exc:
+        logger.warning("Event link extraction failed: %s", exc)
 
     # Strategy 2: structured event items (fallback)
     if not raw_rows:
@@ -736,6 +662,7 @@ def _scrape_concerts(driver, artist_name: str) -> List[Dict[str, str]]:
                         except Exception:
                             pass
                     raw_rows.append(row)
+                    row_hashes.append(_text_hash(text))
             except Exception:
                 continue
 
@@ -748,36 +675,108 @@ def _scrape_concerts(driver, artist_name: str) -> List[Dict[str, str]]:
             if intl_idx > 0:
                 page_text = page_text[:intl_idx]
             raw_rows = _parse_full_page(page_text, artist_name)
+            row_hashes = [_text_hash("|".join(row)) for row in raw_rows]
         except Exception:
             pass
 
+    if reused:
+        logger.info("Reused %d unchanged known event(s) without parsing", reused)
+
     # Deduplicate
     seen: set = set()
-    unique: List[List[str]] = []
-    for row in raw_rows:
+    all_concerts: List[Dict[str, str]] = []
+    text_hashes: Dict[str, str] = {}
+    for row, text_hash in zip(raw_rows, row_hashes):
         key = (row[0], row[1], row[4], row[6])
         if key not in seen:
             seen.add(key)
-            unique.append(row)
+            concert = dict(zip(_CONCERT_KEYS, row))
+            all_concerts.append(concert)
+            text_hashes[_event_key(concert)] = text_hash
 
-    # Convert to dicts
-    keys = [
-        "artist_name", "date", "day", "time", "city", "state",
-        "venue", "tour_name", "presale_info", "presale_date",
-        "onsale_date", "event_url",
-    ]
-    all_concerts = [dict(zip(keys, row)) for row in unique]
+    return all_concerts, fully_loaded and from_links, text_hashes
 
-    # Only keep events with presale or general-onsale info
-    with_sale = [
-        c for c in all_concerts
-        if c.get("presale_info") or c.get("onsale_date")
-    ]
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  INCREMENTAL REFRESH
+# ══════════════════════════════════════════════════════════════════════════════
+
+TM_EVENT_STORE_FILE = "tm_events.json"
+_event_store: Optional[JsonStore] = None
+_event_store_lock = threading.Lock()
+
+
+def _get_event_store() -> JsonStore:
+    """Return the persisted per-artist event store."""
+    global _event_store
+    with _event_store_lock:
+        if _event_store is None:
+            _event_store = JsonStore(cache_path(TM_EVENT_STORE_FILE))
+        return _event_store
+
+
+def _refresh_concerts(driver, artist_name: str, tm_country: str):
+    """Scrape concerts incrementally against the stored events for this artist.
+
+    Returns ``(concerts, removed)``. Concerts carry an ``added`` flag for
+    events not seen before; *removed* lists previously stored events that
+    are gone from a complete listing, flagged ``removed``. Loading stops
+    early at known events, except for a periodic full refresh every
+    ``tm_full_refresh_hours`` which is the only time removals are detected.
+    A partial, empty or failed scrape never removes stored events.
+    """
+    from ..config import settings
+
+    store = _get_event_store()
+    store_key = f"{tm_country}:{artist_name.strip().lower()}"
+    entry = store.get(store_key) or {}
+    known: Dict[str, Dict] = entry.get("events") or {}
+    last_full = entry.get("full_refreshed_at") or 0
+    full_due = time.time() - last_full >= max(0, int(settings.tm_full_refresh_hours)) * 3600
+
+    concerts, complete, text_hashes = _collect_concerts(
+        driver, artist_name, known=known, stop_at_known=not full_due
+    )
+    if known and not concerts:
+        logger.warning(
+            "Ticketmaster refresh for %s found no events; keeping %d stored",
+            artist_name, len(known),
+        )
+        complete = False
+
+    events: Dict[str, Dict] = {}
+    current: List[Dict] = []
+    for concert in concerts:
+        key = _event_key(concert)
+        events[key] = {"text_hash": text_hashes.get(key, ""), "concert": concert}
+        current.append({**concert, "added": key not in known})
+
+    removed: List[Dict] = []
+    for key, stored in known.items():
+        if key in events:
+            continue
+        if complete:
+            removed.append({**stored["concert"], "removed": True})
+        else:
+            # Not reached before loading stopped, or missed by a partial
+            # scrape; keep it until a complete listing says otherwise.
+            events[key] = stored
+            current.append({**stored["concert"], "added": False})
+
+    now = time.time()
+    store.set(store_key, {
+        "events": events,
+        "updated_at": now,
+        "full_refreshed_at": now if complete else last_full,
+    })
     logger.info(
-        "Filtered %d/%d events with sale info",
-        len(with_sale), len(all_concerts),
+        "Ticketmaster refresh for %s: %d added, %d removed (full=%s)",
+        artist_name,
+        sum(1 for c in current if c["added"]),
+        len(removed),
+        complete,
     )
-    return with_sale
+    return _with_sale_info(current), removed
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -785,74 +784,276 @@ def _scrape_concerts(driver, artist_name: str) -> List[Dict[str, str]]:
 # ══════════════════════════════════════════════════════════════════════════════
 
 
-def scrape_ticketmaster_concerts(
-    artist_inputs: List[Union[str, Dict[str, str]]],
-    chrome_version: int = 0,
-    proxy_str: Optional[str] = None,
-) -> Dict[str, Dict]:
-    """
-    Scrape Ticketmaster concerts for a list of artists.
+def _available_memory_mb() -> int:
+    """Return available system memory in MB, or 0 when it cannot be read."""
+    import os
 
-    Returns ``{artist_name: {"concerts": [...], "tm_profile_url": "...",
-    "first_presale_date": "...", "first_onsale_date": "..."}, ...}``.
-    """
-    _empty: Dict = {
+    try:
+        with open("/proc/meminfo", "r") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        pages = os.sysconf("SC_AVPHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        return int(pages * page_size) // (1024 * 1024)
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def _resolve_worker_count(requested: int, artist_count: int) -> int:
+    """Cap the requested worker count by artists, CPU cores and free memory."""
+    import os
+
+    workers = max(1, min(int(requested or 1), artist_count or 1))
+    workers = min(workers, os.cpu_count() or 1)
+
+    from ..config import settings
+
+    per_driver_mb = max(1, int(settings.ticketmaster_worker_memory_mb))
+    available_mb = _available_memory_mb()
+    if available_mb:
+        workers = min(workers, max(1, available_mb // per_driver_mb))
+    return max(1, workers)
+
+
+def _normalize_artist_input(artist: Union[str, Dict[str, str]]):
+    """Return ``(artist_name, tm_country)`` for a string or dict artist spec."""
+    if isinstance(artist, dict):
+        artist_name = (artist.get("artist_name") or "").strip()
+        tm_country = (artist.get("country") or "USA").upper()
+    else:
+        artist_name = str(artist).strip()
+        tm_country = "USA"
+    return artist_name, tm_country
+
+
+def _empty_result() -> Dict:
+    return {
         "concerts": [],
+        "removed_concerts": [],
         "tm_profile_url": "",
         "first_presale_date": "",
         "first_onsale_date": "",
     }
-    results: Dict[str, Dict] = {}
-    driver = _create_driver(chrome_version=chrome_version, proxy_str=proxy_str)
 
+
+def _scrape_artist(
+    driver, artist_name: str, tm_country: str, incremental: bool = False
+) -> Dict:
+    """Search one artist on Ticketmaster and scrape their listed concerts."""
+    logger.info("Ticketmaster: searching %s (country=%s)", artist_name, tm_country)
+    success = _search_artist(driver, artist_name, tm_country=tm_country)
+    if not success:
+        logger.warning("Ticketmaster: could not navigate to %s", artist_name)
+        return _empty_result()
+
+    profile_url = driver.current_url
+    removed: List[Dict] = []
+    if incremental:
+        concerts, removed = _refresh_concerts(driver, artist_name, tm_country)
+    else:
+        concerts = _scrape_concerts(driver, artist_name)
+
+    first_presale = ""
+    first_onsale = ""
+    for c in concerts:
+        if not first_presale and c.get("presale_date"):
+            first_presale = c["presale_date"]
+        if not first_onsale and c.get("onsale_date"):
+            first_onsale = c["onsale_date"]
+        if first_presale and first_onsale:
+            break
+
+    logger.info(
+        "Ticketmaster: %d concerts for %s", len(concerts), artist_name
+    )
+    return {
+        "concerts": concerts,
+        "removed_concerts": removed,
+        "tm_profile_url": profile_url,
+        "first_presale_date": first_presale,
+        "first_onsale_date": first_onsale,
+    }
+
+
+# A worker recreates its driver after this many failed artists in a row (or
+# at once if the browser is gone), and gives up after this many restarts.
+TM_WORKER_MAX_CONSECUTIVE_FAILURES = 2
+TM_WORKER_MAX_DRIVER_RESTARTS = 2
+# An artist whose scrape failed because its worker's browser died is put
+# back on the queue for another worker, at most this many times in total.
+TM_MAX_ARTIST_ATTEMPTS = 2
+
+
+def _driver_alive(driver) -> bool:
     try:
-        for artist in artist_inputs:
-            if isinstance(artist, dict):
-                artist_name = (artist.get("artist_name") or "").strip()
-                tm_country = (artist.get("country") or "USA").upper()
-            else:
-                artist_name = str(artist).strip()
-                tm_country = "USA"
+        driver.current_url
+        return True
+    except Exception:
+        return False
 
-            if not artist_name:
-                continue
 
-            logger.info("Ticketmaster: searching %s (country=%s)", artist_name, tm_country)
-            success = _search_artist(driver, artist_name, tm_country=tm_country)
-            if not success:
-                logger.warning("Ticketmaster: could not navigate to %s", artist_name)
-                results[artist_name] = {**_empty}
-                continue
+def _quit_driver(driver) -> None:
+    if driver is None:
+        return
+    try:
+        driver.quit()
+    except Exception:
+        pass
 
-            profile_url = driver.current_url
-            concerts = _scrape_concerts(driver, artist_name)
-
-            first_presale = ""
-            first_onsale = ""
-            for c in concerts:
-                if not first_presale and c.get("presale_date"):
-                    first_presale = c["presale_date"]
-                if not first_onsale and c.get("onsale_date"):
-                    first_onsale = c["onsale_date"]
-                if first_presale and first_onsale:
-                    break
 
-            results[artist_name] = {
-                "concerts": concerts,
-                "tm_profile_url": profile_url,
-                "first_presale_date": first_presale,
-                "first_onsale_date": first_onsale,
-            }
-            logger.info(
-                "Ticketmaster: %d concerts for %s", len(concerts), artist_name
-            )
+def _ticketmaster_worker(
+    worker_id: int,
+    work_queue: "queue.Queue",
+    results: Dict[str, Dict],
+    results_lock: threading.Lock,
+    chrome_version: int,
+    proxy_str: Optional[str],
+    incremental: bool = False,
+    drivers_started: Optional[List[int]] = None,
+) -> None:
+    """Pull artists from *work_queue* with a dedicated driver until it is empty.
+
+    A failing driver is recreated (so one crashed browser can't drain the
+    queue with instant failures); if it can't be recreated the worker stops
+    and the artist goes back on the queue for the remaining workers.
+    """
+    driver = None
+    restarts = 0
+    consecutive_failures = 0
+    try:
+        while True:
+            if driver is None:
+                try:
+                    driver = _create_driver(chrome_version=chrome_version, proxy_str=proxy_str)
+                except Exception as exc:
+                    logger.error(
+                        "Ticketmaster worker %d could not start Chrome: %s", worker_id, exc
+                    )
+                    return
+                if drivers_started is not None:
+                    with results_lock:
+                        drivers_started.append(worker_id)
+
+            try:
+                artist_name, tm_country, attempts = work_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                data = _scrape_artist(driver, artist_name, tm_country, incremental=incremental)
+                consecutive_failures = 0
+            except Exception as exc:
+                consecutive_failures += 1
+                alive = _driver_alive(driver)
+                logger.warning(
+                    "Ticketmaster worker %d failed on %s (driver %s): %s",
+                    worker_id, artist_name, "alive" if alive else "dead", exc,
+                )
+                if not alive or consecutive_failures >= TM_WORKER_MAX_CONSECUTIVE_FAILURES:
+                    _quit_driver(driver)
+                    driver = None
+                    consecutive_failures = 0
+                    if attempts + 1 < TM_MAX_ARTIST_ATTEMPTS:
+                        work_queue.put((artist_name, tm_country, attempts + 1))
+                    else:
+                        with results_lock:
+                            results[artist_name] = _empty_result()
+                    if restarts >= TM_WORKER_MAX_DRIVER_RESTARTS:
+                        logger.error(
+                            "Ticketmaster worker %d stopping after %d driver restarts",
+                            worker_id, restarts,
+                        )
+                        return
+                    restarts += 1
+                    logger.info("Ticketmaster worker %d restarting its driver", worker_id)
+                    continue
+                data = _empty_result()
+            with results_lock:
+                results[artist_name] = data
             time.sleep(2)
     except Exception as exc:
-        logger.exception("Ticketmaster scraper error: %s", exc)
+        logger.exception("Ticketmaster worker %d error: %s", worker_id, exc)
     finally:
-        try:
-            driver.quit()
-        except OSError:
-            pass
+        _quit_driver(driver)
+
+
+def scrape_ticketmaster_concerts(
+    artist_inputs: List[Union[str, Dict[str, str]]],
+    chrome_version: int = 0,
+    proxy_str: Optional[str] = None,
+    workers: int = 1,
+    worker_proxies: Optional[List[str]] = None,
+    incremental: bool = False,
+) -> Dict[str, Dict]:
+    """
+    Scrape Ticketmaster concerts for a list of artists.
+
+    Artists are pulled from a shared queue by up to *workers* concurrent
+    drivers (capped by CPU cores and available memory). Worker ``i`` uses
+    ``worker_proxies[i % len(worker_proxies)]`` when given, else *proxy_str*.
+
+    With *incremental*, each artist is refreshed against the persisted
+    event store: loading stops at known events, concerts are flagged
+    ``added`` and vanished events are returned in ``removed_concerts``.
+
+    Returns ``{artist_name: {"concerts": [...], "removed_concerts": [...],
+    "tm_profile_url": "...", "first_presale_date": "...",
+    "first_onsale_date": "..."}, ...}``.
+    """
+    specs = []
+    for artist in artist_inputs:
+        artist_name, tm_country = _normalize_artist_input(artist)
+        if artist_name:
+            specs.append((artist_name, tm_country))
+    if not specs:
+        return {}
+
+    work_queue: "queue.Queue" = queue.Queue()
+    for artist_name, tm_country in specs:
+        work_queue.put((artist_name, tm_country, 0))
+
+    worker_count = _resolve_worker_count(workers, len(specs))
+    logger.info(
+        "Ticketmaster: %d artist(s) across %d worker(s)", len(specs), worker_count
+    )
+
+    results: Dict[str, Dict] = {}
+    results_lock = threading.Lock()
+    drivers_started: List[int] = []
+    proxies = [p for p in (worker_proxies or []) if p]
+
+    from ..config import settings
+
+    if not proxies and not proxy_str and settings.tm_use_proxy_pool:
+        proxies = get_proxy_pool().healthy()[:worker_count]
+        if proxies:
+            logger.info("Ticketmaster: using %d pooled proxy(ies)", len(proxies))
+
+    threads = []
+    for worker_id in range(worker_count):
+        worker_proxy = proxies[worker_id % len(proxies)] if proxies else proxy_str
+        thread = threading.Thread(
+            target=_ticketmaster_worker,
+            args=(worker_id, work_queue, results, results_lock,
+                  chrome_version, worker_proxy, incremental, drivers_started),
+            daemon=True,
+        )
+        thread.start()
+        threads.append(thread)
+    for thread in threads:
+        thread.join()
+
+    if not drivers_started:
+        raise RuntimeError("Ticketmaster: no worker could start a Chrome driver")
+    missing = [name for name, _ in specs if name not in results]
+    if missing:
+        logger.error(
+            "Ticketmaster: all workers stopped; %d artist(s) not scraped: %s",
+            len(missing), ", ".join(missing),
+        )
 
-    return results
+    # Preserve input order in the merged result.
+    return {name: results[name] for name, _ in specs if name in results}
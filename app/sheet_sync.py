@@ -0,0 +1,204 @@
+"""
+Background Google Sheets sync for jobs created with ``auto_sync_sheet``.
+
+The job worker submits artist snapshots as they are produced (each
+Soundcharts result, then everyone after each later phase). A single
+daemon thread drains them in batches of ``SHEET_SYNC_BATCH_SIZE`` with
+:func:`~app.sheets.upsert_results`, so rows land in the sheet while the
+job runs and later snapshots overwrite earlier ones in place. Snapshots
+still waiting for the same artist are coalesced. Quota and server errors
+are retried with exponential backoff; a job waiting out its backoff is
+skipped meanwhile, so other jobs keep syncing. Progress is reported
+through the job's :class:`~app.models.SheetSyncStatus`. A job's queue
+state is dropped once the job has finished and everything it submitted
+is written.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import requests
+from gspread.exceptions import APIError
+
+from .config import settings
+from .ig_handles import artist_key
+from .models import ArtistData, SheetSyncState, SheetSyncStatus
+from .sheets import upsert_results
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+MAX_BACKOFF_SECONDS = 300
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, APIError):
+        return getattr(exc.response, "status_code", None) in RETRYABLE_STATUS_CODES
+    return isinstance(exc, (requests.ConnectionError, requests.Timeout))
+
+
+class _JobSync:
+    """Pending snapshots and counters for one job."""
+
+    def __init__(self, status: SheetSyncStatus):
+        self.status = status
+        self.pending: "OrderedDict[str, ArtistData]" = OrderedDict()
+        self.synced: set = set()
+        self.in_flight = False
+        self.finished = False
+        self.retry_at = 0.0  # time.monotonic() before which it isn't retried
+
+
+class SheetSyncQueue:
+    """Serialize background upserts for all jobs on one worker thread.
+
+    One thread keeps the upserts of different jobs (and batches of one
+    job) from racing on the artist-row index.
+    """
+
+    def __init__(
+        self,
+        on_update: Callable[[str], None],
+        upsert: Callable[[List[ArtistData]], object] = upsert_results,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self._on_update = on_update
+        self._upsert = upsert
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self._jobs: "OrderedDict[str, _JobSync]" = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, job_id: str, status: SheetSyncStatus, artists: List[ArtistData]) -> None:
+        """Queue the latest snapshot of *artists* for *job_id*."""
+        with self._cond:
+            sync = self._jobs.get(job_id)
+            if sync is None:
+                sync = self._jobs[job_id] = _JobSync(status)
+            for artist in artists:
+                key = artist_key(artist.artist_name)
+                if key:
+                    sync.pending[key] = artist
+            status.pending_artists = len(sync.pending)
+            if status.state in (SheetSyncState.SYNCED, SheetSyncState.FAILED):
+                status.state = SheetSyncState.PENDING
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="sheet-sync", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def _next_batch(self):
+        """Wait for work; return ``(job_id, sync, batch)`` (called under the lock)."""
+        while True:
+            now = time.monotonic()
+            retry_at = None
+            for job_id, sync in self._jobs.items():
+                if sync.pending and sync.retry_at > now:
+                    retry_at = min(retry_at or sync.retry_at, sync.retry_at)
+                elif sync.pending:
+                    keys = list(sync.pending)[: max(1, settings.sheet_sync_batch_size)]
+                    batch = {key: sync.pending.pop(key) for key in keys}
+                    sync.in_flight = True
+                    # Round-robin between jobs.
+                    self._jobs.move_to_end(job_id)
+                    return job_id, sync, batch
+            self._cond.wait(None if retry_at is None else retry_at - now)
+
+    def _evict_if_done(self, job_id: str, sync: _JobSync) -> None:
+        """Drop a finished job once nothing is pending (called under the lock)."""
+        if sync.finished and not sync.pending and not sync.in_flight:
+            if self._jobs.get(job_id) is sync:
+                del self._jobs[job_id]
+
+    def _done(self, job_id: str, sync: _JobSync) -> None:
+        with self._cond:
+            sync.in_flight = False
+            self._evict_if_done(job_id, sync)
+
+    def _requeue(self, sync: _JobSync, batch: Dict[str, ArtistData], delay: float) -> None:
+        """Put a failed batch back (unless a newer snapshot arrived meanwhile)
+        to be retried after *delay* seconds."""
+        with self._cond:
+            requeued = OrderedDict(
+                (key, sync.pending.pop(key, artist)) for key, artist in batch.items()
+            )
+            requeued.update(sync.pending)
+            sync.pending = requeued
+            sync.in_flight = False
+            sync.retry_at = time.monotonic() + delay
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                job_id, sync, batch = self._next_batch()
+                sync.status.state = SheetSyncState.SYNCING
+                sync.status.pending_artists = len(sync.pending)
+            self._on_update(job_id)
+
+            try:
+                self._upsert(list(batch.values()))
+            except Exception as exc:
+                sync.status.last_error = str(exc)
+                sync.status.attempts += 1
+                if _is_retryable(exc) and sync.status.attempts <= settings.sheet_sync_max_retries:
+                    delay = min(
+                        MAX_BACKOFF_SECONDS,
+                        settings.sheet_sync_backoff_seconds * 2 ** (sync.status.attempts - 1),
+                    ) * random.uniform(0.8, 1.2)
+                    logger.warning(
+                        "Job %s: sheet sync failed (attempt %d), retrying in %.0fs: %s",
+                        job_id, sync.status.attempts, delay, exc,
+                    )
+                    self._requeue(sync, batch, delay)
+                    sync.status.state = SheetSyncState.RETRYING
+                    sync.status.pending_artists = len(sync.pending)
+                    self._on_update(job_id)
+                    self._sleep(settings.sheet_sync_min_interval_seconds)
+                    continue
+                logger.error("Job %s: sheet sync gave up on %d artist(s): %s", job_id, len(batch), exc)
+                sync.status.state = SheetSyncState.FAILED
+                sync.status.attempts = 0
+                self._done(job_id, sync)
+                self._on_update(job_id)
+                self._sleep(settings.sheet_sync_min_interval_seconds)
+                continue
+
+            with self._cond:
+                sync.synced.update(batch)
+                sync.status.rows_synced = len(sync.synced)
+                sync.status.attempts = 0
+                sync.status.last_error = None
+                sync.status.last_synced_at = datetime.now(timezone.utc)
+                sync.status.pending_artists = len(sync.pending)
+                sync.status.state = (
+                    SheetSyncState.PENDING if sync.pending else SheetSyncState.SYNCED
+                )
+                sync.in_flight = False
+                self._evict_if_done(job_id, sync)
+            logger.info(
+                "Job %s: synced %d artist(s) to the sheet (%d total)",
+                job_id, len(batch), sync.status.rows_synced,
+            )
+            self._on_update(job_id)
+            self._sleep(settings.sheet_sync_min_interval_seconds)
+
+    def finish(self, job_id: str) -> None:
+        """Mark *job_id* as done submitting; its state goes once drained."""
+        with self._cond:
+            sync = self._jobs.get(job_id)
+            if sync is None:
+                return
+            sync.finished = True
+            self._evict_if_done(job_id, sync)
+
+    def forget(self, job_id: str) -> None:
+        """Drop a job's pending snapshots (e.g. when the job is deleted)."""
+        with self._cond:
+            self._jobs.pop(job_id, None)
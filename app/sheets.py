@@ -5,17 +5,26 @@ Google Sheets helpers for writing completed job results.
 import re
 import base64
 import json
+import logging
 import os
+import threading
 from datetime import datetime
 from urllib.parse import urlparse
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import gspread
+from google.auth.exceptions import RefreshError
 from google.oauth2.service_account import Credentials
+from gspread.exceptions import APIError, SpreadsheetNotFound, WorksheetNotFound
+from gspread.utils import rowcol_to_a1
 
 from .config import settings
+from .ig_handles import artist_key
 from .models import ArtistData
 
+logger = logging.getLogger(__name__)
+
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
 SHEET_COLUMNS = [
@@ -48,16 +57,26 @@ def _sanitize_ws_title(name: str) -> str:
     return clean[:100] or "Events"
 
 
-def _unique_ws_title(sheet, base_title: str) -> str:
-    existing = {ws.title for ws in sheet.worksheets()}
-    if base_title not in existing:
-        return base_title
+def _unique_ws_title(existing: Set[str], base_title: str) -> str:
+    """Return a title not in *existing* (lower-cased titles) and reserve it.
+
+    Sheets compares worksheet titles case-insensitively.
+    """
+    title = base_title
+    if title.lower() in existing:
+        for i in range(2, 200):
+            candidate = f"{base_title[:95]} {i}"
+            if candidate.lower() not in existing:
+                title = candidate
+                break
+        else:
+            title = f"{base_title[:90]} {str(len(existing) + 1)}"
+    existing.add(title.lower())
+    return title
+
 
-    for i in range(2, 200):
-        candidate = f"{base_title[:95]} {i}"
-        if candidate not in existing:
-            return candidate
-    return f"{base_title[:90]} {str(len(existing) + 1)}"
+def _a1_range(title: str, cell_range: str) -> str:
+    return "'" + title.replace("'", "''") + "'!" + cell_range
 
 
 def _format_sheet_date(raw_date: str) -> str:
@@ -87,61 +106,162 @@ def _primary_name_from_url(event_url: str) -> str:
     return ""
 
 
-def _create_concerts_sheet(sheet, artist: ArtistData, job_tag: str = "") -> str:
-    data = artist.model_dump()
-    concerts = data.get("concerts", []) or []
-    artist_name = data.get("artist_name", "Artist") or "Artist"
-
-    # Keep titles traceable while still short.
-    base = f"Events - {_sanitize_ws_title(artist_name)}"
-    if job_tag:
-        base = f"{base} - {job_tag[:8]}"
-    title = _unique_ws_title(sheet, _sanitize_ws_title(base))
-
-    rows_needed = max(30, len(concerts) + 3)
-    ws = sheet.add_worksheet(title=title, rows=rows_needed, cols=6)
-
-    ws.update(
-        "A1",
-        [["TOUR DATES"]],
-        value_input_option="RAW",
-    )
-    ws.merge_cells("A1:F1")
-
-    headers = [
-        "Date (mm/dd/yyyy)",
-        "Day of the Week",
-        "Primary",
-        "Link to Primary",
-        "Venue Name",
-        "Venue Capacity",
+EVENT_SHEET_HEADERS = [
+    "Date (mm/dd/yyyy)",
+    "Day of the Week",
+    "Primary",
+    "Link to Primary",
+    "Venue Name",
+    "Venue Capacity",
+]
+EVENT_SHEET_COLS = len(EVENT_SHEET_HEADERS)
+
+
+def _event_sheet_values(concerts: List[dict]) -> List[List[str]]:
+    """Title row, header row and one row per concert for an events worksheet."""
+    rows = [["TOUR DATES"], list(EVENT_SHEET_HEADERS)]
+    for c in concerts:
+        event_url = str(c.get("event_url", "") or "")
+        rows.append([
+            _format_sheet_date(str(c.get("date", "") or "")),
+            str(c.get("day", "") or ""),
+            _primary_name_from_url(event_url),
+            event_url,
+            str(c.get("venue", "") or ""),
+            str(c.get("venue_capacity", "") or ""),
+        ])
+    return rows
+
+
+def _create_concerts_sheets(
+    sheet, results: List[ArtistData], job_tag: str = "", reuse: bool = False
+) -> List[str]:
+    """Create one events worksheet per artist; returns their URLs in order.
+
+    The whole set costs four API calls regardless of the artist count:
+    one ``worksheets()`` for the existing titles, one ``batch_update`` adding
+    every worksheet, one ``values_batch_update`` writing all cells, and one
+    ``batch_update`` for title merges and column auto-resize.
+
+    With *reuse*, an artist's existing ``Events - <artist>`` worksheet is
+    cleared and rewritten instead of adding a new one (one extra
+    ``values_batch_clear`` call for all of them).
+    """
+    if not results:
+        return []
+    worksheets = {ws.title.lower(): ws for ws in sheet.worksheets()}
+    existing = set(worksheets)
+    claimed: Set[str] = set()
+
+    titles: List[str] = []
+    values: List[List[List[str]]] = []
+    sheet_ids: List[Optional[int]] = []
+    requests = []
+    new_sheets: List[int] = []  # positions whose sheetId comes from the reply
+    reused: List[str] = []
+    for artist in results:
+        data = artist.model_dump(include={"artist_name", "concerts"})
+        concerts = data.get("concerts", []) or []
+        artist_name = data.get("artist_name", "Artist") or "Artist"
+        rows_needed = max(30, len(concerts) + 3)
+
+        # Keep titles traceable while still short.
+        base = f"Events - {_sanitize_ws_title(artist_name)}"
+        if job_tag:
+            base = f"{base} - {job_tag[:8]}"
+        base = _sanitize_ws_title(base)
+
+        ws = worksheets.get(base.lower()) if reuse and base.lower() not in claimed else None
+        if ws is not None:
+            title = ws.title
+            claimed.add(title.lower())
+            reused.append(title)
+            sheet_ids.append(ws.id)
+            if ws.row_count < rows_needed:
+                requests.append({
+                    "updateSheetProperties": {
+                        "properties": {
+                            "sheetId": ws.id,
+                            "gridProperties": {"rowCount": rows_needed},
+                        },
+                        "fields": "gridProperties.rowCount",
+                    }
+                })
+        else:
+            title = _unique_ws_title(existing, base)
+            claimed.add(title.lower())
+            new_sheets.append(len(sheet_ids))
+            sheet_ids.append(None)
+            requests.append({
+                "addSheet": {
+                    "properties": {
+                        "title": title,
+                        "gridProperties": {
+                            "rowCount": rows_needed,
+                            "columnCount": EVENT_SHEET_COLS,
+                        },
+                    }
+                }
+            })
+        titles.append(title)
+        values.append(_event_sheet_values(concerts))
+
+    if requests:
+        reply = sheet.batch_update({"requests": requests})
+        added = [r["addSheet"]["properties"]["sheetId"] for r in reply["replies"] if "addSheet" in r]
+        for pos, sheet_id in zip(new_sheets, added):
+            sheet_ids[pos] = sheet_id
+
+    if reused:
+        sheet.values_batch_clear(body={"ranges": [_a1_range(t, "A:F") for t in reused]})
+
+    sheet.values_batch_update({
+        "valueInputOption": "RAW",
+        "data": [
+            {"range": _a1_range(title, f"A1:F{len(rows)}"), "values": rows}
+            for title, rows in zip(titles, values)
+        ],
+    })
+
+    format_requests = []
+    for pos in new_sheets:
+        sheet_id = sheet_ids[pos]
+        format_requests.append({
+            "mergeCells": {
+                "range": {
+                    "sheetId": sheet_id,
+                    "startRowIndex": 0,
+                    "endRowIndex": 1,
+                    "startColumnIndex": 0,
+                    "endColumnIndex": EVENT_SHEET_COLS,
+                },
+                "mergeType": "MERGE_ALL",
+            }
+        })
+        format_requests.append({
+            "autoResizeDimensions": {
+                "dimensions": {
+                    "sheetId": sheet_id,
+                    "dimension": "COLUMNS",
+                    "startIndex": 0,
+                    "endIndex": EVENT_SHEET_COLS,
+                }
+            }
+        })
+    if format_requests:
+        sheet.batch_update({"requests": format_requests})
+
+    return [
+        f"https://docs.google.com/spreadsheets/d/{settings.sheet_id}/edit#gid={sheet_id}"
+        for sheet_id in sheet_ids
     ]
-    ws.update("A2:F2", [headers], value_input_option="RAW")
-
-    if concerts:
-        rows = []
-        for c in concerts:
-            event_url = str(c.get("event_url", "") or "")
-            rows.append([
-                _format_sheet_date(str(c.get("date", "") or "")),
-                str(c.get("day", "") or ""),
-                _primary_name_from_url(event_url),
-                event_url,
-                str(c.get("venue", "") or ""),
-                str(c.get("venue_capacity", "") or ""),
-            ])
-        ws.update(f"A3:F{2 + len(rows)}", rows, value_input_option="RAW")
-
-    ws.columns_auto_resize(0, 5)
-
-    return f"https://docs.google.com/spreadsheets/d/{settings.sheet_id}/edit#gid={ws.id}"
 
 
 class SheetSyncError(RuntimeError):
     """Raised when sheet sync cannot be completed."""
 
 
-def _get_client() -> gspread.Client:
+def _build_client() -> gspread.Client:
     if not settings.google_sa_json:
         raise SheetSyncError("GOOGLE_SA_JSON is not configured")
 
@@ -190,75 +310,169 @@ def _get_client() -> gspread.Client:
     return gspread.authorize(creds)
 
 
-def _ensure_header(worksheet) -> None:
+def _ensure_header(worksheet) -> List[str]:
+    """Return the header row, writing ``SHEET_COLUMNS`` if the sheet is empty."""
     existing = worksheet.row_values(1)
     if not existing:
         worksheet.append_row(SHEET_COLUMNS, value_input_option="RAW")
+        return list(SHEET_COLUMNS)
+    return existing
+
+
+# Sheet header (normalized) → ArtistData field, for user-defined headers.
+# Canonical API/table column names are matched through the model fields.
+_HEADER_FIELDS = {
+    "artistname": "artist_name",
+    "genre": "genre",
+    "venuetype": "venue_type",
+    "linktotour": "tour_link",
+    "ticketagenttourlink": "tm_profile_url",
+    "firstpresale": "first_presale_date",
+    "gensale": "first_onsale_date",
+    "tiktoklisteners": "tiktok_followers",
+    "spotifylisteners": "spotify_followers",
+    "instagramfollowers": "instagram_followers",
+    "bandsintownfollowers": "bandsintown_followers",
+    "igengagementrate": "ig_engagement_rate",
+    "soundchartslink": "soundcharts_url",
+}
+# Columns the API leaves for people to fill in, or fills with a fixed value.
+_HEADER_CONSTANTS = {
+    "basiclocation": "",
+    "gasection": "",
+    "teammember": "",
+    "prereportscompleted": "",
+    "30daygrowthpercentage": "",
+    "j": "",
+    "j1": "",
+    "j2": "",
+    "status": "Completed",
+    "buylist": "",
+}
+_MODEL_FIELDS = {_normalize_header(name): name for name in ArtistData.model_fields}
+# Non-scalar fields (concert lists) are written as their model_dump().
+_DUMPED_FIELDS = {
+    name for name, info in ArtistData.model_fields.items() if info.annotation is not str
+}
+
+# extractor(artist, event_sheet_url) -> cell value
+RowPlan = Tuple[Callable[[ArtistData, str], str], ...]
+
+
+def _field_extractor(field: str) -> Callable[[ArtistData, str], str]:
+    if field in _DUMPED_FIELDS:
+        def extract(artist: ArtistData, _url: str) -> str:
+            return str(artist.model_dump(include={field})[field] or "")
+    else:
+        def extract(artist: ArtistData, _url: str) -> str:
+            return str(getattr(artist, field) or "")
+
+    return extract
+
+
+def _constant_extractor(value: str) -> Callable[[ArtistData, str], str]:
+    return lambda _artist, _url: value
+
+
+@lru_cache(maxsize=32)
+def _compile_row_plan(headers: Tuple[str, ...]) -> RowPlan:
+    """Resolve each sheet header to a cell extractor once per header row."""
+    plan = []
+    for header in headers:
+        norm = _normalize_header(header)
+        if norm == "eventsheet":
+            plan.append(lambda _artist, url: url)
+        elif norm == "concertscount":
+            plan.append(lambda artist, _url: str(len(artist.concerts)))
+        elif norm in _HEADER_FIELDS:
+            plan.append(_field_extractor(_HEADER_FIELDS[norm]))
+        elif norm in _HEADER_CONSTANTS:
+            plan.append(_constant_extractor(_HEADER_CONSTANTS[norm]))
+        elif norm in _MODEL_FIELDS:
+            plan.append(_field_extractor(_MODEL_FIELDS[norm]))
+        else:
+            plan.append(_constant_extractor(""))
+    return tuple(plan)
+
+
+def _plan_row(plan: RowPlan, artist: ArtistData, event_sheet_url: str = "") -> List[str]:
+    return [extract(artist, event_sheet_url) for extract in plan]
 
 
 def _result_to_row(artist: ArtistData, headers: List[str], event_sheet_url: str = "") -> List[str]:
-    data = artist.model_dump()
-    concerts_count = len(data.get("concerts", []) or [])
-
-    # Flexible mapping for user-defined sheet headers.
-    header_value = {
-        "artistname": data.get("artist_name", ""),
-        "basiclocation": "",
-        "genre": data.get("genre", ""),
-        "eventsheet": event_sheet_url,
-        "venuetype": data.get("venue_type", ""),
-        "linktotour": data.get("tour_link", ""),
-        "ticketagenttourlink": data.get("tm_profile_url", ""),
-        "gasection": "",
-        "teammember": "",
-        "prereportscompleted": "",
-        "firstpresale": data.get("first_presale_date", ""),
-        "gensale": data.get("first_onsale_date", ""),
-        "tiktoklisteners": data.get("tiktok_followers", ""),
-        "spotifylisteners": data.get("spotify_followers", ""),
-        "instagramfollowers": data.get("instagram_followers", ""),
-        "bandsintownfollowers": data.get("bandsintown_followers", ""),
-        "30daygrowthpercentage": "",
-        "igengagementrate": data.get("ig_engagement_rate", ""),
-        "j": "",
-        "j1": "",
-        "j2": "",
-        "status": "Completed",
-        "buylist": "",
-        "soundchartslink": data.get("soundcharts_url", ""),
-        # Canonical API/table column names also supported.
-        "artist_name": data.get("artist_name", ""),
-        "tiktok_followers": data.get("tiktok_followers", ""),
-        "spotify_followers": data.get("spotify_followers", ""),
-        "instagram_followers": data.get("instagram_followers", ""),
-        "bandsintown_followers": data.get("bandsintown_followers", ""),
-        "ig_username": data.get("ig_username", ""),
-        "ig_engagement_rate": data.get("ig_engagement_rate", ""),
-        "tour_link": data.get("tour_link", ""),
-        "venue_type": data.get("venue_type", ""),
-        "soundcharts_url": data.get("soundcharts_url", ""),
-        "tm_profile_url": data.get("tm_profile_url", ""),
-        "first_presale_date": data.get("first_presale_date", ""),
-        "first_onsale_date": data.get("first_onsale_date", ""),
-        "concerts_count": str(concerts_count),
-    }
-
-    row: List[str] = []
-    for header in headers:
-        norm = _normalize_header(header)
-        if norm in header_value:
-            row.append(str(header_value[norm] or ""))
-            continue
+    return _plan_row(_compile_row_plan(tuple(headers)), artist, event_sheet_url)
+
+
+# ── Cached handles ──────────────────────────────────────────────────────────
+
+# One authorized client, spreadsheet and worksheet handle per process,
+# rebuilt when the settings they came from change or after an auth error.
+# The client's session refreshes the service-account token by itself.
+_handles_lock = threading.Lock()
+_handles: Dict[str, object] = {}
+
+# Held around every append / upsert, whoever makes it (manual syncs of any
+# job and the background sync), so two writers can't both miss an artist
+# in the row index and append it twice.
+_write_lock = threading.Lock()
+
+
+def _is_auth_error(exc: Exception) -> bool:
+    if isinstance(exc, RefreshError):
+        return True
+    if isinstance(exc, APIError):
+        return getattr(exc.response, "status_code", None) in (401, 403)
+    return isinstance(exc, (WorksheetNotFound, SpreadsheetNotFound))
+
+
+def invalidate_sheet_handles() -> None:
+    """Drop the cached client / spreadsheet / worksheet handles."""
+    with _handles_lock:
+        _handles.clear()
 
-        # Fallback: match normalized model keys.
-        value = ""
-        for key, raw in data.items():
-            if _normalize_header(key) == norm:
-                value = raw
-                break
-        row.append(str(value or ""))
 
-    return row
+def _get_client() -> gspread.Client:
+    with _handles_lock:
+        if _handles.get("sa_json") != settings.google_sa_json:
+            _handles.clear()
+        client = _handles.get("client")
+        if client is None:
+            client = _handles["client"] = _build_client()
+            _handles["sa_json"] = settings.google_sa_json
+        return client
+
+
+def _get_handles() -> Tuple[gspread.Spreadsheet, gspread.Worksheet]:
+    """Return the cached ``(spreadsheet, worksheet)`` for the current settings."""
+    client = _get_client()
+    with _handles_lock:
+        if _handles.get("sheet_id") != settings.sheet_id:
+            _handles.pop("worksheet", None)
+            _handles["sheet"] = client.open_by_key(settings.sheet_id)
+            _handles["sheet_id"] = settings.sheet_id
+        sheet = _handles["sheet"]
+        if _handles.get("worksheet_name") != settings.worksheet_name or "worksheet" not in _handles:
+            _handles["worksheet"] = sheet.worksheet(settings.worksheet_name)
+            _handles["worksheet_name"] = settings.worksheet_name
+        return sheet, _handles["worksheet"]
+
+
+def _with_handles(operation: Callable, retry_on_auth_error: bool = False):
+    """Run ``operation(sheet, worksheet)``; drop the handles on auth errors.
+
+    With *retry_on_auth_error* (idempotent operations only) the call is
+    repeated once with fresh handles.
+    """
+    for attempt in range(2 if retry_on_auth_error else 1):
+        try:
+            return operation(*_get_handles())
+        except Exception as exc:
+            if not _is_auth_error(exc):
+                raise
+            logger.warning("Google Sheets auth error; rebuilding client: %s", exc)
+            invalidate_sheet_handles()
+            if attempt or not retry_on_auth_error:
+                raise
 
 
 def append_results(results: List[ArtistData], job_id: str = "") -> int:
@@ -267,19 +481,79 @@ def append_results(results: List[ArtistData], job_id: str = "") -> int:
     if not results:
         return 0
 
-    client = _get_client()
-    sheet = client.open_by_key(settings.sheet_id)
-    worksheet = sheet.worksheet(settings.worksheet_name)
+    def append(sheet, worksheet) -> int:
+        headers = _ensure_header(worksheet)
+        event_sheet_urls = _create_concerts_sheets(sheet, results, job_tag=job_id)
+        plan = _compile_row_plan(tuple(headers))
+        rows = [
+            _plan_row(plan, artist, url)
+            for artist, url in zip(results, event_sheet_urls)
+        ]
+
+        worksheet.append_rows(rows, value_input_option="RAW")
+        return len(rows)
+
+    with _write_lock:
+        return _with_handles(append)
+
+
+def _artist_column(headers: List[str]) -> int:
+    """Return the 1-based column holding artist names."""
+    for i, header in enumerate(headers):
+        if _normalize_header(header) == "artistname":
+            return i + 1
+    raise SheetSyncError(
+        f"Worksheet {settings.worksheet_name!r} has no artist name column to upsert on"
+    )
 
-    _ensure_header(worksheet)
-    headers = worksheet.row_values(1)
-    rows = []
-    for artist in results:
-        event_sheet_url = _create_concerts_sheet(sheet, artist, job_tag=job_id)
-        rows.append(_result_to_row(artist, headers, event_sheet_url=event_sheet_url))
 
-    worksheet.append_rows(rows, value_input_option="RAW")
-    return len(rows)
+def upsert_results(results: List[ArtistData]) -> Tuple[int, int]:
+    """Update rows of artists already in the sheet and append the rest.
+
+    The artist-name column is read once into an index; matching rows are
+    rewritten in place with one batched write and each artist's events
+    worksheet is reused, so syncing the same job twice leaves the sheet
+    unchanged. Returns ``(rows_updated, rows_appended)``.
+    """
+    if not settings.sheet_id:
+        raise SheetSyncError("SHEET_ID is not configured")
+    if not results:
+        return 0, 0
+
+    def upsert(sheet, worksheet) -> Tuple[int, int]:
+        headers = _ensure_header(worksheet)
+        artist_col = _artist_column(headers)
+        row_index: Dict[str, int] = {}
+        for row_number, name in enumerate(worksheet.col_values(artist_col)[1:], start=2):
+            key = artist_key(str(name or ""))
+            if key and key not in row_index:
+                row_index[key] = row_number
+
+        # One row per artist; a later result for the same artist wins.
+        latest = {artist_key(a.artist_name): a for a in results if a.artist_name.strip()}
+        artists = list(latest.values())
+        event_sheet_urls = _create_concerts_sheets(sheet, artists, reuse=True)
+
+        updates = []
+        appends = []
+        last_col = rowcol_to_a1(1, len(headers)).rstrip("1")
+        plan = _compile_row_plan(tuple(headers))
+        for artist, url in zip(artists, event_sheet_urls):
+            row = _plan_row(plan, artist, url)
+            row_number = row_index.get(artist_key(artist.artist_name))
+            if row_number:
+                updates.append({"range": f"A{row_number}:{last_col}{row_number}", "values": [row]})
+            else:
+                appends.append(row)
+
+        if updates:
+            worksheet.batch_update(updates, value_input_option="RAW")
+        if appends:
+            worksheet.append_rows(appends, value_input_option="RAW")
+        return len(updates), len(appends)
+
+    with _write_lock:
+        return _with_handles(upsert, retry_on_auth_error=True)
 
 
 def get_sheet_url() -> str:
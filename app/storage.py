@@ -0,0 +1,102 @@
+"""
+Small JSON-file stores for state that should survive process restarts.
+
+Used for caches and learned lookup tables (proxy health, etc.). Each store
+is a flat ``{key: value}`` mapping held in memory and written atomically to
+a file under ``settings.cache_dir``.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def cache_path(name: str) -> str:
+    """Return *name* resolved inside the configured cache directory."""
+    return os.path.join(settings.cache_dir, name)
+
+
+class JsonStore:
+    """Thread-safe key/value mapping persisted as a JSON document."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._data: Dict[str, Any] = self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        if not os.path.isfile(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+            logger.warning("Ignoring non-object JSON store at %s", self.path)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Could not read JSON store %s: %s", self.path, exc)
+        return {}
+
+    # ── Mapping API ──────────────────────────────────────────────────────
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any, flush: bool = True) -> None:
+        with self._lock:
+            self._data[key] = value
+            if flush:
+                self.flush()
+
+    def update(self, values: Dict[str, Any], flush: bool = True) -> None:
+        with self._lock:
+            self._data.update(values)
+            if flush:
+                self.flush()
+
+    def pop(self, key: str, default: Any = None, flush: bool = True) -> Any:
+        with self._lock:
+            value = self._data.pop(key, default)
+            if flush:
+                self.flush()
+            return value
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Return a snapshot of all entries."""
+        with self._lock:
+            return list(self._data.items())
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    # ── Persistence ──────────────────────────────────────────────────────
+
+    def flush(self) -> Optional[str]:
+        """Atomically write the store to disk. Returns the path or ``None``."""
+        with self._lock:
+            directory = os.path.dirname(self.path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=".tmp-", suffix=".json", dir=directory
+                )
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, ensure_ascii=False)
+                os.replace(tmp_path, self.path)
+                return self.path
+            except OSError as exc:
+                logger.warning("Could not write JSON store %s: %s", self.path, exc)
+                return None
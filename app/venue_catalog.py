@@ -0,0 +1,280 @@
+"""
+Venue catalog: venue → capacity / class lookup for the venue-type phase.
+
+Entries come from a seed file (``VENUE_CATALOG_FILE``, a JSON list of
+``{name, city, capacity, class, aliases}``) plus venues learned from scrape
+results (``.cache/venue_catalog.json``). Seed entries are indexed by a
+normalized venue name; learned ones by name, city and state, since names
+like "The Fillmore" or "House of Blues" cover several venues. An artist's
+venue type can then be computed from the venues Ticketmaster lists for
+them instead of asking OpenAI per artist.
+
+Classes, smallest to largest: Club, Theater, Amphitheater, Arena, Stadium.
+A class guessed from keywords in a venue name is only provisional: it is
+never stored, and the venue is still reported as unknown so it gets looked
+up (and learned) properly.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .config import settings
+from .storage import JsonStore, cache_path
+
+logger = logging.getLogger(__name__)
+
+LEARNED_CATALOG_FILE = "venue_catalog.json"
+
+VENUE_CLASSES = ["Club", "Theater", "Amphitheater", "Arena", "Stadium"]
+_CLASS_RANK = {cls: i for i, cls in enumerate(VENUE_CLASSES)}
+
+# Upper capacity bound per class when only a capacity is known.
+CAPACITY_BUCKETS: List[Tuple[int, str]] = [
+    (1500, "Club"),
+    (5000, "Theater"),
+    (20000, "Arena"),
+]
+
+# Name keywords, checked in order (so "Stadium Club" is a Stadium, "Arena
+# Theatre" an Arena). The generic "center" / "garden" come after the
+# theater words: "Kennedy Center Concert Hall" is a Theater.
+_NAME_KEYWORDS: List[Tuple[str, str]] = [
+    (r"\b(stadium|stadio|estadio|field|speedway|raceway)\b", "Stadium"),
+    (r"\b(arena|coliseum|colosseum|dome|fieldhouse)\b", "Arena"),
+    (r"\b(amphitheat(?:er|re)|pavilion|bowl|amphi)\b", "Amphitheater"),
+    (r"\b(theat(?:er|re)|teatro|hall|auditorium|opera|palladium|playhouse|music box)\b", "Theater"),
+    (r"\b(centre|center|garden)\b", "Arena"),
+    (r"\b(club|ballroom|lounge|bar|tavern|saloon|room|cafe|pub)\b", "Club"),
+]
+
+# Free-text answers (e.g. from OpenAI) mapped onto a class.
+_CLASS_SYNONYMS: List[Tuple[str, str]] = [
+    (r"stadium|estadio", "Stadium"),
+    (r"arena", "Arena"),
+    (r"amphithea|amphi|shed|outdoor pavilion", "Amphitheater"),
+    (r"theat|auditorium|concert hall|music hall|hall", "Theater"),
+    (r"club|ballroom|bar|lounge|small venue", "Club"),
+]
+
+
+def venue_key(name: str) -> str:
+    """Normalize a venue name: accents, punctuation and a leading "the" dropped."""
+    normalized = unicodedata.normalize("NFD", (name or "").strip().lower())
+    stripped = "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    stripped = stripped.replace("&", " and ")
+    stripped = re.sub(r"[^\w\s]", " ", stripped)
+    stripped = re.sub(r"\s+", " ", stripped).strip()
+    return re.sub(r"^the ", "", stripped)
+
+
+def place_key(name: str, city: str = "", state: str = "") -> str:
+    """Key of a learned entry: the venue key plus its normalized city / state."""
+    key = venue_key(name)
+    if not key or not (city or state):
+        return key
+    return "|".join((key, venue_key(city), venue_key(state)))
+
+
+def class_for_capacity(capacity: Optional[int]) -> Optional[str]:
+    if not capacity:
+        return None
+    for bound, cls in CAPACITY_BUCKETS:
+        if capacity <= bound:
+            return cls
+    return "Stadium"
+
+
+def class_from_name(name: str) -> Optional[str]:
+    """Guess a class from keywords in the venue name."""
+    key = venue_key(name)
+    for pattern, cls in _NAME_KEYWORDS:
+        if re.search(pattern, key):
+            return cls
+    return None
+
+
+def normalize_venue_class(text: Optional[str]) -> Optional[str]:
+    """Map a free-text venue type (``"large arenas"``) onto a class."""
+    if not text:
+        return None
+    lowered = text.lower()
+    for pattern, cls in _CLASS_SYNONYMS:
+        if re.search(pattern, lowered):
+            return cls
+    return None
+
+
+def parse_venue_answer(text: Optional[str]) -> Tuple[Optional[str], Optional[int]]:
+    """Parse an OpenAI ``"<class>|<capacity>"`` answer into ``(class, capacity)``."""
+    if not text:
+        return None, None
+    cls_text, _, cap_text = text.partition("|")
+    digits = re.sub(r"[^\d]", "", cap_text)
+    capacity = int(digits) if digits else None
+    return normalize_venue_class(cls_text) or class_for_capacity(capacity), capacity
+
+
+class VenueCatalog:
+    """Seed + learned venue entries indexed by normalized name."""
+
+    def __init__(self, seed_path: Optional[str], learned: JsonStore):
+        self._lock = threading.Lock()
+        self._seed: Dict[str, Dict] = {}
+        self._learned = learned
+        if seed_path:
+            self._load_seed(seed_path)
+
+    def _load_seed(self, path: str) -> None:
+        if not os.path.isfile(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Could not read venue catalog %s: %s", path, exc)
+            return
+        for entry in entries if isinstance(entries, list) else []:
+            name = entry.get("name")
+            if not name:
+                continue
+            for alias in [name] + list(entry.get("aliases") or []):
+                self._seed[venue_key(alias)] = entry
+        logger.info("Loaded %d venues from %s", len(entries), path)
+
+    def lookup(self, name: str, city: str = "", state: str = "") -> Optional[Dict]:
+        """Return the entry for *name* in *city* / *state*.
+
+        Seed entries are matched by name alone and win over learned ones.
+        """
+        key = venue_key(name)
+        if not key:
+            return None
+        return self._seed.get(key) or self._learned.get(place_key(name, city, state))
+
+    def classify(
+        self, name: str, city: str = "", state: str = ""
+    ) -> Tuple[Optional[str], Optional[int], bool]:
+        """Return ``(class, capacity, known)``.
+
+        *known* is True when the class comes from the catalog; otherwise the
+        class (if any) is a guess from the venue name.
+        """
+        entry = self.lookup(name, city, state)
+        # Older learned stores hold name guesses (``source="name"``); skip them.
+        if entry and entry.get("source") != "name":
+            cls = entry.get("class") or class_for_capacity(entry.get("capacity"))
+            if cls:
+                return cls, entry.get("capacity"), True
+        return class_from_name(name), None, False
+
+    def observe(self, venue: str, city: str = "", state: str = "") -> None:
+        """Record a scraped venue (name, place, times seen) without a class."""
+        key = venue_key(venue)
+        if not key or key in self._seed:
+            return
+        key = place_key(venue, city, state)
+        with self._lock:
+            entry = dict(self._learned.get(key) or {})
+            entry.setdefault("name", venue.strip())
+            entry.setdefault("city", city)
+            entry.setdefault("state", state)
+            if entry.get("source") == "name":
+                entry.pop("class", None)
+                entry.pop("source", None)
+            entry["seen"] = entry.get("seen", 0) + 1
+            entry["ts"] = time.time()
+            self._learned.set(key, entry, flush=False)
+
+    def learn(
+        self,
+        venue: str,
+        cls: Optional[str],
+        capacity: Optional[int],
+        source: str,
+        city: str = "",
+        state: str = "",
+    ) -> None:
+        """Store a class / capacity found for *venue* in *city* (e.g. by OpenAI)."""
+        key = venue_key(venue)
+        if not key or key in self._seed or not (cls or capacity):
+            return
+        key = place_key(venue, city, state)
+        with self._lock:
+            entry = dict(
+                self._learned.get(key) or {"name": venue.strip(), "city": city, "state": state}
+            )
+            entry.update({
+                "class": cls or class_for_capacity(capacity),
+                "capacity": capacity,
+                "source": source,
+                "ts": time.time(),
+            })
+            self._learned.set(key, entry, flush=False)
+
+    def flush(self) -> None:
+        self._learned.flush()
+
+
+_catalog: Optional[VenueCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_venue_catalog() -> VenueCatalog:
+    global _catalog
+    with _catalog_lock:
+        if _catalog is None:
+            _catalog = VenueCatalog(
+                settings.venue_catalog_file,
+                JsonStore(cache_path(LEARNED_CATALOG_FILE)),
+            )
+        return _catalog
+
+
+def venue_label(concert: Dict) -> str:
+    """Return ``"Venue, City, State"``, the form sent to OpenAI for unknown venues."""
+    return ", ".join(p for p in (concert.get("venue"), concert.get("city"), concert.get("state")) if p)
+
+
+def annotate_concerts(
+    concerts: Iterable[Dict],
+    catalog: Optional[VenueCatalog] = None,
+    observe: bool = True,
+) -> Dict[str, Tuple[str, str, str]]:
+    """Fill ``venue_capacity`` / ``venue_class`` and record each venue.
+
+    Returns ``{label: (venue, city, state)}`` for venues missing from the
+    catalog, including ones that only got a provisional class from their
+    name. Pass ``observe=False`` to re-apply the catalog to concerts that
+    were already recorded.
+    """
+    catalog = catalog or get_venue_catalog()
+    unknown: Dict[str, Tuple[str, str, str]] = {}
+    for concert in concerts:
+        venue = concert.get("venue") or ""
+        if not venue:
+            continue
+        city, state = concert.get("city") or "", concert.get("state") or ""
+        if observe:
+            catalog.observe(venue, city, state)
+        cls, capacity, known = catalog.classify(venue, city, state)
+        concert["venue_class"] = cls
+        if capacity:
+            concert["venue_capacity"] = capacity
+        if not known:
+            unknown[venue_label(concert)] = (venue, city, state)
+    return unknown
+
+
+def venue_type_for_concerts(concerts: Iterable[Dict]) -> Optional[str]:
+    """Return the most common venue class; ties go to the larger class."""
+    counts = Counter(c["venue_class"] for c in concerts if c.get("venue_class"))
+    if not counts:
+        return None
+    return max(counts, key=lambda cls: (counts[cls], _CLASS_RANK[cls]))
@@ -0,0 +1,122 @@
+"""
+Per-clip latency of CAPTCHA audio download + decode.
+
+Run from the repo root::
+
+    python -m benchmarks.bench_captcha_audio [--clips 20] [--seconds 6]
+
+Serves a generated MP3 clip (about the length of a reCAPTCHA audio
+challenge) from a local HTTP server and times the original temp-file path
+(download, mp3 → wav on disk, ``sr.AudioFile``) against
+:func:`_transcribe_audio` (pooled session, ffmpeg pipes). Speech
+recognition itself is network-bound and left out: both paths stop at the
+``sr.AudioData`` handed to the recognizer.
+"""
+
+import argparse
+import functools
+import http.server
+import os
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+
+import requests
+import speech_recognition as sr
+
+from app.scrapers import engagement
+
+
+def make_clip(directory: str, seconds: int) -> str:
+    path = os.path.join(directory, "clip.mp3")
+    subprocess.run(
+        [
+            engagement.FFMPEG, "-hide_banner", "-loglevel", "error", "-y",
+            "-f", "lavfi", "-i", f"sine=frequency=440:sample_rate=44100:duration={seconds}",
+            "-ac", "2", "-b:a", "128k", path,
+        ],
+        check=True,
+        timeout=60,
+    )
+    return path
+
+
+class _QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def serve(directory: str) -> str:
+    handler = functools.partial(_QuietHandler, directory=directory)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_address[1]}/clip.mp3"
+
+
+def original(audio_url: str) -> sr.AudioData:
+    """The temp-file pipeline ``_transcribe_audio`` used before, minus recognition."""
+    tmp = tempfile.mkdtemp()
+    mp3 = os.path.join(tmp, "audio.mp3")
+    wav = os.path.join(tmp, "audio.wav")
+    try:
+        with open(mp3, "wb") as f:
+            f.write(requests.get(audio_url, timeout=15).content)
+        subprocess.run(
+            [engagement.FFMPEG, "-y", "-i", mp3, "-ar", "16000", "-ac", "1", "-f", "wav", wav],
+            capture_output=True,
+            timeout=30,
+        )
+        recognizer = sr.Recognizer()
+        with sr.AudioFile(wav) as src:
+            return recognizer.record(src)
+    finally:
+        for p in (mp3, wav):
+            try:
+                os.remove(p)
+            except OSError:
+                pass
+        os.rmdir(tmp)
+
+
+def piped(audio_url: str) -> sr.AudioData:
+    """``_transcribe_audio`` with the recognizer swapped for a pass-through."""
+    captured = []
+    recognize = engagement._recognize
+    engagement._recognize = lambda audio, backend: captured.append(audio) or ""
+    try:
+        engagement._transcribe_audio(audio_url)
+    finally:
+        engagement._recognize = recognize
+    return captured[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clips", type=int, default=20)
+    parser.add_argument("--seconds", type=int, default=6)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        make_clip(directory, args.seconds)
+        url = serve(directory)
+        frames = {}
+        print(f"{args.clips} clips of {args.seconds}s MP3")
+        for name, fn in (("temp files", original), ("pipes", piped)):
+            frames[name] = len(fn(url).frame_data)  # warm-up
+            samples = []
+            for _ in range(args.clips):
+                started = time.perf_counter()
+                fn(url)
+                samples.append((time.perf_counter() - started) * 1000)
+            samples.sort()
+            print(
+                f"{name:<11} median {statistics.median(samples):7.1f} ms/clip   "
+                f"p95 {samples[int(len(samples) * 0.95) - 1]:7.1f} ms   "
+                f"{frames[name]} PCM bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Throughput / latency of the shared proxy relay against a stand-in upstream.
+
+Run from the repo root::
+
+    python -m benchmarks.bench_proxy_relay [--tunnels 32] [--mb 8] [--pings 200]
+
+A local "upstream proxy" checks the ``Proxy-Authorization`` header and
+tunnels CONNECT requests to a local target that streams ``--mb`` MiB per
+tunnel. The same load runs directly against the upstream (client sends
+the auth header itself) and through :func:`get_relay`, reporting
+aggregate MB/s, CONNECT latency percentiles and small-request round trips.
+"""
+
+import argparse
+import asyncio
+import base64
+import socket
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.scrapers.proxy_relay import get_relay, shutdown_relays
+
+USER, PASSWORD = "bench", "secret"
+AUTH = base64.b64encode(f"{USER}:{PASSWORD}".encode()).decode()
+
+
+def start_servers(payload: bytes):
+    """Start the target and the stand-in upstream on a background loop."""
+    loop = asyncio.new_event_loop()
+
+    async def target(reader, writer):
+        # b"B" = bulk download, b"P" = 1-byte ping/pong until EOF.
+        mode = await reader.readexactly(1)
+        if mode == b"B":
+            writer.write(payload)
+            await writer.drain()
+        else:
+            while await reader.read(1):
+                writer.write(b"p")
+                await writer.drain()
+        writer.close()
+
+    async def pipe(reader, writer):
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+        writer.close()
+
+    async def upstream(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        if f"Proxy-Authorization: Basic {AUTH}".encode() not in head:
+            writer.write(b"HTTP/1.1 407 Proxy Authentication Required\r\n\r\n")
+            await writer.drain()
+            writer.close()
+            return
+        host, port = head.split(b"\r\n")[0].split()[1].decode().rsplit(":", 1)
+        target_reader, target_writer = await asyncio.open_connection(host, int(port))
+        writer.write(b"HTTP/1.1 200 Connection established\r\n\r\n")
+        await writer.drain()
+        await asyncio.gather(
+            pipe(reader, target_writer), pipe(target_reader, writer), return_exceptions=True
+        )
+
+    async def start():
+        t = await asyncio.start_server(target, "127.0.0.1", 0)
+        u = await asyncio.start_server(upstream, "127.0.0.1", 0)
+        return t.sockets[0].getsockname()[1], u.sockets[0].getsockname()[1]
+
+    ports = loop.run_until_complete(start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return ports
+
+
+def open_tunnel(proxy_port: int, target_port: int, send_auth: bool):
+    sock = socket.create_connection(("127.0.0.1", proxy_port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    auth = f"Proxy-Authorization: Basic {AUTH}\r\n" if send_auth else ""
+    started = time.perf_counter()
+    sock.sendall(f"CONNECT 127.0.0.1:{target_port} HTTP/1.1\r\n{auth}\r\n".encode())
+    head = b""
+    while b"\r\n\r\n" not in head:
+        head += sock.recv(4096)
+    assert b" 200 " in head, head
+    return sock, time.perf_counter() - started
+
+
+def bulk(proxy_port, target_port, send_auth):
+    sock, latency = open_tunnel(proxy_port, target_port, send_auth)
+    sock.sendall(b"B")
+    received = 0
+    while data := sock.recv(1 << 16):
+        received += len(data)
+    sock.close()
+    return latency, received
+
+
+def pings(proxy_port, target_port, send_auth, count):
+    sock, _ = open_tunnel(proxy_port, target_port, send_auth)
+    sock.sendall(b"P")
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        sock.sendall(b".")
+        sock.recv(1)
+        samples.append(time.perf_counter() - started)
+    sock.close()
+    return samples
+
+
+def run(label, proxy_port, target_port, send_auth, args, expected):
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.tunnels) as pool:
+        results = list(pool.map(
+            lambda _: bulk(proxy_port, target_port, send_auth), range(args.tunnels)
+        ))
+    elapsed = time.perf_counter() - started
+    assert all(received == expected for _, received in results)
+    connects = sorted(latency * 1000 for latency, _ in results)
+    rtts = sorted(s * 1000 for s in pings(proxy_port, target_port, send_auth, args.pings))
+    print(
+        f"{label:<7} {sum(r for _, r in results) / elapsed / 1e6:8.1f} MB/s   "
+        f"CONNECT p50 {statistics.median(connects):6.2f} ms  p95 {connects[int(len(connects) * 0.95) - 1]:6.2f} ms   "
+        f"RTT p50 {statistics.median(rtts):5.3f} ms  p95 {rtts[int(len(rtts) * 0.95) - 1]:5.3f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tunnels", type=int, default=32)
+    parser.add_argument("--mb", type=int, default=8)
+    parser.add_argument("--pings", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = b"x" * (args.mb * 1024 * 1024)
+    target_port, upstream_port = start_servers(payload)
+    relay = get_relay("127.0.0.1", upstream_port, USER, PASSWORD)
+    print(f"{args.tunnels} concurrent tunnels x {args.mb} MiB, {args.pings} pings")
+    try:
+        run("direct", upstream_port, target_port, True, args, len(payload))
+        run("relay", relay.port, target_port, False, args, len(payload))
+    finally:
+        shutdown_relays()
+
+
+if __name__ == "__main__":
+    main()
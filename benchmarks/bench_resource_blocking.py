@@ -0,0 +1,82 @@
+"""
+Bytes and page-ready time with and without resource blocking.
+
+Run from the repo root on a host with Chrome::
+
+    python -m benchmarks.bench_resource_blocking [--loads 5] [--profile ticketmaster URL ...]
+
+For each scraper profile, loads its landing pages ``--loads`` times in a
+fresh headless Chrome with blocking off, then on, and reports the median
+:func:`page_load_stats` (bytes transferred, resource count,
+DOMContentLoaded and load event times). Bytes of cross-origin resources
+without ``Timing-Allow-Origin`` read as 0, so compare the two rows rather
+than trusting the absolute byte counts.
+"""
+
+import argparse
+import statistics
+from typing import Dict, List
+
+import undetected_chromedriver as uc
+
+from app.config import settings
+from app.scrapers.chrome import apply_resource_blocking, launch_chrome, page_load_stats
+
+DEFAULT_PAGES: Dict[str, List[str]] = {
+    "ticketmaster": ["https://www.ticketmaster.com/search?q=bruno+mars"],
+    "soundcharts": ["https://app.soundcharts.com/login"],
+    "engagement": [
+        "https://trendhero.io/engagement-rate-calculator-instagram/",
+        "https://thesocialcat.com/tools/instagram-engagement-rate-calculator",
+    ],
+}
+STAT_KEYS = ("transfer_bytes", "resources", "dom_content_loaded_ms", "load_ms")
+
+
+def measure(profile: str, urls: List[str], loads: int, blocked: bool) -> Dict[str, float]:
+    settings.resource_blocking_enabled = blocked
+    options = uc.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    driver = launch_chrome(options)
+    try:
+        if blocked and not apply_resource_blocking(driver, profile):
+            raise RuntimeError(f"Resource blocking could not be enabled for {profile}")
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        samples: Dict[str, List[float]] = {key: [] for key in STAT_KEYS}
+        for _ in range(loads):
+            for url in urls:
+                driver.get(url)
+                stats = page_load_stats(driver)
+                for key in STAT_KEYS:
+                    samples[key].append(float(stats.get(key) or 0))
+        return {key: statistics.median(values) for key, values in samples.items()}
+    finally:
+        driver.quit()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--loads", type=int, default=5)
+    parser.add_argument("--profile", choices=sorted(DEFAULT_PAGES), action="append")
+    parser.add_argument("urls", nargs="*", help="pages to load instead of the defaults")
+    args = parser.parse_args()
+
+    profiles = args.profile or sorted(DEFAULT_PAGES)
+    print(f"median of {args.loads} load(s) per page")
+    for profile in profiles:
+        urls = args.urls or DEFAULT_PAGES[profile]
+        for blocked in (False, True):
+            stats = measure(profile, urls, args.loads, blocked)
+            print(
+                f"{profile:<13} blocking {'on ' if blocked else 'off'}  "
+                f"{stats['transfer_bytes'] / 1024:9.0f} KiB  "
+                f"{stats['resources']:5.0f} resources  "
+                f"DCL {stats['dom_content_loaded_ms']:7.0f} ms  "
+                f"load {stats['load_ms']:7.0f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Time ``_result_to_row`` for a large job: per-row header matching vs a compiled plan.
+
+Run from the repo root::
+
+    python -m benchmarks.bench_sheet_rows [--rows 10000]
+
+The original ``_result_to_row`` (kept below as the baseline) dumped the
+model and matched every header against a fresh dict per row; the current
+code compiles the header row into a :class:`RowPlan` once. Rows are
+checked to be identical, except ``concerts_count``, which the original
+never filled (its canonical key did not survive header normalization).
+"""
+
+import argparse
+import time
+from typing import List
+
+from app import sheets
+from app.models import ArtistData, ConcertData
+
+HEADERS = [
+    "Artist Name", "Basic Location", "Genre", "Event Sheet", "Venue Type", "Link to Tour",
+    "Ticket Agent Tour Link", "GA Section", "Team Member", "Pre-Reports Completed",
+    "First Presale", "Gen Sale", "TikTok Listeners", "Spotify Listeners",
+    "Instagram Followers", "Bandsintown Followers", "30 Day Growth Percentage",
+    "IG Engagement Rate", "J", "J1", "J2", "Status", "Buy List", "Soundcharts Link",
+    "Unknown Column", "Concerts", "Removed Concerts",
+] + sheets.SHEET_COLUMNS
+
+
+def original_result_to_row(artist: ArtistData, headers: List[str], event_sheet_url: str = "") -> List[str]:
+    data = artist.model_dump()
+    concerts_count = len(data.get("concerts", []) or [])
+
+    # Flexible mapping for user-defined sheet headers.
+    header_value = {
+        "artistname": data.get("artist_name", ""),
+        "basiclocation": "",
+        "genre": data.get("genre", ""),
+        "eventsheet": event_sheet_url,
+        "venuetype": data.get("venue_type", ""),
+        "linktotour": data.get("tour_link", ""),
+        "ticketagenttourlink": data.get("tm_profile_url", ""),
+        "gasection": "",
+        "teammember": "",
+        "prereportscompleted": "",
+        "firstpresale": data.get("first_presale_date", ""),
+        "gensale": data.get("first_onsale_date", ""),
+        "tiktoklisteners": data.get("tiktok_followers", ""),
+        "spotifylisteners": data.get("spotify_followers", ""),
+        "instagramfollowers": data.get("instagram_followers", ""),
+        "bandsintownfollowers": data.get("bandsintown_followers", ""),
+        "30daygrowthpercentage": "",
+        "igengagementrate": data.get("ig_engagement_rate", ""),
+        "j": "",
+        "j1": "",
+        "j2": "",
+        "status": "Completed",
+        "buylist": "",
+        "soundchartslink": data.get("soundcharts_url", ""),
+        # Canonical API/table column names also supported.
+        "artist_name": data.get("artist_name", ""),
+        "tiktok_followers": data.get("tiktok_followers", ""),
+        "spotify_followers": data.get("spotify_followers", ""),
+        "instagram_followers": data.get("instagram_followers", ""),
+        "bandsintown_followers": data.get("bandsintown_followers", ""),
+        "ig_username": data.get("ig_username", ""),
+        "ig_engagement_rate": data.get("ig_engagement_rate", ""),
+        "tour_link": data.get("tour_link", ""),
+        "venue_type": data.get("venue_type", ""),
+        "soundcharts_url": data.get("soundcharts_url", ""),
+        "tm_profile_url": data.get("tm_profile_url", ""),
+        "first_presale_date": data.get("first_presale_date", ""),
+        "first_onsale_date": data.get("first_onsale_date", ""),
+        "concerts_count": str(concerts_count),
+    }
+
+    row: List[str] = []
+    for header in headers:
+        norm = sheets._normalize_header(header)
+        if norm in header_value:
+            row.append(str(header_value[norm] or ""))
+            continue
+
+        # Fallback: match normalized model keys.
+        value = ""
+        for key, raw in data.items():
+            if sheets._normalize_header(key) == norm:
+                value = raw
+                break
+        row.append(str(value or ""))
+
+    return row
+
+
+def make_results(rows: int) -> List[ArtistData]:
+    return [
+        ArtistData(
+            artist_name=f"Artist {i}", genre="Pop", ig_username=f"artist{i}",
+            ig_engagement_rate="1.2%", venue_type="Arena", tour_link="https://artist.example",
+            concerts=[ConcertData(venue="Madison Square Garden", date="Oct 26, 2026")] * 5,
+        )
+        for i in range(rows)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    results = make_results(args.rows)
+    url = "https://docs.google.com/spreadsheets/d/x/edit#gid=1"
+    skip = {i for i, h in enumerate(HEADERS) if sheets._normalize_header(h) == "concertscount"}
+
+    started = time.perf_counter()
+    before = [original_result_to_row(artist, HEADERS, url) for artist in results]
+    original_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    plan = sheets._compile_row_plan(tuple(HEADERS))
+    after = [sheets._plan_row(plan, artist, url) for artist in results]
+    planned_s = time.perf_counter() - started
+
+    for old, new in zip(before, after):
+        assert [v for i, v in enumerate(old) if i not in skip] == [
+            v for i, v in enumerate(new) if i not in skip
+        ], (old, new)
+    print(f"{args.rows} rows x {len(HEADERS)} columns")
+    print(f"original   {original_s:7.3f}s")
+    print(f"row plan   {planned_s:7.3f}s   x{original_s / planned_s:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+API calls and wall time of a sheet sync: per-artist calls vs batched writes.
+
+Run from the repo root::
+
+    python -m benchmarks.bench_sheets_batching [--artists 100] [--concerts 20] [--latency-ms 20]
+
+Both paths write the same job into a fresh :class:`FakeSpreadsheet` that
+sleeps ``--latency-ms`` per call: the original append, which built every
+artist's events worksheet with its own ``worksheets()`` / ``add_worksheet``
+/ ``update`` / ``merge_cells`` / ``columns_auto_resize`` calls, and the
+current :func:`append_results` / :func:`upsert_results`.
+"""
+
+import argparse
+import time
+from typing import List
+
+from app import sheets
+from app.models import ArtistData, ConcertData
+from benchmarks.fake_sheets import FakeSpreadsheet
+
+
+def _original_unique_ws_title(sheet, base_title: str) -> str:
+    existing = {ws.title for ws in sheet.worksheets()}
+    if base_title not in existing:
+        return base_title
+    for i in range(2, 200):
+        candidate = f"{base_title[:95]} {i}"
+        if candidate not in existing:
+            return candidate
+    return f"{base_title[:90]} {len(existing) + 1}"
+
+
+def _original_create_concerts_sheet(sheet, artist: ArtistData, job_tag: str = "") -> str:
+    concerts = artist.model_dump()["concerts"]
+    base = f"Events - {sheets._sanitize_ws_title(artist.artist_name)}"
+    if job_tag:
+        base = f"{base} - {job_tag[:8]}"
+    title = _original_unique_ws_title(sheet, sheets._sanitize_ws_title(base))
+    ws = sheet.add_worksheet(title=title, rows=max(30, len(concerts) + 3), cols=6)
+    ws.update("A1", [["TOUR DATES"]], value_input_option="RAW")
+    ws.merge_cells("A1:F1")
+    ws.update("A2:F2", [sheets.EVENT_SHEET_HEADERS], value_input_option="RAW")
+    if concerts:
+        rows = sheets._event_sheet_values(concerts)[2:]
+        ws.update(f"A3:F{2 + len(rows)}", rows, value_input_option="RAW")
+    ws.columns_auto_resize(0, 5)
+    return f"https://docs.google.com/spreadsheets/d/{sheets.settings.sheet_id}/edit#gid={ws.id}"
+
+
+def original_append(sheet: FakeSpreadsheet, results: List[ArtistData], job_id: str) -> int:
+    worksheet = sheet.worksheet("Sheet1")
+    headers = sheets._ensure_header(worksheet)
+    rows = [
+        sheets._result_to_row(a, headers, _original_create_concerts_sheet(sheet, a, job_id))
+        for a in results
+    ]
+    worksheet.append_rows(rows, value_input_option="RAW")
+    return len(rows)
+
+
+def make_results(artists: int, concerts: int) -> List[ArtistData]:
+    return [
+        ArtistData(
+            artist_name=f"Artist {i}",
+            genre="Pop",
+            concerts=[
+                ConcertData(date="Oct 26, 2026", day="Mon", venue="Madison Square Garden",
+                            venue_capacity=19500, event_url=f"https://www.ticketmaster.com/event/{i}-{j}")
+                for j in range(concerts)
+            ],
+        )
+        for i in range(artists)
+    ]
+
+
+def report(label: str, sheet: FakeSpreadsheet, elapsed: float) -> None:
+    print(f"{label:<22} {sheet.total_calls:6d} calls  {elapsed:7.2f}s  "
+          f"{len(sheet.worksheets_by_id) - 1:4d} event sheets")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--artists", type=int, default=100)
+    parser.add_argument("--concerts", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=20)
+    args = parser.parse_args()
+
+    sheets.settings.sheet_id = "benchmark"
+    sheets.settings.worksheet_name = "Sheet1"
+    results = make_results(args.artists, args.concerts)
+    latency = args.latency_ms / 1000
+    print(f"{args.artists} artists x {args.concerts} concerts, {args.latency_ms:g} ms per call")
+
+    sheet = FakeSpreadsheet(latency)
+    started = time.perf_counter()
+    original_append(sheet, results, "abcdef12")
+    report("original append", sheet, time.perf_counter() - started)
+
+    sheet = FakeSpreadsheet(latency)
+    sheets._get_handles = lambda: (sheet, sheet.primary)
+    started = time.perf_counter()
+    sheets.append_results(results, job_id="abcdef12")
+    report("batched append", sheet, time.perf_counter() - started)
+
+    sheet = FakeSpreadsheet(latency)
+    sheets.upsert_results(results)
+    sheet.reset_calls()
+    started = time.perf_counter()
+    sheets.upsert_results(results)
+    report("batched upsert (resync)", sheet, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Time the gated Ticketmaster block parser against the original one.
+
+Run from the repo root::
+
+    python -m benchmarks.bench_ticketmaster_parser [--rounds 200]
+
+Both parsers go over the fixture corpus (``tests/fixtures/
+ticketmaster_event_blocks.json``) block by block and as one page; the
+script fails if their output differs.
+"""
+
+import argparse
+import time
+
+from app.scrapers.ticketmaster import _parse_event_text, _parse_full_page
+from tests.test_ticketmaster_parser import (
+    _reference_parse_event_text,
+    _reference_parse_full_page,
+    load_blocks,
+)
+
+
+def _time(fn, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    blocks = load_blocks()
+    pages = {}
+    for block in blocks:
+        pages.setdefault(block["artist"], []).append(block["text"])
+    pages = {artist: "\n".join(texts) for artist, texts in pages.items()}
+
+    for block in blocks:
+        assert _parse_event_text(block["text"], block["artist"]) == _reference_parse_event_text(
+            block["text"], block["artist"]
+        ), block["text"]
+    for artist, page in pages.items():
+        assert _parse_full_page(page, artist) == _reference_parse_full_page(page, artist)
+
+    cases = [
+        ("blocks", _reference_parse_event_text, _parse_event_text,
+         lambda parse: [parse(b["text"], b["artist"]) for b in blocks]),
+        ("pages", _reference_parse_full_page, _parse_full_page,
+         lambda parse: [parse(page, artist) for artist, page in pages.items()]),
+    ]
+    print(f"{len(blocks)} blocks, {len(pages)} pages, {args.rounds} rounds")
+    for name, old, new, run in cases:
+        old_s = _time(lambda: run(old), args.rounds)
+        new_s = _time(lambda: run(new), args.rounds)
+        print(f"{name:<7} original {old_s:7.3f}s   gated {new_s:7.3f}s   x{old_s / new_s:.2f}")
+
+
+if __name__ == "__main__":
+    main()
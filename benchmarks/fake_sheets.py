@@ -0,0 +1,110 @@
+"""
+In-memory stand-in for the gspread spreadsheet / worksheet objects.
+
+Implements just the calls :mod:`app.sheets` makes (old and new code
+paths), counts them, and sleeps ``latency`` seconds per call to mimic a
+round trip to the Sheets API.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+
+class FakeWorksheet:
+    def __init__(self, sheet: "FakeSpreadsheet", title: str, sheet_id: int, rows: int = 1000):
+        self.sheet = sheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.rows: List[List[str]] = []
+
+    # Primary worksheet
+    def row_values(self, row: int) -> List[str]:
+        self.sheet.call("row_values")
+        return list(self.rows[row - 1]) if len(self.rows) >= row else []
+
+    def col_values(self, col: int) -> List[str]:
+        self.sheet.call("col_values")
+        return [r[col - 1] if len(r) >= col else "" for r in self.rows]
+
+    def append_row(self, row: List[str], **kwargs) -> None:
+        self.sheet.call("append_row")
+        self.rows.append(list(row))
+
+    def append_rows(self, rows: List[List[str]], **kwargs) -> None:
+        self.sheet.call("append_rows")
+        self.rows.extend(list(r) for r in rows)
+
+    def batch_update(self, data: List[Dict], **kwargs) -> None:
+        self.sheet.call("worksheet.batch_update")
+        for item in data:
+            row = int(item["range"].split(":")[0].lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+            self.rows[row - 1] = list(item["values"][0])
+
+    # Per-artist calls of the original events-sheet code
+    def update(self, *args, **kwargs) -> None:
+        self.sheet.call("update")
+
+    def merge_cells(self, *args, **kwargs) -> None:
+        self.sheet.call("merge_cells")
+
+    def columns_auto_resize(self, *args, **kwargs) -> None:
+        self.sheet.call("columns_auto_resize")
+
+
+class FakeSpreadsheet:
+    def __init__(self, latency: float = 0.0, worksheet_name: str = "Sheet1"):
+        self.latency = latency
+        self.calls: Dict[str, int] = {}
+        self.worksheets_by_id: List[FakeWorksheet] = [FakeWorksheet(self, worksheet_name, 0)]
+
+    def call(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    @property
+    def total_calls(self) -> int:
+        return sum(self.calls.values())
+
+    def reset_calls(self) -> None:
+        self.calls = {}
+
+    def _add(self, title: str, rows: int = 1000) -> FakeWorksheet:
+        ws = FakeWorksheet(self, title, len(self.worksheets_by_id), rows)
+        self.worksheets_by_id.append(ws)
+        return ws
+
+    def worksheets(self) -> List[FakeWorksheet]:
+        self.call("worksheets")
+        return list(self.worksheets_by_id)
+
+    def worksheet(self, title: str) -> FakeWorksheet:
+        self.call("worksheet")
+        return next(ws for ws in self.worksheets_by_id if ws.title == title)
+
+    def add_worksheet(self, title: str, rows: int, cols: int) -> FakeWorksheet:
+        self.call("add_worksheet")
+        return self._add(title, rows)
+
+    def batch_update(self, body: Dict) -> Dict:
+        self.call("batch_update")
+        replies = []
+        for request in body["requests"]:
+            if "addSheet" in request:
+                props = request["addSheet"]["properties"]
+                ws = self._add(props["title"], props["gridProperties"]["rowCount"])
+                replies.append({"addSheet": {"properties": {"sheetId": ws.id}}})
+            else:
+                replies.append({})
+        return {"replies": replies}
+
+    def values_batch_update(self, body: Dict) -> None:
+        self.call("values_batch_update")
+
+    def values_batch_clear(self, body: Optional[Dict] = None) -> None:
+        self.call("values_batch_clear")
+
+    @property
+    def primary(self) -> FakeWorksheet:
+        return self.worksheets_by_id[0]
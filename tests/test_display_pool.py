@@ -0,0 +1,52 @@
+import pytest
+
+from app.scrapers.display_pool import DisplayPool
+
+
+class FakeXvfb:
+    def __init__(self):
+        self.returncode = None
+
+    def poll(self):
+        return self.returncode
+
+    def terminate(self):
+        self.returncode = 0
+
+    def wait(self, timeout=None):
+        return self.returncode
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = DisplayPool(size=1, base_display=7100)
+    pool.broken = set()
+    monkeypatch.setattr(
+        pool, "_spawn", lambda num: None if num in pool.broken else FakeXvfb()
+    )
+    return pool
+
+
+def test_dead_display_is_replaced_not_recycled(pool):
+    assert pool.acquire() == ":7100"
+    pool.release(":7100")
+
+    pool._procs[7100].returncode = 1
+    pool.broken.add(7100)
+    assert pool.acquire() == ":7101"
+    assert set(pool._procs) == {7101}
+
+    pool.release(":7101")
+    assert pool.acquire(timeout=0) == ":7101"
+
+
+def test_unrecoverable_display_leaves_pool_empty(pool):
+    pool.acquire()
+    pool.release(":7100")
+    pool._procs[7100].returncode = 1
+    pool.broken.update(range(7100, 7200))
+
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+    assert pool._procs == {}
+    assert pool._free.empty()
@@ -0,0 +1,102 @@
+import csv
+import io
+import json
+import sys
+
+import pytest
+from fastapi import HTTPException
+
+from app import main
+from app.exports import EXPORT_CHUNK_ROWS, iter_records, stream_csv, stream_export, stream_ndjson
+from app.jobs import Job
+from app.models import ArtistData, ConcertData, ExportFormat, ExportTable, JobStatus
+
+
+def make_results(count):
+    return [
+        ArtistData(
+            artist_name=f"Artist {i}",
+            genre="Pop",
+            concerts=[
+                ConcertData(venue="Madison Square Garden", city="New York", venue_capacity=19500),
+                ConcertData(venue="Zyx Event Space", added=True),
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def as_text(record):
+    return {key: "" if value is None else str(value) for key, value in record.items()}
+
+
+@pytest.mark.parametrize("table", list(ExportTable))
+def test_csv_round_trip(table):
+    results = make_results(3)
+    rows = list(csv.DictReader(io.StringIO(b"".join(stream_csv(results, table)).decode("utf-8"))))
+    assert rows == [as_text(record) for record in iter_records(results, table)]
+    assert len(rows) == (3 if table == ExportTable.ARTISTS else 6)
+
+
+@pytest.mark.parametrize("table", list(ExportTable))
+def test_ndjson_round_trip(table):
+    results = make_results(3)
+    body = b"".join(stream_ndjson(results, table)).decode("utf-8")
+    records = [json.loads(line) for line in body.splitlines()]
+    assert records == list(iter_records(results, table))
+
+
+def test_chunks_break_every_500_rows():
+    results = make_results(EXPORT_CHUNK_ROWS * 2 + 1)
+
+    chunks = list(stream_ndjson(results, ExportTable.ARTISTS))
+    assert [chunk.count(b"\n") for chunk in chunks] == [EXPORT_CHUNK_ROWS, EXPORT_CHUNK_ROWS, 1]
+
+    chunks = list(stream_csv(results, ExportTable.ARTISTS))
+    # The header line travels with the first chunk.
+    assert [chunk.count(b"\r\n") for chunk in chunks] == [EXPORT_CHUNK_ROWS + 1, EXPORT_CHUNK_ROWS, 1]
+
+
+@pytest.mark.parametrize("table", list(ExportTable))
+def test_parquet_round_trip(table):
+    pq = pytest.importorskip("pyarrow.parquet")
+    results = make_results(EXPORT_CHUNK_ROWS + 1)
+    chunks = list(stream_export(results, table, ExportFormat.PARQUET))
+    assert all(chunks)
+    rows = pq.read_table(io.BytesIO(b"".join(chunks))).to_pylist()
+    assert rows == list(iter_records(results, table))
+
+
+@pytest.fixture
+def job(monkeypatch):
+    job = Job("job1", ["Artist 0"], {}, False, False, False, False, False)
+    job.status = JobStatus.COMPLETED
+    job.result = make_results(2)
+    monkeypatch.setattr(main.job_manager, "get", lambda job_id: job if job_id == "job1" else None)
+    return job
+
+
+def test_export_missing_job_is_404(job):
+    with pytest.raises(HTTPException) as exc:
+        main.export_job("nope")
+    assert exc.value.status_code == 404
+
+
+def test_export_running_job_is_409(job):
+    job.status = JobStatus.RUNNING
+    with pytest.raises(HTTPException) as exc:
+        main.export_job("job1")
+    assert exc.value.status_code == 409
+
+
+def test_parquet_export_without_pyarrow_is_501(job, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(HTTPException) as exc:
+        main.export_job("job1", format=ExportFormat.PARQUET)
+    assert exc.value.status_code == 501
+
+
+def test_export_response_headers(job):
+    response = main.export_job("job1", format=ExportFormat.NDJSON, table=ExportTable.CONCERTS)
+    assert response.media_type == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="job1-concerts.ndjson"'
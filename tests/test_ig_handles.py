@@ -0,0 +1,16 @@
+from app import ig_handles
+from app.scrapers import engagement
+
+
+def test_legacy_table_keeps_original_keys():
+    assert engagement.IG_USERNAMES["beyoncé"] == "beyonce"
+    assert engagement.IG_USERNAMES["beyonce"] == "beyonce"
+    for key, handle in ig_handles.SEED_HANDLES.items():
+        assert engagement.IG_USERNAMES[key] == handle
+
+
+def test_get_ig_username_is_accent_insensitive(tmp_path, monkeypatch):
+    monkeypatch.setattr(ig_handles, "_store", ig_handles.JsonStore(str(tmp_path / "ig.json")))
+    assert engagement.get_ig_username("Beyoncé") == "beyonce"
+    assert engagement.get_ig_username("  Ed   Sheeran ") == "teddysphotos"
+    assert engagement.get_ig_username("Rosalía") == "rosalia"
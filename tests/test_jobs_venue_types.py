@@ -0,0 +1,41 @@
+from app.config import settings
+from app.jobs import Job, JobManager
+from app.scrapers import openai_tools
+from app.storage import JsonStore
+from app.venue_catalog import VenueCatalog
+
+
+def test_venue_phase_batch_heartbeat_touches_job(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "redis_url", "")
+    monkeypatch.setattr(settings, "openai_api_key", "key")
+    monkeypatch.setattr(settings, "venue_openai_lookup", True)
+    monkeypatch.setattr(settings, "openai_batch_threshold", 1)
+    catalog = VenueCatalog(None, JsonStore(str(tmp_path / "learned.json")))
+    monkeypatch.setattr("app.venue_catalog.get_venue_catalog", lambda: catalog)
+
+    def fake_prefetch(requests, api_key, transport=None, heartbeat=None):
+        heartbeat("in_progress")
+        heartbeat("completed")
+        return {"venue_class": {label: "Arena|18000" for label in requests["venue_class"]}}
+
+    monkeypatch.setattr(openai_tools, "prefetch_batch", fake_prefetch)
+    monkeypatch.setattr(
+        openai_tools, "get_venue_classes",
+        lambda labels, api_key, prefetched=None: {label: prefetched[label] for label in labels},
+    )
+
+    manager = JobManager()
+    job = Job("job1", ["X"], {}, False, False, False, True, True)
+    touched = []
+    monkeypatch.setattr(manager, "_touch", lambda j: touched.append(j.job_id))
+    collected = [{
+        "artist_name": "X",
+        "venue_type": None,
+        "concerts": [{"venue": "Zyx Event Space", "city": "Austin", "state": "TX"}],
+    }]
+    manager._run_venue_types(job, collected, {})
+
+    assert touched == ["job1", "job1"]
+    assert collected[0]["venue_type"] == "Arena"
+    assert collected[0]["concerts"][0]["venue_capacity"] == 18000
+    assert catalog.lookup("Zyx Event Space", "Austin", "TX")["seen"] == 1
@@ -0,0 +1,108 @@
+import json
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from app.scrapers.openai_batch import BatchTransport, batch_lookup, run_batch
+
+
+def output_line(cid: str, text: Optional[str], status_code: int = 200) -> str:
+    body = {"output": [{"type": "message", "content": [{"type": "output_text", "text": text}]}]}
+    return json.dumps({"custom_id": cid, "response": {"status_code": status_code, "body": body}})
+
+
+class FakeTransport(BatchTransport):
+    """Walks through *statuses*, then serves *output* for the output file."""
+
+    def __init__(self, statuses: List[str], output: Optional[List[str]] = None):
+        self.statuses = list(statuses)
+        self.output = output
+        self.submitted: List[Dict] = []
+        self.cancelled: List[str] = []
+
+    def submit(self, jsonl: bytes) -> str:
+        self.submitted = [json.loads(line) for line in jsonl.decode().splitlines()]
+        return "batch_1"
+
+    def status(self, batch_id: str) -> Tuple[str, Optional[str]]:
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        return status, ("file_1" if self.output is not None and status == "completed" else None)
+
+    def download(self, file_id: str) -> str:
+        return "\n".join(self.output or [])
+
+    def cancel(self, batch_id: str) -> None:
+        self.cancelled.append(batch_id)
+
+
+PROMPTS = {"tour_link:0": "a", "tour_link:1": "b", "venue_type:0": "c"}
+
+
+def run(transport, **kwargs):
+    beats = []
+    results = run_batch(
+        PROMPTS, transport, model="gpt-test", poll_seconds=0,
+        sleep=lambda _: None, heartbeat=beats.append, **kwargs,
+    )
+    return results, beats
+
+
+def test_batch_transport_is_abstract():
+    with pytest.raises(TypeError):
+        BatchTransport()
+
+
+def test_completed_batch_maps_answers_and_beats_every_poll():
+    transport = FakeTransport(
+        ["validating", "in_progress", "finalizing", "completed"],
+        [output_line(cid, f"answer {cid}") for cid in PROMPTS],
+    )
+    results, beats = run(transport)
+    assert results == {cid: f"answer {cid}" for cid in PROMPTS}
+    assert beats == ["validating", "in_progress", "finalizing", "completed"]
+    assert [row["custom_id"] for row in transport.submitted] == list(PROMPTS)
+    assert transport.submitted[0]["body"]["model"] == "gpt-test"
+
+
+def test_failed_batch_returns_nothing():
+    results, beats = run(FakeTransport(["in_progress", "failed"]))
+    assert results == dict.fromkeys(PROMPTS)
+    assert beats == ["in_progress", "failed"]
+
+
+def test_timeout_cancels_batch(monkeypatch):
+    clock = iter(range(0, 10_000, 10))
+    monkeypatch.setattr("app.scrapers.openai_batch.time.monotonic", lambda: next(clock))
+    transport = FakeTransport(["in_progress"])
+    results, beats = run(transport, max_wait_seconds=35)
+    assert results == dict.fromkeys(PROMPTS)
+    assert transport.cancelled == ["batch_1"]
+    assert beats and set(beats) == {"in_progress"}
+
+
+def test_partial_output_leaves_missing_and_failed_requests_empty():
+    transport = FakeTransport(["completed"], [
+        output_line("tour_link:0", "https://a.example"),
+        output_line("tour_link:1", "rate limited", status_code=429),
+        "not json",
+        "",
+    ])
+    results, _ = run(transport)
+    assert results == {"tour_link:0": "https://a.example", "tour_link:1": None, "venue_type:0": None}
+
+
+def test_batch_lookup_maps_back_to_kinds_and_artists():
+    transport = FakeTransport(["completed"], [
+        output_line("tour_link:0", "https://x.example"),
+        output_line("venue_type:0", "Arena"),
+    ])
+    beats = []
+    out = batch_lookup(
+        {"tour_link": [("X", "p1"), ("Y", "p2")], "venue_type": [("X", "p3")]},
+        "key", transport=transport, heartbeat=beats.append,
+    )
+    assert out == {
+        "tour_link": {"X": "https://x.example", "Y": None},
+        "venue_type": {"X": "Arena"},
+    }
+    assert beats == ["completed"]
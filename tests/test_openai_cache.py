@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+
+from app.config import settings
+from app.scrapers import openai_tools
+from app.storage import JsonStore
+
+
+class RecordingStore(JsonStore):
+    def __init__(self, path):
+        super().__init__(path)
+        self.flush_threads = []
+
+    def flush(self):
+        self.flush_threads.append(threading.current_thread().name)
+        return super().flush()
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    store = RecordingStore(str(tmp_path / "openai_cache.json"))
+    monkeypatch.setattr(openai_tools, "_cache", store)
+
+    async def fake_query(api_key, prompt):
+        return f"answer:{prompt}"
+
+    monkeypatch.setattr(openai_tools, "_aquery_openai", fake_query)
+    return store
+
+
+def test_lookup_many_flushes_once_off_the_loop(cache):
+    names = [f"artist {i}" for i in range(20)]
+    raw = openai_tools._lookup_many("tour_link", names, "key", lambda n: n)
+    assert raw == {n: f"answer:{n}" for n in names}
+    assert cache.flush_threads == [threading.current_thread().name]
+    assert len(cache) == 20
+
+
+def test_flush_evicts_oldest_entries(cache, monkeypatch):
+    monkeypatch.setattr(settings, "openai_cache_max_entries", 5)
+    names = [f"artist {i}" for i in range(8)]
+    openai_tools._lookup_many("tour_link", names, "key", lambda n: n)
+    assert len(cache) == 5
+    assert len(JsonStore(cache.path)) == 5
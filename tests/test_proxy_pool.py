@@ -0,0 +1,56 @@
+import time
+
+from app.scrapers.proxy_pool import (
+    PROXY_FAILURE_COOLDOWN_MINUTES,
+    PROXY_MAX_FAILURE_STREAK,
+    PROXY_STALE_DAYS,
+    ProxyPool,
+)
+from app.storage import JsonStore
+
+
+def make_pool(tmp_path, entries):
+    store = JsonStore(str(tmp_path / "proxy_pool.json"))
+    store.update(entries)
+    return ProxyPool(store)
+
+
+def test_select_candidates_skips_recent_failures(tmp_path):
+    now = time.time()
+    pool = make_pool(tmp_path, {
+        "1.1.1.1:80": {"successes": 5, "last_ok": True, "last_checked": now, "latency_ms": 900},
+        "2.2.2.2:80": {"successes": 9, "last_ok": True, "last_checked": now, "latency_ms": 100},
+        "3.3.3.3:80": {"failures": 4, "last_ok": False, "last_checked": now},
+        "4.4.4.4:80": {
+            "failures": 1, "last_ok": False,
+            "last_checked": now - (PROXY_FAILURE_COOLDOWN_MINUTES + 1) * 60,
+        },
+    })
+    addrs = ["1.1.1.1:80", "2.2.2.2:80", "3.3.3.3:80", "4.4.4.4:80", "5.5.5.5:80"]
+    picked = pool._select_candidates(addrs, max_tests=10)
+    assert picked[:2] == ["2.2.2.2:80", "1.1.1.1:80"]
+    assert "3.3.3.3:80" not in picked
+    assert set(picked[2:]) == {"4.4.4.4:80", "5.5.5.5:80"}
+    assert pool._select_candidates(addrs, max_tests=1) == ["2.2.2.2:80"]
+
+
+def test_prune_drops_failing_and_stale_entries(tmp_path):
+    now = time.time()
+    pool = make_pool(tmp_path, {
+        "1.1.1.1:80": {"last_ok": True, "last_checked": now},
+        "2.2.2.2:80": {"last_ok": True, "last_checked": now - (PROXY_STALE_DAYS + 1) * 86400},
+        "3.3.3.3:80": {"last_ok": False, "last_checked": now},
+    })
+    for _ in range(PROXY_MAX_FAILURE_STREAK - 1):
+        pool.record("3.3.3.3:80", None, flush=False)
+    assert pool.prune() == 2
+    assert set(pool.snapshot()) == {"1.1.1.1:80"}
+
+
+def test_success_resets_failure_streak(tmp_path):
+    pool = make_pool(tmp_path, {})
+    pool.record("1.1.1.1:80", None)
+    pool.record("1.1.1.1:80", None)
+    pool.record("1.1.1.1:80", 0.2)
+    assert pool.snapshot()["1.1.1.1:80"]["failure_streak"] == 0
+    assert pool.prune() == 0
@@ -0,0 +1,66 @@
+import asyncio
+import base64
+
+import pytest
+
+from app.scrapers import proxy_relay
+from app.scrapers.proxy_relay import ProxyRelay
+
+AUTH = base64.b64encode(b"user:secret").decode()
+
+
+async def start_upstream(chunks: int, interval: float):
+    """Stand-in upstream: answers CONNECT, then sends *chunks* 1 KiB chunks."""
+
+    async def handle(reader, writer):
+        head = await reader.readuntil(b"\r\n\r\n")
+        assert f"Proxy-Authorization: Basic {AUTH}".encode() in head
+        writer.write(b"HTTP/1.1 200 Connection established\r\n\r\n")
+        await writer.drain()
+        for _ in range(chunks):
+            await asyncio.sleep(interval)
+            writer.write(b"x" * 1024)
+            await writer.drain()
+        if chunks:
+            writer.close()
+        else:
+            await asyncio.sleep(60)
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def download(chunks: int, interval: float) -> tuple:
+    server, port = await start_upstream(chunks, interval)
+    relay = ProxyRelay("127.0.0.1", port, "user", "secret")
+    await relay.start()
+    loop = asyncio.get_running_loop()
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", relay.port)
+        writer.write(b"CONNECT example.com:443 HTTP/1.1\r\nHost: example.com:443\r\n\r\n")
+        await writer.drain()
+        assert b" 200 " in await reader.readuntil(b"\r\n\r\n")
+        started = loop.time()
+        body = await asyncio.wait_for(reader.read(), 10)
+        writer.close()
+        return len(body), loop.time() - started
+    finally:
+        await relay.close()
+        server.close()
+
+
+@pytest.fixture
+def short_idle_timeout(monkeypatch):
+    monkeypatch.setattr(proxy_relay, "RELAY_IDLE_TIMEOUT_SECONDS", 0.3)
+
+
+def test_long_download_with_silent_client_is_not_cut(short_idle_timeout):
+    received, elapsed = asyncio.run(download(chunks=10, interval=0.1))
+    assert received == 10 * 1024
+    assert elapsed >= 0.9
+
+
+def test_idle_connection_is_closed(short_idle_timeout):
+    received, elapsed = asyncio.run(download(chunks=0, interval=0))
+    assert received == 0
+    assert 0.25 <= elapsed < 2
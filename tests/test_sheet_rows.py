@@ -0,0 +1,21 @@
+from app import sheets
+from app.models import ArtistData, ConcertData
+from benchmarks.bench_sheet_rows import HEADERS, original_result_to_row
+
+
+def test_rows_match_the_original_row_builder():
+    artist = ArtistData(
+        artist_name="Artist", genre="Pop", venue_type="Arena",
+        concerts=[ConcertData(venue="Madison Square Garden", city="New York", date="Oct 26, 2026")],
+        removed_concerts=[ConcertData(venue="TD Garden", added=False, removed=True)],
+    )
+    url = "https://docs.google.com/spreadsheets/d/x/edit#gid=1"
+    old = original_result_to_row(artist, HEADERS, url)
+    new = sheets._result_to_row(artist, HEADERS, url)
+
+    # The original never filled concerts_count (see the benchmark).
+    for i, header in enumerate(HEADERS):
+        if sheets._normalize_header(header) != "concertscount":
+            assert new[i] == old[i], header
+    concerts = HEADERS.index("Concerts")
+    assert new[concerts] == str([artist.concerts[0].model_dump()])
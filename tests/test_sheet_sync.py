@@ -0,0 +1,143 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from app import sheets
+from app.config import settings
+from app.jobs import Job, JobManager
+from app.models import ArtistData, SheetSyncState, SheetSyncStatus
+from app.sheet_sync import SheetSyncQueue
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture(autouse=True)
+def fast_settings(monkeypatch):
+    monkeypatch.setattr(settings, "sheet_sync_min_interval_seconds", 0)
+    monkeypatch.setattr(settings, "sheet_sync_batch_size", 10)
+
+
+def make_queue(upsert):
+    return SheetSyncQueue(on_update=lambda job_id: None, upsert=upsert, sleep=lambda s: None)
+
+
+def artists(*names):
+    return [ArtistData(artist_name=name) for name in names]
+
+
+def test_finished_job_is_evicted_once_drained():
+    written = []
+    queue = make_queue(lambda batch: written.extend(a.artist_name for a in batch))
+    status = SheetSyncStatus()
+
+    queue.submit("job", status, artists("A", "B"))
+    assert wait_for(lambda: status.state == SheetSyncState.SYNCED)
+    assert "job" in queue._jobs
+
+    queue.finish("job")
+    assert "job" not in queue._jobs
+    assert written == ["A", "B"]
+    assert status.rows_synced == 2
+
+
+def test_finish_waits_for_the_batch_in_flight():
+    release = threading.Event()
+    started = threading.Event()
+
+    def upsert(batch):
+        started.set()
+        release.wait(2)
+
+    queue = make_queue(upsert)
+    status = SheetSyncStatus()
+    queue.submit("job", status, artists("A"))
+    assert started.wait(2)
+
+    queue.finish("job")
+    assert "job" in queue._jobs
+
+    release.set()
+    assert wait_for(lambda: "job" not in queue._jobs)
+    assert status.state == SheetSyncState.SYNCED
+
+
+def test_backoff_does_not_block_other_jobs(monkeypatch):
+    monkeypatch.setattr(settings, "sheet_sync_backoff_seconds", 60)
+    monkeypatch.setattr(settings, "sheet_sync_max_retries", 3)
+    written = []
+
+    def upsert(batch):
+        if batch[0].artist_name == "Flaky":
+            raise requests.ConnectionError("reset")
+        written.extend(a.artist_name for a in batch)
+
+    queue = make_queue(upsert)
+    flaky, healthy = SheetSyncStatus(), SheetSyncStatus()
+    queue.submit("flaky", flaky, artists("Flaky"))
+    assert wait_for(lambda: flaky.state == SheetSyncState.RETRYING)
+
+    queue.submit("healthy", healthy, artists("A"))
+    assert wait_for(lambda: healthy.state == SheetSyncState.SYNCED)
+    assert written == ["A"]
+    assert flaky.state == SheetSyncState.RETRYING and flaky.attempts == 1
+
+
+def test_manual_and_background_writes_share_the_sheet_lock(monkeypatch):
+    monkeypatch.setattr(settings, "sheet_id", "sheet")
+    active, overlaps = [], []
+
+    def fake_with_handles(operation, retry_on_auth_error=False):
+        active.append(1)
+        overlaps.append(len(active))
+        time.sleep(0.05)
+        active.pop()
+        return 0, 1
+
+    monkeypatch.setattr(sheets, "_with_handles", fake_with_handles)
+    queue = make_queue(sheets.upsert_results)
+    status = SheetSyncStatus()
+    queue.submit("job", status, artists("A"))
+    manual = [
+        threading.Thread(target=sheets.upsert_results, args=(artists("A"),)),
+        threading.Thread(target=sheets.append_results, args=(artists("A"),)),
+    ]
+    for thread in manual:
+        thread.start()
+    for thread in manual:
+        thread.join()
+    assert wait_for(lambda: status.state == SheetSyncState.SYNCED)
+    assert len(overlaps) == 3 and max(overlaps) == 1
+
+
+def test_forget_drops_state():
+    queue = make_queue(lambda batch: None)
+    queue.submit("job", SheetSyncStatus(), artists("A"))
+    queue.forget("job")
+    assert "job" not in queue._jobs
+
+
+def test_only_changed_artists_are_resubmitted(monkeypatch):
+    monkeypatch.setattr(settings, "redis_url", "")
+    manager = JobManager()
+    job = Job("job", ["A", "B"], {}, False, False, False, False, False, auto_sync_sheet=True)
+    submitted = []
+    manager._sheet_sync_queue = make_queue(lambda batch: None)
+    monkeypatch.setattr(
+        manager._sheet_sync_queue, "submit",
+        lambda job_id, status, batch: submitted.append([a.artist_name for a in batch]),
+    )
+    entries = [{"artist_name": "A"}, {"artist_name": "B"}]
+    manager._sync_sheet(job, entries)
+    manager._sync_sheet(job, entries)
+    entries[1]["website"] = "https://b.example"
+    manager._sync_sheet(job, entries)
+    assert submitted == [["A", "B"], ["B"]]
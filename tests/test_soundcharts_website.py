@@ -0,0 +1,31 @@
+from app.scrapers.soundcharts import SoundchartsScraper
+
+
+class FakeDriver:
+    def __init__(self, links):
+        self.links = links
+
+    def execute_script(self, script):
+        return self.links
+
+
+def website(links):
+    scraper = SoundchartsScraper.__new__(SoundchartsScraper)
+    scraper.driver = FakeDriver(links)
+    return scraper.extract_website_link()
+
+
+def test_labelled_link_is_used():
+    assert website([
+        {"href": "https://open.spotify.com/artist/1", "label": "Spotify"},
+        {"href": "https://merch.example.com", "label": "Shop"},
+        {"href": "https://artist.example.com", "label": "Official website"},
+    ]) == "https://artist.example.com"
+
+
+def test_unlabelled_external_links_are_ignored():
+    assert website([
+        {"href": "https://instagram.com/artist", "label": "Instagram"},
+        {"href": "https://label-records.example.com/artist", "label": ""},
+        {"href": "https://news.example.com/review", "label": "Read more"},
+    ]) is None
@@ -0,0 +1,86 @@
+import pytest
+
+from app.scrapers import ticketmaster
+from app.storage import JsonStore
+
+
+class FakeButton:
+    def click(self):
+        pass
+
+
+class FakeDriver:
+    """Answers the 'More Events' lookup with a button *buttons* times."""
+
+    def __init__(self, buttons: int, fail_on: int = -1):
+        self.buttons = buttons
+        self.fail_on = fail_on
+        self.lookups = 0
+
+    def execute_script(self, script, *args):
+        if "querySelectorAll('button')" not in script:
+            return None
+        self.lookups += 1
+        if self.lookups == self.fail_on:
+            raise RuntimeError("renderer crashed")
+        return FakeButton() if self.lookups <= self.buttons else None
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(ticketmaster.time, "sleep", lambda _: None)
+
+
+def test_load_more_complete_only_when_button_is_gone():
+    assert ticketmaster._click_load_more(FakeDriver(buttons=3)) is True
+    assert ticketmaster._click_load_more(FakeDriver(buttons=3, fail_on=2)) is False
+    assert ticketmaster._click_load_more(FakeDriver(buttons=10), max_clicks=5) is False
+    assert ticketmaster._click_load_more(FakeDriver(buttons=3), stop_when=lambda: True) is False
+
+
+def concert(url, city="Austin"):
+    return {k: "" for k in ticketmaster._CONCERT_KEYS} | {
+        "artist_name": "Artist", "date": "MAY 1", "city": city,
+        "onsale_date": "05/01/2026", "event_url": url,
+    }
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = JsonStore(str(tmp_path / "tm_events.json"))
+    monkeypatch.setattr(ticketmaster, "_get_event_store", lambda: store)
+    known = {
+        url: {"text_hash": "h", "concert": concert(url)}
+        for url in ("https://tm/event/1", "https://tm/event/2")
+    }
+    store.set("USA:artist", {"events": known, "full_refreshed_at": 0})
+    return store
+
+
+def refresh(monkeypatch, concerts, complete):
+    hashes = {c["event_url"]: "h" for c in concerts}
+    monkeypatch.setattr(
+        ticketmaster, "_collect_concerts",
+        lambda *a, **kw: (concerts, complete, hashes),
+    )
+    return ticketmaster._refresh_concerts(None, "Artist", "USA")
+
+
+def test_complete_listing_reports_removals(store, monkeypatch):
+    current, removed = refresh(monkeypatch, [concert("https://tm/event/1")], complete=True)
+    assert [c["event_url"] for c in removed] == ["https://tm/event/2"]
+    assert len(current) == 1
+    assert store.get("USA:artist")["full_refreshed_at"] > 0
+
+
+@pytest.mark.parametrize("concerts, complete", [
+    ([concert("https://tm/event/1")], False),  # partial load
+    ([], True),                                 # empty scrape
+])
+def test_partial_or_empty_scrape_keeps_stored_events(store, monkeypatch, concerts, complete):
+    current, removed = refresh(monkeypatch, concerts, complete)
+    assert removed == []
+    assert {c["event_url"] for c in current} == {"https://tm/event/1", "https://tm/event/2"}
+    entry = store.get("USA:artist")
+    assert set(entry["events"]) == {"https://tm/event/1", "https://tm/event/2"}
+    assert entry["full_refreshed_at"] == 0
@@ -0,0 +1,75 @@
+import pytest
+
+from app.storage import JsonStore
+from app.venue_catalog import VenueCatalog, annotate_concerts, class_from_name, place_key
+
+
+@pytest.mark.parametrize("name, cls", [
+    ("Kennedy Center Concert Hall", "Theater"),
+    ("Center Stage Theater", "Theater"),
+    ("Garden Amphitheatre", "Amphitheater"),
+    ("Madison Square Garden", "Arena"),
+    ("TD Garden", "Arena"),
+    ("Arena Theatre", "Arena"),
+    ("Stadium Club", "Stadium"),
+    ("Bowery Ballroom", "Club"),
+    ("Zyx Event Space", None),
+])
+def test_class_from_name(name, cls):
+    assert class_from_name(name) == cls
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    return VenueCatalog(None, JsonStore(str(tmp_path / "learned.json")))
+
+
+def test_name_guesses_are_provisional_and_not_stored(catalog):
+    concerts = [{"venue": "Kennedy Center Concert Hall", "city": "Washington", "state": "DC"}]
+    unknown = annotate_concerts(concerts, catalog)
+    assert concerts[0]["venue_class"] == "Theater"
+    assert unknown == {
+        "Kennedy Center Concert Hall, Washington, DC": ("Kennedy Center Concert Hall", "Washington", "DC"),
+    }
+    stored = catalog.lookup("Kennedy Center Concert Hall", "Washington", "DC")
+    assert stored["seen"] == 1 and "class" not in stored
+
+    catalog.learn(
+        "Kennedy Center Concert Hall", "Theater", 2465, source="openai", city="Washington", state="DC"
+    )
+    concerts = [{"venue": "Kennedy Center Concert Hall", "city": "Washington", "state": "DC"}]
+    assert annotate_concerts(concerts, catalog) == {}
+    assert concerts[0]["venue_capacity"] == 2465
+
+
+def test_legacy_name_guesses_are_ignored(catalog):
+    catalog._learned.set("center stage", {"name": "Center Stage", "class": "Arena", "source": "name"})
+    assert catalog.classify("Center Stage") == ("Arena", None, False)
+    catalog.observe("Center Stage")
+    assert "class" not in catalog.lookup("Center Stage")
+
+
+def test_learned_venues_are_keyed_by_city(catalog):
+    catalog.learn("The Fillmore", "Theater", 1150, source="openai", city="San Francisco", state="CA")
+    catalog.learn("The Fillmore", "Theater", 2500, source="openai", city="Detroit", state="MI")
+    assert catalog.classify("The Fillmore", "San Francisco", "CA") == ("Theater", 1150, True)
+    assert catalog.classify("Fillmore", "Detroit", "MI") == ("Theater", 2500, True)
+    assert catalog.classify("The Fillmore", "Philadelphia", "PA")[2] is False
+
+
+def test_seed_entries_match_any_city(tmp_path):
+    seed = tmp_path / "seed.json"
+    seed.write_text('[{"name": "Madison Square Garden", "capacity": 19500, "class": "Arena"}]')
+    catalog = VenueCatalog(str(seed), JsonStore(str(tmp_path / "learned.json")))
+    assert catalog.classify("Madison Square Garden", "New York", "NY") == ("Arena", 19500, True)
+    catalog.observe("Madison Square Garden", "New York", "NY")
+    assert catalog._learned.get(place_key("Madison Square Garden", "New York", "NY")) is None
+
+
+def test_reannotating_without_observe_keeps_seen_counts(catalog):
+    concerts = [{"venue": "Zyx Event Space", "city": "Austin", "state": "TX"}]
+    annotate_concerts(concerts, catalog)
+    catalog.learn("Zyx Event Space", "Club", 800, source="openai", city="Austin", state="TX")
+    assert annotate_concerts(concerts, catalog, observe=False) == {}
+    assert concerts[0]["venue_class"] == "Club"
+    assert catalog.lookup("Zyx Event Space", "Austin", "TX")["seen"] == 1